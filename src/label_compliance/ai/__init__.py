@@ -1,5 +1,5 @@
 """AI subpackage — local (Ollama) and API (OpenAI) providers."""
 
-from label_compliance.ai.base import AIProvider, get_ai_provider
+from label_compliance.ai.base import AIProvider, AIUnavailableError, get_ai_provider
 
-__all__ = ["AIProvider", "get_ai_provider"]
+__all__ = ["AIProvider", "AIUnavailableError", "get_ai_provider"]
@@ -1,6 +1,6 @@
 """
-"""API Provider (OpenAI-compatible)
-======================
+API Provider (OpenAI-compatible)
+==================================
 Uses any OpenAI-compatible API for multimodal compliance analysis.
 Supports OpenAI, xAI/Grok, NVIDIA NIM, Together, Groq, Azure, etc.
 Requires API key set in the env var configured by settings.yaml → ai.api_key_env_var.
@@ -48,6 +48,7 @@ class OpenAIProvider(AIProvider):
         self._model = os.getenv("OPENAI_MODEL", settings.ai.ingestion_model)
         self._temperature = settings.ai.temperature
         self._max_tokens = settings.ai.max_tokens
+        self._timeout = settings.ai.request_timeout or None
         self._client = None
         self._total_tokens = 0
         self._total_calls = 0
@@ -55,7 +56,8 @@ class OpenAIProvider(AIProvider):
     def _get_client(self):
         if self._client is None:
             from label_compliance.config import get_ai_client
-            self._client = get_ai_client()
+            # Retries and backoff are ResilientProvider's job (ai/resilience.py)
+            self._client = get_ai_client().with_options(max_retries=0, timeout=self._timeout)
             logger.info("API client initialized — model=%s", self._model)
         return self._client
 
@@ -94,8 +96,8 @@ class OpenAIProvider(AIProvider):
             return content
 
         except Exception as e:
-            logger.error("OpenAI call failed: %s", e)
-            return f'{{"error": "{e}"}}'
+            logger.debug("OpenAI call failed: %s", e)
+            raise
 
     def analyze_with_image(self, prompt: str, image_path: str) -> str:
         """Send a prompt with an image to GPT-4o (multimodal).
@@ -153,13 +155,18 @@ class OpenAIProvider(AIProvider):
             return content
 
         except Exception as e:
-            logger.error("OpenAI multimodal call failed: %s", e)
-            return f'{{"error": "{e}"}}'
+            logger.debug("OpenAI multimodal call failed: %s", e)
+            raise
 
     @property
     def name(self) -> str:
         return f"openai/{self._model}"
 
-    @property
-    def name(self) -> str:
-        return f"openai/{self._model}"
+    def cache_params(self) -> dict:
+        return {
+            "model": self._model,
+            "base_url": get_settings().ai.api_base_url,
+            "temperature": self._temperature,
+            "max_tokens": self._max_tokens,
+            "system": _SYSTEM_PROMPT,
+        }
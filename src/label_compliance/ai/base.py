@@ -15,6 +15,10 @@ from label_compliance.utils.log import get_logger
 logger = get_logger(__name__)
 
 
+class AIUnavailableError(RuntimeError):
+    """The AI provider could not answer (after retries, or circuit open)."""
+
+
 class AIProvider(ABC):
     """Abstract AI provider for compliance reasoning."""
 
@@ -34,6 +38,10 @@ class AIProvider(ABC):
         """Provider name for logging."""
         ...
 
+    def cache_params(self) -> dict:
+        """Model settings that change the answers (part of AI cache keys)."""
+        return {}
+
 
 class NoOpProvider(AIProvider):
     """Dummy provider when AI is disabled."""
@@ -49,7 +57,7 @@ class NoOpProvider(AIProvider):
         return "none"
 
 
-def get_ai_provider() -> AIProvider:
+def get_ai_provider(cache: str | None = None) -> AIProvider:
     """
     Factory: return the configured AI provider.
 
@@ -57,18 +65,32 @@ def get_ai_provider() -> AIProvider:
       AI_PROVIDER=local    → Ollama (free)
       AI_PROVIDER=openai   → OpenAI API
       AI_PROVIDER=none     → disabled
+
+    Real providers are wrapped in retries, rate limiting and the circuit
+    breaker (``ai/resilience.py``), and in the response cache
+    (``ai/cache.py``) unless *cache* (default: ``ai.cache``) is ``"off"``.
     """
     settings = get_settings()
     provider_name = settings.ai.provider.lower()
 
+    provider: AIProvider
     if provider_name == "local":
         from label_compliance.ai.local import OllamaProvider
-        return OllamaProvider()
+        provider = OllamaProvider()
     elif provider_name == "openai":
         from label_compliance.ai.api import OpenAIProvider
-        return OpenAIProvider()
+        provider = OpenAIProvider()
     elif provider_name == "none":
         return NoOpProvider()
     else:
         logger.warning("Unknown AI provider '%s', using NoOp", provider_name)
         return NoOpProvider()
+
+    from label_compliance.ai.resilience import ResilientProvider
+    provider = ResilientProvider(provider)
+
+    mode = (cache or settings.ai.cache).lower()
+    if mode != "off":
+        from label_compliance.ai.cache import CachedProvider
+        provider = CachedProvider(provider, mode=mode)
+    return provider
@@ -0,0 +1,285 @@
+"""
+AI Response Cache
+==================
+Persistent cache of AI provider responses.
+
+Re-checking a label after a code or rule tweak sent every prompt to the
+model again — the same label, rules, model and temperature, so mostly
+byte-identical text and vision requests paid for twice.
+``CachedProvider`` wraps any ``AIProvider`` and stores its responses in
+SQLite under ``<cache_dir>/ai_responses.sqlite``, keyed by a hash of:
+
+    - the provider name and its ``cache_params()`` (model, temperature,
+      max tokens, system prompt, …),
+    - the call kind (text / image) and its keyword arguments,
+    - the prompt,
+    - the image *content* (not its path).
+
+Only responses that parse as JSON and are not error payloads are
+stored.  Entries expire after ``ai.cache_ttl_days`` and the cache is
+size-bounded (``ai.cache_mb``, least recently used evicted first).
+
+Modes (``ai.cache`` or ``--ai-cache``):
+
+    off       — no cache
+    read      — serve hits, never write (e.g. a shared, curated cache):
+                the database is opened read-only and hits leave
+                ``last_used`` and expired entries alone
+    readwrite — serve hits and store new responses
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from label_compliance.ai.base import AIProvider
+from label_compliance.config import AI_CACHE_MODES, get_settings
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+AI_CACHE_FILENAME = "ai_responses.sqlite"
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key       TEXT PRIMARY KEY,
+    response  TEXT NOT NULL,
+    nbytes    INTEGER NOT NULL,
+    created   REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+"""
+
+
+def _cacheable(response: str) -> bool:
+    """JSON and not a provider error payload (``{"error": ...}``)."""
+    try:
+        parsed = json.loads(response)
+    except (TypeError, ValueError):
+        return False
+    return not (isinstance(parsed, dict) and "error" in parsed)
+
+
+class AIResponseCache:
+    """SQLite-backed request-hash → response store with TTL and LRU size eviction."""
+
+    def __init__(self, path: Path | None = None, max_mb: int | None = None,
+                 ttl_days: float | None = None, read_only: bool = False):
+        settings = get_settings()
+        if path is None:
+            path = settings.paths.cache_dir / AI_CACHE_FILENAME
+        self.path = Path(path)
+        max_mb = settings.ai.cache_mb if max_mb is None else max_mb
+        ttl_days = settings.ai.cache_ttl_days if ttl_days is None else ttl_days
+        self.max_bytes = max_mb * 1024 * 1024
+        self.ttl = ttl_days * 86400 if ttl_days > 0 else None
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # Never share a connection across fork() — worker processes reopen.
+        # AI calls run on executor threads: one connection, guarded by _lock
+        if self.read_only and (self._conn is None or self._pid != os.getpid()):
+            # No PRAGMA/schema writes: the file may be a shared, read-only cache
+            conn = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro", uri=True,
+                timeout=30, check_same_thread=False,
+            )
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.close()
+                raise sqlite3.DatabaseError(
+                    f"schema version {version}, expected {_SCHEMA_VERSION}"
+                )
+            self._conn, self._pid = conn, os.getpid()
+        elif self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS responses")
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+    @staticmethod
+    def make_key(provider: AIProvider, kind: str, prompt: str,
+                 image_path: str | None = None, **kwargs) -> str:
+        h = hashlib.blake2b(digest_size=20)
+        cache_params = getattr(provider, "cache_params", dict)()  # duck-typed providers too
+        params = {"provider": provider.name, **cache_params, **kwargs}
+        h.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+        h.update(f"|{kind}|".encode())
+        h.update(prompt.encode("utf-8"))
+        if image_path is not None:
+            h.update(b"|image|")
+            h.update(hashlib.blake2b(Path(image_path).read_bytes(), digest_size=20).digest())
+        return h.hexdigest()
+
+    def get(self, key: str, write: bool = True) -> str | None:
+        """Cached response for *key*, or ``None``.
+
+        Unless *write* is false (or the cache is read-only), a hit
+        refreshes ``last_used`` and an expired entry is deleted.
+        """
+        with self._lock:
+            return self._get(key, write and not self.read_only)
+
+    def _get(self, key: str, write: bool) -> str | None:
+        if self.read_only and not self.path.exists():
+            self.misses += 1
+            return None
+        try:
+            row = self.conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,),
+            ).fetchone()
+            now = time.time()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                if write:
+                    with self.conn:
+                        self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is not None and write:
+                with self.conn:
+                    self.conn.execute(
+                        "UPDATE responses SET last_used = ? WHERE key = ?", (now, key),
+                    )
+        except sqlite3.Error as e:
+            logger.warning("AI cache read failed (%s) — calling the model", e)
+            return None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        if self.read_only:
+            return
+        with self._lock:
+            self._put(key, response)
+
+    def _put(self, key: str, response: str) -> None:
+        now = time.time()
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, response, len(response.encode("utf-8")), now, now),
+                )
+            self._evict()
+        except sqlite3.Error as e:
+            logger.warning("AI cache write failed: %s", e)
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones until the cache fits."""
+        if self.ttl is not None:
+            with self.conn:
+                self.conn.execute(
+                    "DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,),
+                )
+        total = self.conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)  # leave headroom so we don't evict on every put
+        freed = 0
+        victims = []
+        rows = self.conn.execute("SELECT key, nbytes FROM responses ORDER BY last_used")
+        for key, nbytes in rows:
+            if total - freed <= target:
+                break
+            victims.append((key,))
+            freed += nbytes
+        with self.conn:
+            self.conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        logger.debug("AI cache: evicted %d responses (%.1f MB)", len(victims), freed / 1e6)
+
+    def stats(self) -> dict:
+        entries, nbytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM responses",
+        ).fetchone()
+        return {"entries": entries, "bytes": nbytes, "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM responses")
+
+
+class CachedProvider(AIProvider):
+    """``AIProvider`` decorator that answers repeated requests from the cache."""
+
+    def __init__(self, provider: AIProvider, mode: str = "readwrite",
+                 cache: AIResponseCache | None = None):
+        if mode not in AI_CACHE_MODES:
+            raise ValueError(f"Unknown AI cache mode {mode!r} (expected one of {AI_CACHE_MODES})")
+        self.provider = provider
+        self.mode = mode
+        if cache is None:
+            cache = get_ai_response_cache(read_only=mode == "read")
+        self.cache = cache
+
+    def _cached(self, kind: str, call, prompt: str, image_path: str | None, **kwargs) -> str:
+        if self.mode == "off":
+            return call()
+        try:
+            key = self.cache.make_key(self.provider, kind, prompt, image_path, **kwargs)
+        except OSError as e:  # unreadable image — let the provider report it
+            logger.debug("AI cache: no key (%s)", e)
+            return call()
+        response = self.cache.get(key, write=self.mode == "readwrite")
+        if response is not None:
+            logger.debug("AI cache hit (%s)", kind)
+            return response
+        response = call()
+        if self.mode == "readwrite" and _cacheable(response):
+            self.cache.put(key, response)
+        return response
+
+    def analyze(self, prompt: str, **kwargs) -> str:
+        return self._cached(
+            "text", lambda: self.provider.analyze(prompt, **kwargs), prompt, None, **kwargs,
+        )
+
+    def analyze_with_image(self, prompt: str, image_path: str, **kwargs) -> str:
+        return self._cached(
+            "image", lambda: self.provider.analyze_with_image(prompt, image_path, **kwargs),
+            prompt, image_path, **kwargs,
+        )
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    def cache_params(self) -> dict:
+        return getattr(self.provider, "cache_params", dict)()
+
+
+_caches: dict[bool, AIResponseCache] = {}
+
+
+def get_ai_response_cache(read_only: bool = False) -> AIResponseCache:
+    """Process-wide response cache (a separate read-only handle for ``read`` mode)."""
+    if read_only not in _caches:
+        _caches[read_only] = AIResponseCache(read_only=read_only)
+    return _caches[read_only]
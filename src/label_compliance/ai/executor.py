@@ -0,0 +1,177 @@
+"""
+AI Executor
+============
+Concurrent execution of AI provider calls under a shared rate limit.
+
+AI verification sent its rule batches one after another, section after
+section, although with an API provider nearly all of that time is
+network wait.  ``AIExecutor`` runs the calls on a thread pool of
+``ai.max_concurrency`` workers and owns the token-bucket
+``RateLimiter`` every provider attempt takes its share from (see
+``ResilientProvider`` in ``resilience.py``):
+
+    - ``ai.requests_per_minute`` — one unit per call,
+    - ``ai.tokens_per_minute``   — an estimate of the call's prompt plus
+      its ``max_tokens`` completion budget (the amount OpenAI-style
+      limits reserve up front).
+
+A limit of 0 means unlimited.  Both the pool and the limiter are
+process-wide (``get_ai_executor``), so the budget covers every call of
+every section of a label — and every label of a thread-based caller.
+The AI redliner (``redline/ai_redliner.py``) runs its per-panel Pass 1
+calls on the same pool and budget.
+Responses served by the cache (``cache.py``) never reach the limiter.
+Callers submit work and read the futures back in submission order, so
+results stay ordered and deterministic regardless of completion order.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+from label_compliance.config import get_settings
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Rough characters per token for English prompts
+_CHARS_PER_TOKEN = 4
+# Token charge for one high-detail label image
+IMAGE_TOKENS = 1100
+
+
+def estimate_tokens(prompt: str, image: bool = False, completion_tokens: int | None = None) -> int:
+    """Tokens a call reserves: prompt estimate + completion budget (+ image).
+
+    The completion budget defaults to ``ai.max_tokens``; callers with
+    their own limit (the redline passes) pass it as *completion_tokens*.
+    """
+    if completion_tokens is None:
+        completion_tokens = get_settings().ai.max_tokens
+    tokens = len(prompt) // _CHARS_PER_TOKEN + completion_tokens
+    return tokens + IMAGE_TOKENS if image else tokens
+
+
+class RateLimiter:
+    """Token buckets for requests and tokens per minute.
+
+    Each bucket holds up to one minute of budget and refills
+    continuously.  ``acquire`` blocks until both buckets can cover the
+    call, then takes from both at once.  A call larger than a whole
+    bucket waits for a full bucket instead of blocking forever.
+    """
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0  # total seconds callers spent blocked
+
+    @property
+    def enabled(self) -> bool:
+        return self.rpm > 0 or self.tpm > 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._stamp
+        self._stamp = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def _delay(self, tokens: int) -> float:
+        """Seconds until the buckets cover the call (0 = now)."""
+        delay = 0.0
+        if self.rpm and self._requests < 1:
+            delay = max(delay, (1 - self._requests) * 60 / self.rpm)
+        if self.tpm:
+            need = min(tokens, self.tpm)
+            if self._tokens < need:
+                delay = max(delay, (need - self._tokens) * 60 / self.tpm)
+        return delay
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until the call may go; returns the seconds waited."""
+        if not self.enabled:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                delay = self._delay(tokens)
+                if delay <= 0:
+                    if self.rpm:
+                        self._requests -= 1
+                    if self.tpm:
+                        self._tokens -= min(tokens, self.tpm)
+                    self.waited += waited
+                    if waited:
+                        logger.debug("AI rate limit: waited %.1fs", waited)
+                    return waited
+            time.sleep(delay)
+            waited += delay
+
+
+class AIExecutor:
+    """Thread pool for AI calls, rate-limited by a shared ``RateLimiter``."""
+
+    def __init__(self, max_concurrency: int = 4, limiter: RateLimiter | None = None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limiter = limiter or RateLimiter()
+        self._pool: ThreadPoolExecutor | None = None
+        self._pid = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        # Threads don't survive fork() — worker processes start their own pool
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="ai",
+                )
+                self._pid = os.getpid()
+            return self._pool
+
+    def submit(self, fn: Callable[..., T], *args) -> Future[T]:
+        """Run *fn* on the pool (inline when ``max_concurrency`` is 1)."""
+        if self.max_concurrency == 1:
+            # Sequential: run inline, keep the old call order exactly
+            future: Future[T] = Future()
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+        return self.pool.submit(fn, *args)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+_executor: AIExecutor | None = None
+
+
+def get_ai_executor() -> AIExecutor:
+    """Process-wide executor built from the ``ai`` settings."""
+    global _executor
+    if _executor is None:
+        ai = get_settings().ai
+        _executor = AIExecutor(
+            max_concurrency=ai.max_concurrency,
+            limiter=RateLimiter(ai.requests_per_minute, ai.tokens_per_minute),
+        )
+    return _executor
@@ -41,13 +41,14 @@ class OllamaProvider(AIProvider):
         self._text_model = getattr(settings.ai, "text_model", None) or "llama3.2"
         self._temperature = settings.ai.temperature
         self._max_tokens = settings.ai.max_tokens
+        self._timeout = settings.ai.request_timeout or None
         self._client = None
 
     def _get_client(self):
         if self._client is None:
             try:
                 import ollama
-                self._client = ollama.Client()
+                self._client = ollama.Client(timeout=self._timeout)
                 logger.info(
                     "Ollama connected — vision=%s, text=%s",
                     self._vision_model, self._text_model,
@@ -112,8 +113,8 @@ class OllamaProvider(AIProvider):
             return content
 
         except Exception as e:
-            logger.error("Ollama inference failed: %s", e)
-            return f'{{"error": "{e}"}}'
+            logger.debug("Ollama inference failed: %s", e)
+            raise
 
     def analyze_with_image(self, prompt: str, image_path: str, force_json: bool = True) -> str:
         """Send a prompt with an image to the vision model with JSON format enforcement.
@@ -152,9 +153,18 @@ class OllamaProvider(AIProvider):
             return content
 
         except Exception as e:
-            logger.error("Ollama multimodal failed: %s", e)
-            return f'{{"error": "{e}"}}'
+            logger.debug("Ollama multimodal failed: %s", e)
+            raise
 
     @property
     def name(self) -> str:
         return f"ollama/{self._vision_model}+{self._text_model}"
+
+    def cache_params(self) -> dict:
+        return {
+            "vision_model": self._vision_model,
+            "text_model": self._text_model,
+            "temperature": self._temperature,
+            "max_tokens": self._max_tokens,
+            "system": _SYSTEM_PROMPT,
+        }
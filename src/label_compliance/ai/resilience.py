@@ -0,0 +1,223 @@
+"""
+AI Resilience
+==============
+Retries, backoff and a circuit breaker around AI provider calls.
+
+Providers used to swallow every error and return ``{"error": ...}``,
+which the matcher scored as ``FAIL`` — one transient 429 or timeout
+spoiled a whole batch, and during an outage every label waited out
+every failing call.  ``ResilientProvider`` wraps a provider (which now
+raises) and:
+
+    - retries transient errors (timeouts, connection errors, HTTP 408,
+      409, 429 and 5xx) up to ``ai.max_retries`` times with full-jitter
+      exponential backoff (``ai.backoff_base`` … ``ai.backoff_max``),
+      honouring a ``Retry-After`` header when the server sends one — a
+      server asking for more than ``ai.backoff_max`` counts as a failed
+      call instead of stalling the worker,
+    - takes its share of the shared rate limit (``ai/executor.py``)
+      per attempt, so retries are budgeted like first calls,
+    - reports to a process-wide ``CircuitBreaker``: after
+      ``ai.breaker_threshold`` consecutive failed calls it opens and
+      every call fails fast for ``ai.breaker_cooldown`` seconds, then a
+      single trial call decides whether it closes again.
+
+Calls that still fail raise ``AIUnavailableError``; the checker then
+reports the label as checked without AI (rule-based results only)
+instead of recording compliance failures.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import random
+import threading
+import time
+
+from label_compliance.ai.base import AIProvider, AIUnavailableError
+from label_compliance.ai.executor import RateLimiter, estimate_tokens, get_ai_executor
+from label_compliance.config import get_settings
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+_RETRYABLE_STATUS = {408, 409, 429}
+
+
+def _status_code(error: Exception) -> int | None:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Transient: timeouts, dropped connections, 408/409/429 and 5xx."""
+    status = _status_code(error)
+    if status is not None:
+        return status in _RETRYABLE_STATUS or status >= 500
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    # SDK exception names (openai.APITimeoutError, httpx.ConnectError, …)
+    name = type(error).__name__
+    return "Timeout" in name or "Connect" in name
+
+
+def retry_after(error: Exception) -> float | None:
+    """Seconds the server asked us to wait (``Retry-After[-Ms]``), if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:  # HTTP date
+            when = email.utils.parsedate_to_datetime(value).timestamp()
+            return max(0.0, when - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker: closed → open → half-open → closed."""
+
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.last_error = ""
+        self._opened_at: float | None = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Open and still cooling down (calls fail fast)."""
+        with self._lock:
+            opened_at = self._opened_at
+            return opened_at is not None and time.monotonic() - opened_at < self.cooldown
+
+    def allow(self) -> bool:
+        """Whether a new call may start (one trial call once cooled down)."""
+        if self.threshold <= 0:
+            return True
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.cooldown or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("AI circuit closed — provider is answering again")
+            self.failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self, error: str) -> None:
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            if self.threshold <= 0:
+                return
+            if self._trial or (self._opened_at is None and self.failures >= self.threshold):
+                self._opened_at = time.monotonic()
+                self._trial = False
+                logger.error(
+                    "AI circuit open after %d failures (%s) — failing fast for %.0fs",
+                    self.failures, error, self.cooldown,
+                )
+
+
+class ResilientProvider(AIProvider):
+    """``AIProvider`` decorator adding retries, rate limiting and the breaker."""
+
+    def __init__(
+        self,
+        provider: AIProvider,
+        breaker: CircuitBreaker | None = None,
+        limiter: RateLimiter | None = None,
+        max_retries: int | None = None,
+        backoff_base: float | None = None,
+        backoff_max: float | None = None,
+    ):
+        ai = get_settings().ai
+        self.provider = provider
+        self.breaker = breaker if breaker is not None else get_circuit_breaker()
+        self.limiter = limiter if limiter is not None else get_ai_executor().limiter
+        self.max_retries = ai.max_retries if max_retries is None else max_retries
+        self.backoff_base = ai.backoff_base if backoff_base is None else backoff_base
+        self.backoff_max = ai.backoff_max if backoff_max is None else backoff_max
+
+    def _delay(self, attempt: int, error: Exception) -> float:
+        server = retry_after(error)
+        if server is not None:
+            return server
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _call(self, call, tokens: int) -> str:
+        if not self.breaker.allow():
+            raise AIUnavailableError(f"circuit open ({self.breaker.last_error})")
+        attempt = 0
+        while True:
+            self.limiter.acquire(tokens)
+            try:
+                response = call()
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    self.breaker.record_failure(f"{type(e).__name__}: {e}")
+                    raise AIUnavailableError(f"{self.provider.name}: {e}") from e
+                delay = self._delay(attempt, e)
+                if delay > self.backoff_max:
+                    self.breaker.record_failure(f"{type(e).__name__}: retry after {delay:.0f}s")
+                    raise AIUnavailableError(
+                        f"{self.provider.name}: {e} (server asks to retry after {delay:.0f}s,"
+                        f" more than ai.backoff_max={self.backoff_max:g}s)"
+                    ) from e
+                logger.warning(
+                    "AI call failed (%s) — retry %d/%d in %.1fs",
+                    e, attempt + 1, self.max_retries, delay,
+                )
+                time.sleep(delay)
+                attempt += 1
+                if self.breaker.is_open:  # another call tripped it meanwhile
+                    raise AIUnavailableError(f"circuit open ({self.breaker.last_error})") from e
+                continue
+            self.breaker.record_success()
+            return response
+
+    def analyze(self, prompt: str, **kwargs) -> str:
+        return self._call(lambda: self.provider.analyze(prompt, **kwargs), estimate_tokens(prompt))
+
+    def analyze_with_image(self, prompt: str, image_path: str, **kwargs) -> str:
+        return self._call(
+            lambda: self.provider.analyze_with_image(prompt, image_path, **kwargs),
+            estimate_tokens(prompt, image=True),
+        )
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    def cache_params(self) -> dict:
+        return self.provider.cache_params()
+
+
+_breaker: CircuitBreaker | None = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Process-wide breaker built from the ``ai`` settings."""
+    global _breaker
+    if _breaker is None:
+        ai = get_settings().ai
+        _breaker = CircuitBreaker(ai.breaker_threshold, ai.breaker_cooldown)
+    return _breaker
@@ -14,7 +14,6 @@ from __future__ import annotations
 
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import click
@@ -76,7 +75,7 @@ def ingest(standards_dir: Path | None, rebuild: bool):
         task = progress.add_task("Parsing standards…", total=len(pdfs))
         kb_files = []
         for pdf in sorted(pdfs):
-            kb = ingest_standard(pdf)
+            kb = ingest_standard(pdf, force=rebuild)
             kb_files.append(kb)
             progress.advance(task)
 
@@ -103,7 +102,10 @@ def ingest(standards_dir: Path | None, rebuild: bool):
         n = store.index_knowledge_base(kb_path)
         total_indexed += n
 
-    console.print(f"\n[bold green]Done.[/bold green] {total_indexed} chunks indexed in ChromaDB.\n")
+    console.print(
+        f"\n[bold green]Done.[/bold green] {total_indexed} new or changed chunks indexed "
+        "in ChromaDB.\n"
+    )
 
 
 # ═══════════════════════════════════════════════════════
@@ -243,6 +245,12 @@ def ingest_symbols(force: bool):
 @click.option("--semantic/--no-semantic", default=False, help="Enable semantic KB matching.")
 @click.option("--ai/--no-ai", default=True, help="Enable AI text analysis (default: on).")
 @click.option("--ai-vision/--no-ai-vision", default=False, help="Enable AI vision analysis (slow on CPU).")
+@click.option(
+    "--ai-cache",
+    type=click.Choice(["off", "read", "readwrite"], case_sensitive=False),
+    default=None,
+    help="Reuse stored AI responses for identical requests. Default: ai.cache.",
+)
 @click.option("--redline/--no-redline", default=True, help="Generate redlined output.")
 @click.option(
     "--format", "-f",
@@ -251,21 +259,24 @@ def ingest_symbols(force: bool):
     help="Redline output format.",
 )
 @click.option("--workers", "-w", type=int, default=None, help="Parallel workers. Default: config.")
+@click.option(
+    "--resume/--no-resume", default=None,
+    help="Skip labels unchanged since the last run. Default: processing.resume.",
+)
 def check(
     paths: tuple[Path, ...],
     labels_dir: Path | None,
     semantic: bool,
     ai: bool,
     ai_vision: bool,
+    ai_cache: str | None,
     redline: bool,
     format: str,
     workers: int | None,
+    resume: bool | None,
 ):
     """Check label PDFs for ISO compliance and generate redlines."""
-    from label_compliance.compliance.checker import check_label, LabelResult
-    from label_compliance.redline.annotator import annotate_label
-    from label_compliance.redline.pdf_redliner import generate_redlined_pdf
-    from label_compliance.redline.report import generate_report
+    from label_compliance.compliance.batch import BatchOptions, run_batch
 
     settings = get_settings()
     settings.ensure_dirs()
@@ -312,7 +323,12 @@ def check(
     console.print(f"\n[bold]Checking {len(pdf_files)} label(s)…[/bold]\n")
 
     max_workers = workers or settings.processing.max_workers
-    results: list[LabelResult] = []
+    options = BatchOptions(
+        semantic=semantic, use_ai=ai, ai_vision=ai_vision, redline=redline, format=format,
+        ai_cache=ai_cache,
+    )
+    if max_workers > 1 and len(pdf_files) > 1:
+        console.print(f"[dim]  Using {min(max_workers, len(pdf_files))} worker processes[/dim]")
 
     with Progress(
         SpinnerColumn(),
@@ -323,25 +339,21 @@ def check(
     ) as progress:
         task = progress.add_task("Processing labels…", total=len(pdf_files))
 
-        for pdf in pdf_files:
-            progress.update(task, description=f"Checking {pdf.name}…")
-            try:
-                result = check_label(pdf, semantic=semantic, use_ai=ai, ai_vision=ai_vision)
-                results.append(result)
-
-                # Generate outputs
-                if redline:
-                    if format in ("png", "both"):
-                        annotate_label(result)
-                    if format in ("pdf", "both"):
-                        generate_redlined_pdf(result)
-                    generate_report(result)
+        def _on_result(summary):
+            if summary.error:
+                console.print(f"  [red]✗[/red] {summary.pdf_path.name}: {summary.error}")
+            verb = "Unchanged" if summary.reused else "Checked"
+            progress.update(task, description=f"{verb} {summary.pdf_path.name}")
+            progress.advance(task)
 
-            except Exception as e:
-                logger.error("Failed to process %s: %s", pdf.name, e, exc_info=True)
-                console.print(f"  [red]✗[/red] {pdf.name}: {e}")
+        summaries = run_batch(
+            pdf_files, options, max_workers=max_workers, on_result=_on_result, resume=resume,
+        )
 
-            progress.advance(task)
+    results = [s for s in summaries if s.ok]
+    reused = sum(1 for s in summaries if s.reused)
+    if reused:
+        console.print(f"[dim]  Reused {reused} unchanged label(s) from the run ledger[/dim]")
 
     # Show summary table
     _print_results_table(results)
@@ -356,9 +368,7 @@ def check(
 
 
 def _print_results_table(results):
-    """Display a rich summary table of results."""
-    from label_compliance.compliance.checker import LabelResult
-
+    """Display a rich summary table of results (LabelResult or LabelSummary)."""
     table = Table(title="Compliance Summary", show_lines=True)
     table.add_column("Label", style="bold")
     table.add_column("Profile", style="cyan")
@@ -406,16 +416,25 @@ def _print_results_table(results):
     default=None,
     help="Output directory for redlined PDFs.",
 )
-def redline(paths: tuple[Path, ...], output_dir: Path | None):
+@click.option(
+    "--pages",
+    default=None,
+    help="Pages to review, 1-based (e.g. '1-3,5' or 'all'). Default: ai.redline_pages.",
+)
+def redline(paths: tuple[Path, ...], output_dir: Path | None, pages: str | None):
     """Generate AI-powered redline annotations on label PDFs.
 
     Uses GPT-4o vision to analyze the label and identify specific
     compliance issues, then places redline annotations directly on
     the original PDF — matching the manual reviewer's format.
 
+    Every page of a multi-sheet drawing is reviewed (pages run
+    concurrently); --pages restricts the review to a page range.
+
     Examples:
         label-compliance redline data/labels/clean/DRWG107602_Rev\\ D\\ 1.pdf
         label-compliance redline data/labels/clean/
+        label-compliance redline drawing.pdf --pages 1-3
     """
     from label_compliance.redline.ai_redliner import run_ai_redline
 
@@ -448,7 +467,7 @@ def redline(paths: tuple[Path, ...], output_dir: Path | None):
     for pdf in pdf_files:
         console.print(f"  [cyan]Analyzing[/cyan] {pdf.name}…")
         try:
-            result, out_path = run_ai_redline(pdf, output_dir)
+            result, out_path = run_ai_redline(pdf, output_dir, pages)
             if out_path:
                 console.print(f"  [green]✓[/green] {len(result.issues)} issues → {out_path.name}")
                 for issue in result.issues:
@@ -499,13 +518,33 @@ def report(output_dir: Path | None):
 @click.option("--semantic/--no-semantic", default=False, help="Enable semantic matching.")
 @click.option("--ai/--no-ai", default=True, help="Enable AI text analysis (default: on).")
 @click.option("--ai-vision/--no-ai-vision", default=False, help="Enable AI vision analysis (slow on CPU).")
+@click.option(
+    "--ai-cache",
+    type=click.Choice(["off", "read", "readwrite"], case_sensitive=False),
+    default=None,
+    help="Reuse stored AI responses for identical requests. Default: ai.cache.",
+)
 @click.option(
     "--format", "-f",
     type=click.Choice(["pdf", "png", "both"], case_sensitive=False),
     default="both",
     help="Redline output format.",
 )
-def run(rebuild: bool, semantic: bool, ai: bool, ai_vision: bool, format: str):
+@click.option("--workers", "-w", type=int, default=None, help="Parallel workers. Default: config.")
+@click.option(
+    "--resume/--no-resume", default=None,
+    help="Skip labels unchanged since the last run. Default: processing.resume.",
+)
+def run(
+    rebuild: bool,
+    semantic: bool,
+    ai: bool,
+    ai_vision: bool,
+    ai_cache: str | None,
+    format: str,
+    workers: int | None,
+    resume: bool | None,
+):
     """Run the full pipeline: ingest → check → report."""
     settings = get_settings()
     settings.ensure_dirs()
@@ -516,12 +555,12 @@ def run(rebuild: bool, semantic: bool, ai: bool, ai_vision: bool, format: str):
     # Step 1: Ingest
     console.rule("[bold]Step 1 — Ingest Standards[/bold]")
     from label_compliance.knowledge_base.ingester import ingest_all_standards
-    from label_compliance.knowledge_base.store import KnowledgeStore
+    from label_compliance.knowledge_base.store import get_knowledge_store
 
     std_dir = Path(settings.paths.standards_dir)
     if std_dir.exists() and list(std_dir.glob("*.pdf")):
-        kbs = ingest_all_standards()
-        store = KnowledgeStore()
+        kbs = ingest_all_standards(force=rebuild)
+        store = get_knowledge_store()  # reused by --semantic matching below
         if rebuild:
             store.reset()
 
@@ -529,16 +568,14 @@ def run(rebuild: bool, semantic: bool, ai: bool, ai_vision: bool, format: str):
         for kb in kbs:
             kb_path = Path(settings.paths.knowledge_base_dir) / f"{kb['iso_id']}.json"
             total += store.index_knowledge_base(kb_path)
-        console.print(f"  [green]✓[/green] Indexed {total} chunks.\n")
+        console.print(f"  [green]✓[/green] Indexed {total} new or changed chunks.\n")
     else:
         console.print(f"  [yellow]No standards in {std_dir}, skipping ingest.[/yellow]\n")
 
     # Step 2: Check labels
     console.rule("[bold]Step 2 — Check Labels[/bold]")
-    from label_compliance.compliance.checker import check_label
-    from label_compliance.redline.annotator import annotate_label
-    from label_compliance.redline.pdf_redliner import generate_redlined_pdf
-    from label_compliance.redline.report import generate_report, generate_summary_report
+    from label_compliance.compliance.batch import BatchOptions, run_batch
+    from label_compliance.redline.report import generate_summary_report
 
     labels_dir = Path(settings.paths.labels_dir)
     if not labels_dir.exists():
@@ -557,27 +594,32 @@ def run(rebuild: bool, semantic: bool, ai: bool, ai_vision: bool, format: str):
         sys.exit(1)
     console.print(f"  Found {len(pdf_files)} clean label(s) to check.\n")
 
-    results = []
+    max_workers = workers or settings.processing.max_workers
+    options = BatchOptions(
+        semantic=semantic, use_ai=ai, ai_vision=ai_vision, format=format, ai_cache=ai_cache,
+    )
+
     with Progress(
         SpinnerColumn(), TextColumn("{task.description}"),
         BarColumn(), TimeElapsedColumn(),
     ) as progress:
         task = progress.add_task("", total=len(pdf_files))
-        for pdf in pdf_files:
-            progress.update(task, description=f"Checking {pdf.name}…")
-            try:
-                result = check_label(pdf, semantic=semantic, use_ai=ai, ai_vision=ai_vision)
-                results.append(result)
-                if format in ("png", "both"):
-                    annotate_label(result)
-                if format in ("pdf", "both"):
-                    generate_redlined_pdf(result)
-                generate_report(result)
-            except Exception as e:
-                logger.error("Failed: %s — %s", pdf.name, e, exc_info=True)
-                console.print(f"  [red]✗[/red] {pdf.name}: {e}")
+
+        def _on_result(summary):
+            if summary.error:
+                console.print(f"  [red]✗[/red] {summary.pdf_path.name}: {summary.error}")
+            verb = "Unchanged" if summary.reused else "Checked"
+            progress.update(task, description=f"{verb} {summary.pdf_path.name}")
             progress.advance(task)
 
+        summaries = run_batch(
+            pdf_files, options, max_workers=max_workers, on_result=_on_result, resume=resume,
+        )
+
+    results = [s for s in summaries if s.ok]
+    reused = sum(1 for s in summaries if s.reused)
+    if reused:
+        console.print(f"[dim]  Reused {reused} unchanged label(s) from the run ledger[/dim]")
     _print_results_table(results)
 
     # Step 3: Summary report
@@ -697,5 +739,32 @@ def validate(labels_dir: Path | None):
     console.print(f"\n[bold green]Detailed report:[/bold green] {out_path}\n")
 
 
+# ═══════════════════════════════════════════════════════
+#  OCR-CACHE — inspect / clear the persistent OCR cache
+# ═══════════════════════════════════════════════════════
+@main.command("ocr-cache")
+@click.option("--clear", is_flag=True, help="Delete all cached OCR results and counters.")
+def ocr_cache(clear: bool):
+    """Show OCR cache size and hit/miss statistics."""
+    from label_compliance.document.ocr_cache import OCRCache
+
+    cache = OCRCache()
+    if clear:
+        cache.clear()
+        console.print("[green]✓[/green] OCR cache cleared.")
+        return
+
+    stats = cache.stats()
+    table = Table(title=f"OCR Cache — {cache.path}")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value", justify="right")
+    table.add_row("Entries", str(stats["entries"]))
+    table.add_row("Size", f"{stats['bytes'] / 2**20:.1f} / {stats['max_bytes'] / 2**20:.0f} MB")
+    table.add_row("Hits", str(stats["hits"]))
+    table.add_row("Misses", str(stats["misses"]))
+    table.add_row("Hit rate", f"{stats['hit_rate']:.0%}")
+    console.print(table)
+
+
 if __name__ == "__main__":
     main()
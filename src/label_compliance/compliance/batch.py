@@ -0,0 +1,256 @@
+"""
+Batch Runner
+=============
+Runs the per-label pipeline (check → redline → report) for many
+labels, optionally across a process pool.
+
+Each worker returns a compact ``LabelSummary`` instead of the full
+``LabelResult`` (which carries OCR words, fonts and page images), so
+only a few hundred bytes cross the process boundary per label.  All
+outputs (redlines, reports) are written to disk by the worker itself.
+
+Results are delivered to the caller in **input order**, regardless of
+the order in which workers finish, so progress output and the summary
+table are deterministic.
+
+With ``processing.resume`` enabled, labels whose PDF and run
+fingerprint are unchanged since the last run are served from the
+run ledger (see ``ledger.py``) without being reprocessed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from label_compliance.compliance.ledger import RunLedger, run_fingerprint
+from label_compliance.compliance.scorer import ComplianceScore
+from label_compliance.config import get_settings
+from label_compliance.utils.helpers import file_hash, safe_filename
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BatchOptions:
+    """Per-label pipeline options shared by every worker."""
+
+    semantic: bool = False
+    use_ai: bool = True
+    ai_vision: bool = False
+    redline: bool = True
+    format: str = "both"  # "pdf", "png" or "both"
+    ai_cache: str | None = None  # "off", "read", "readwrite"; None = ai.cache
+
+
+@dataclass
+class LabelSummary:
+    """Compact, picklable result of one label run (for display + IPC)."""
+
+    label_name: str
+    pdf_path: Path
+    profile: str = "default"
+    score: ComplianceScore | None = None
+    outputs: list[Path] = field(default_factory=list)
+    error: str = ""
+    reused: bool = False  # served from the run ledger
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+def label_image_dirs(pdf_files: list[Path]) -> dict[Path, Path]:
+    """Assign every label its own image directory.
+
+    Labels normally render to ``data/images/<safe_name>``.  When two
+    inputs share a stem (e.g. the same drawing in two folders) they
+    would overwrite each other's page images — which is fatal once they
+    run concurrently — so colliding names get a short path-hash suffix.
+    """
+    import hashlib
+
+    settings = get_settings()
+    images_root = settings.paths.knowledge_base_dir.parent / "images"
+
+    by_name: dict[str, list[Path]] = {}
+    for pdf in pdf_files:
+        by_name.setdefault(safe_filename(pdf.stem), []).append(pdf)
+
+    dirs: dict[Path, Path] = {}
+    for name, pdfs in by_name.items():
+        for pdf in pdfs:
+            if len(pdfs) == 1:
+                dirs[pdf] = images_root / name
+            else:
+                digest = hashlib.sha1(str(pdf.resolve()).encode("utf-8")).hexdigest()[:8]
+                dirs[pdf] = images_root / f"{name}-{digest}"
+    return dirs
+
+
+def process_label(
+    pdf_path: Path,
+    options: BatchOptions,
+    image_dir: Path | None = None,
+) -> LabelSummary:
+    """Check one label and write its outputs.  Safe to run in a worker process."""
+    from label_compliance.compliance.checker import check_label
+    from label_compliance.redline.annotator import annotate_label
+    from label_compliance.redline.pdf_redliner import generate_redlined_pdf
+    from label_compliance.redline.report import generate_report
+
+    try:
+        result = check_label(
+            pdf_path,
+            semantic=options.semantic,
+            use_ai=options.use_ai,
+            ai_vision=options.ai_vision,
+            image_dir=image_dir,
+            ai_cache=options.ai_cache,
+        )
+
+        outputs: list[Path] = []
+        try:
+            if options.redline:
+                if options.format in ("png", "both"):
+                    outputs.extend(annotate_label(result))
+                if options.format in ("pdf", "both"):
+                    pdf_out = generate_redlined_pdf(result)
+                    if pdf_out:
+                        outputs.append(pdf_out)
+                outputs.extend(generate_report(result))
+        finally:
+            result.close()  # free the page rasters and the PDF handle
+
+        return LabelSummary(
+            label_name=result.label_name,
+            pdf_path=pdf_path,
+            profile=result.profile,
+            score=_compact_score(result.score),
+            outputs=outputs,
+        )
+    except Exception as e:
+        logger.error("Failed to process %s: %s", pdf_path.name, e, exc_info=True)
+        return LabelSummary(
+            label_name=pdf_path.stem, pdf_path=pdf_path, error=str(e) or type(e).__name__,
+        )
+
+
+def run_batch(
+    pdf_files: list[Path],
+    options: BatchOptions,
+    max_workers: int | None = None,
+    on_result: Callable[[LabelSummary], None] | None = None,
+    resume: bool | None = None,
+) -> list[LabelSummary]:
+    """Process labels, in parallel when ``max_workers > 1``.
+
+    Args:
+        pdf_files: Label PDFs to process.
+        options: Pipeline options applied to every label.
+        max_workers: Process count. Default: ``processing.max_workers``.
+            ``1`` runs everything in the current process.
+        on_result: Called once per label, strictly in input order.
+        resume: Reuse outputs of unchanged labels. Default:
+            ``processing.resume``.
+
+    Returns:
+        One ``LabelSummary`` per input, in input order.
+    """
+    settings = get_settings()
+    if max_workers is None:
+        max_workers = settings.processing.max_workers
+    if resume is None:
+        resume = settings.processing.resume
+
+    image_dirs = label_image_dirs(pdf_files)
+    summaries: list[LabelSummary | None] = [None] * len(pdf_files)
+    next_idx = 0
+
+    # ── Incremental mode: reuse unchanged labels ──
+    ledger = RunLedger()
+    fingerprint = run_fingerprint(options)
+    pdf_hashes: dict[Path, str] = {}
+    for idx, pdf in enumerate(pdf_files):
+        try:
+            pdf_hashes[pdf] = file_hash(pdf)
+        except OSError:
+            continue  # let the worker report the missing file
+        if not resume:
+            continue
+        entry = ledger.lookup(pdf, pdf_hashes[pdf], fingerprint)
+        if entry:
+            summaries[idx] = LabelSummary(
+                label_name=entry.label_name,
+                pdf_path=pdf,
+                profile=entry.profile,
+                score=entry.to_score(),
+                outputs=[Path(p) for p in entry.outputs],
+                reused=True,
+            )
+
+    todo = [idx for idx, s in enumerate(summaries) if s is None]
+    if resume and len(todo) < len(pdf_files):
+        logger.info(
+            "Resume: reusing %d unchanged label(s), processing %d",
+            len(pdf_files) - len(todo), len(todo),
+        )
+
+    def _finish(idx: int, summary: LabelSummary) -> None:
+        summaries[idx] = summary
+        pdf = pdf_files[idx]
+        if summary.ok and pdf in pdf_hashes:
+            ledger.record(
+                pdf, pdf_hashes[pdf], fingerprint,
+                summary.label_name, summary.profile, summary.score, summary.outputs,
+            )
+            ledger.save()
+
+    def _emit_ready() -> None:
+        # Flush the contiguous run of finished labels, preserving order
+        nonlocal next_idx
+        while next_idx < len(summaries) and summaries[next_idx] is not None:
+            if on_result:
+                on_result(summaries[next_idx])
+            next_idx += 1
+
+    _emit_ready()
+    max_workers = max(1, min(max_workers, len(todo) or 1))
+
+    if max_workers == 1:
+        for idx in todo:
+            pdf = pdf_files[idx]
+            _finish(idx, process_label(pdf, options, image_dirs[pdf]))
+            _emit_ready()
+        return summaries  # type: ignore[return-value]
+
+    logger.info("Processing %d labels with %d worker processes", len(todo), max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(process_label, pdf_files[idx], options, image_dirs[pdf_files[idx]]): idx
+            for idx in todo
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            pdf = pdf_files[idx]
+            try:
+                _finish(idx, future.result())
+            except Exception as e:
+                # Worker died (e.g. BrokenProcessPool) — record, keep going
+                logger.error("Worker failed for %s: %s", pdf.name, e)
+                summaries[idx] = LabelSummary(
+                    label_name=pdf.stem, pdf_path=pdf, error=str(e) or type(e).__name__,
+                )
+            _emit_ready()
+
+    return summaries  # type: ignore[return-value]
+
+
+def _compact_score(score: ComplianceScore | None) -> ComplianceScore | None:
+    """Drop per-rule match lists; the summary table only needs the counts."""
+    if score is None:
+        return None
+    return replace(score, results=[], critical_gaps=[], new_2024_gaps=[])
@@ -19,36 +19,51 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import fitz
+
 from label_compliance.compliance.matcher import (
     MatchResult,
     match_rule_text,
     combine_match_results,
-    ai_verify_rules_batch,
-    ai_verify_rules_text_batch,
+    match_rules_semantic,
+    submit_ai_text_batches,
+    submit_ai_vision_batches,
 )
+from label_compliance.ai.base import AIUnavailableError
 from label_compliance.compliance.rules import load_rules
+from label_compliance.compliance.ruleset import compile_rules
 from label_compliance.compliance.scorer import ComplianceScore, compute_score
 from label_compliance.compliance.specs_validator import (
     validate_rule_specs,
+    SpecContext,
     SpecsResult,
     SpecViolation,
 )
 from label_compliance.config import get_settings
 from label_compliance.document.barcode_reader import read_barcodes, BarcodeResult
+from label_compliance.document.context import DocumentContext
+from label_compliance.document.page_images import PageImage, PageImageProvider
 from label_compliance.document.font_analyzer import extract_fonts, FontInfo, validate_font_size
 from label_compliance.document.image_extractor import (
     classify_pdf_pages,
     extract_embedded_images,
+    ocr_embedded_image,
+    EmbeddedImage,
     PDFImageAnalysis,
 )
-from label_compliance.document.image_renderer import render_pages, crop_section_image
+from label_compliance.document.image_renderer import crop_section_image
 from label_compliance.document.label_segmenter import (
     segment_pdf,
     LabelSection,
     SegmentationResult,
 )
 from label_compliance.document.layout import analyze_layout, Zone
-from label_compliance.document.ocr import run_ocr, OCRResult
+from label_compliance.document.ocr import (
+    ocr_from_vector_text,
+    run_ocr,
+    split_ocr_by_regions,
+    OCRResult,
+)
 from label_compliance.document.pdf_reader import read_pdf, PDFData
 from label_compliance.document.symbol_comparator import (
     compare_symbols_combined,
@@ -115,6 +130,20 @@ class LabelResult:
     symbol_comparison: SymbolComparisonReport | None = None
     score: ComplianceScore | None = None
     image_dir: Path | None = None
+    # Why AI verification was cut short (results are rule-based only), if it was
+    ai_unavailable: str = ""
+    # In-memory page rasters (for the annotator); close() when done
+    page_images: PageImageProvider | None = field(default=None, repr=False)
+
+    def close(self) -> None:
+        """Free the page rasters and the PDF handle they reopen on access.
+
+        Call once the outputs that need page images (annotator, redlined
+        PDF) are written; ``page_images`` is unusable afterwards.
+        """
+        if self.page_images is not None:
+            self.page_images.close()
+            self.page_images = None
 
 
 def check_label(
@@ -123,6 +152,8 @@ def check_label(
     semantic: bool = False,
     use_ai: bool = True,
     ai_vision: bool = False,
+    image_dir: Path | None = None,
+    ai_cache: str | None = None,
 ) -> LabelResult:
     """
     Run the full compliance check on a label PDF.
@@ -137,12 +168,33 @@ def check_label(
         semantic: Whether to also run semantic matching (requires KB).
         use_ai: Whether to run AI text-based verification (default: True).
         ai_vision: Whether to also run AI vision verification on page images.
+        image_dir: Where to write page/embedded images. Default:
+            ``data/images/<label>``. Batch runs pass a unique dir per label.
+        ai_cache: AI response cache mode ("off", "read", "readwrite").
+            Default: ``ai.cache``.
 
     Returns:
         LabelResult with per-section and overall analysis and score.
+        ``result.page_images`` keeps the rendered pages for the annotator
+        and reopens the PDF on access — call ``result.close()`` when done.
     """
+    # One shared parse of the PDF for every document stage
+    with DocumentContext(pdf_path) as doc_ctx:
+        return _check_document(doc_ctx, rules, semantic, use_ai, ai_vision, image_dir, ai_cache)
+
+
+def _check_document(
+    doc_ctx: DocumentContext,
+    rules: list[dict] | None,
+    semantic: bool,
+    use_ai: bool,
+    ai_vision: bool,
+    image_dir: Path | None,
+    ai_cache: str | None = None,
+) -> LabelResult:
     from label_compliance.compliance.rules import resolve_rules_for_label
 
+    pdf_path = doc_ctx.path
     settings = get_settings()
     settings.ensure_dirs()
     label_name = pdf_path.stem
@@ -156,18 +208,31 @@ def check_label(
     if rules is None:
         rules, profile_name = resolve_rules_for_label(pdf_path.name)
         logger.info("Profile: %s → %d rules", profile_name, len(rules))
+    ruleset = compile_rules(rules)
+
+    # ── Initialize semantic engine (shared store/model) ─
+    semantic_engine = None
+    if semantic:
+        try:
+            from label_compliance.knowledge_base.semantic import get_semantic_engine
+            semantic_engine = get_semantic_engine()
+        except Exception as e:
+            logger.error("Semantic matching unavailable: %s — proceeding without it", e)
 
     # ── Initialize AI provider ─────────────────────────
     ai_provider = None
+    ai_breaker = None
     if use_ai:
         try:
             from label_compliance.ai.base import get_ai_provider
-            ai_provider = get_ai_provider()
+            ai_provider = get_ai_provider(cache=ai_cache)
             if ai_provider.name == "none":
                 logger.warning("AI provider is 'none' — AI verification disabled")
                 ai_provider = None
             else:
                 logger.info("AI enabled: %s", ai_provider.name)
+                from label_compliance.ai.resilience import get_circuit_breaker
+                ai_breaker = get_circuit_breaker()
         except Exception as e:
             logger.error("Failed to initialize AI provider: %s — proceeding without AI", e)
             ai_provider = None
@@ -176,12 +241,12 @@ def check_label(
 
     # ── Step 1: Read PDF ──────────────────────────────
     logger.info("Step 1: Reading PDF...")
-    pdf_data = read_pdf(pdf_path)
+    pdf_data = read_pdf(doc_ctx)
     result.pdf_data = pdf_data
 
     # ── Step 1b: Classify PDF pages (IMAGE_ONLY / MIXED / TEXT_ONLY) ──
     logger.info("Step 1b: Classifying PDF pages...")
-    pdf_analysis = classify_pdf_pages(pdf_path)
+    pdf_analysis = classify_pdf_pages(doc_ctx)
     has_image_pages = pdf_analysis.has_image_only_pages
     if has_image_pages:
         logger.info(
@@ -198,7 +263,9 @@ def check_label(
     # ── Step 2: Segment into label sections ───────────
     # (segmenter now handles image-only pages automatically)
     logger.info("Step 2: Segmenting into label sections...")
-    seg = segment_pdf(pdf_path)
+    if image_dir is None:
+        image_dir = settings.paths.knowledge_base_dir.parent / "images" / safe_name
+    seg = segment_pdf(doc_ctx, image_dir=image_dir)
     result.segmentation = seg
     logger.info(
         "  Found %d sections: %s",
@@ -207,65 +274,81 @@ def check_label(
 
     # ── Step 3: Extract fonts ─────────────────────────
     logger.info("Step 3: Analyzing fonts...")
-    fonts = extract_fonts(pdf_path)
+    fonts = extract_fonts(doc_ctx)
     result.fonts = fonts
     result.font_violations = validate_font_size(fonts)
     if result.font_violations:
         logger.warning("  %d font size violations found", len(result.font_violations))
 
     # ── Step 4: Render pages + extract embedded images ──
+    # Pages stay in memory; PNGs are written only for debugging or for
+    # AI vision requests that need a file.
     logger.info("Step 4: Rendering pages as images...")
-    image_dir = settings.paths.knowledge_base_dir.parent / "images" / safe_name
-    image_paths = render_pages(pdf_path, output_dir=image_dir)
+    page_images = PageImageProvider(doc_ctx, output_dir=image_dir)
+    result.page_images = page_images
     result.image_dir = image_dir
+    if settings.document.save_page_images:
+        page_images.save_all()
+    page_list = page_images.pages()
 
     # Also extract embedded images for image-only and mixed pages
     embedded_image_map: dict[int, list[Path]] = {}
+    embedded_by_page: dict[int, list[EmbeddedImage]] = {}
     pages_needing_extraction = pdf_analysis.image_only_pages + pdf_analysis.mixed_pages
     if pages_needing_extraction:
         logger.info("  Extracting embedded images from pages %s...", pages_needing_extraction)
         embed_dir = image_dir / "embedded"
         embedded_images = extract_embedded_images(
-            pdf_path, embed_dir, pages=pages_needing_extraction,
+            doc_ctx, embed_dir, pages=pages_needing_extraction,
         )
         for emb in embedded_images:
             if emb.saved_path and emb.is_label_image:
                 embedded_image_map.setdefault(emb.page_number, []).append(emb.saved_path)
+                embedded_by_page.setdefault(emb.page_number, []).append(emb)
         logger.info(
             "  Extracted %d embedded label images",
             sum(len(v) for v in embedded_image_map.values()),
         )
 
-    # Build page_num → image_path map
-    page_image_map: dict[int, Path] = {}
-    for idx, img_path in enumerate(image_paths):
-        page_image_map[idx + 1] = img_path
+    # Build page_num → page image map
+    page_image_map: dict[int, PageImage] = {img.page_number: img for img in page_list}
 
     # ── Step 5: Process each page (OCR, layout, symbols, barcodes) ──
     page_ocr_map: dict[int, OCRResult] = {}
     page_zones_map: dict[int, list[Zone]] = {}
     page_symbols_map: dict[int, list[SymbolMatch]] = {}
     page_barcodes_map: dict[int, list[BarcodeResult]] = {}
+    merged_ocr_pages: set[int] = set()  # OCR words/text not all in page coordinates
 
-    for i, img_path in enumerate(image_paths, 1):
-        logger.info("Step 5: Processing page %d/%d...", i, len(image_paths))
+    for i, page_img in enumerate(page_list, 1):
+        logger.info("Step 5: Processing page %d/%d...", i, len(page_list))
         page_class = pdf_analysis.page_classifications[i - 1]
-        page_result = PageResult(page_number=i, image_path=img_path)
-
-        # OCR on the rendered page
-        ocr_result = run_ocr(img_path)
+        page_result = PageResult(page_number=i, image_path=page_images.saved_path(i))
+
+        # Pages with a text layer read their words straight from the PDF;
+        # Tesseract only runs on image-only pages (and, below, on the
+        # embedded rasters of mixed pages)
+        if settings.document.vector_fast_path and page_class.has_vector_text:
+            # Size from the page rect — page_img.size would render the page
+            ocr_result = ocr_from_vector_text(
+                doc_ctx, i, dpi=page_images.dpi, image_path=page_img.path,
+            )
+        else:
+            ocr_result = run_ocr(page_img)
 
         # For pages with embedded images, also OCR those and merge results
         if i in embedded_image_map:
             embedded_texts = []
             embedded_words = []
-            for emb_path in embedded_image_map[i]:
-                emb_ocr = run_ocr(emb_path)
+            for emb in embedded_by_page[i]:
+                # Already OCR'd by the segmenter for image-only/mixed pages
+                emb_ocr = ocr_embedded_image(emb)
                 if emb_ocr.full_text.strip():
                     embedded_texts.append(emb_ocr.full_text)
                     embedded_words.extend(emb_ocr.words)
 
             if embedded_texts:
+                merged_ocr_pages.add(i)
                 # Merge: combine rendered page OCR + embedded image OCR
                 combined_text = ocr_result.full_text
                 if combined_text.strip():
@@ -275,7 +358,7 @@ def check_label(
                 # Use whichever has more words (better OCR result)
                 if len(embedded_words) > len(ocr_result.words):
                     ocr_result = OCRResult(
-                        image_path=str(img_path),
+                        image_path=str(page_img.path),
                         image_size=ocr_result.image_size,
                         full_text=combined_text,
                         words=embedded_words,
@@ -284,7 +367,7 @@ def check_label(
                 else:
                     # Keep rendered page words but augment text
                     ocr_result = OCRResult(
-                        image_path=str(img_path),
+                        image_path=str(page_img.path),
                         image_size=ocr_result.image_size,
                         full_text=combined_text,
                         words=ocr_result.words,
@@ -303,7 +386,7 @@ def check_label(
         logger.info("  OCR: %d words, %d chars", ocr_result.word_count, len(ocr_result.full_text))
 
         # Layout analysis
-        zones = analyze_layout(img_path)
+        zones = analyze_layout(page_img)
         page_result.zones = zones
         page_zones_map[i] = zones
 
@@ -313,7 +396,7 @@ def check_label(
         page_symbols_map[i] = symbols
 
         # Barcode reading — also check embedded images
-        barcodes = read_barcodes(img_path)
+        barcodes = read_barcodes(page_img)
         if i in embedded_image_map:
             for emb_path in embedded_image_map[i]:
                 emb_barcodes = read_barcodes(emb_path)
@@ -325,11 +408,25 @@ def check_label(
 
         result.pages.append(page_result)
 
+    # ── Step 5b: Assign OCR words to sections by geometry ──
+    # Section bboxes are unrotated PDF points, OCR words rotated pixels
+    page_rotations = {
+        s.page_number: doc_ctx.page(s.page_number).rotation_matrix for s in seg.sections
+    }
+    section_ocr_map = _assign_ocr_to_sections(
+        seg.sections, page_ocr_map, merged_ocr_pages, page_images.dpi, page_rotations,
+    )
+
     # ── Step 6: Check each section independently ──────
     logger.info("Step 6: Checking each section against ISO rules...")
     overall_aggregated: dict[str, list[MatchResult]] = {}
+    font_index = doc_ctx.span_index if fonts else None  # the index behind ``fonts``
+    # AI batches of every section are submitted to the shared AI executor
+    # as the loop goes and collected, in section order, afterwards
+    pending_sections: list[tuple[SectionResult, dict[str, list[MatchResult]], list]] = []
+    vision_crops: dict[str, str] = {}  # section file name → latest crop file stem
 
-    for section in seg.sections:
+    for sec_idx, section in enumerate(seg.sections):
         sec_name = section.name
         sec_page = section.page_number
         logger.info("─" * 40)
@@ -346,8 +443,8 @@ def check_label(
         )
 
         # Get OCR text for this section
-        # Use the section's own extracted text + OCR from the page
-        ocr_result = page_ocr_map.get(sec_page)
+        # Use the section's own extracted text + the OCR words inside it
+        ocr_result = section_ocr_map.get(sec_idx) or page_ocr_map.get(sec_page)
         if ocr_result:
             sec_result.ocr_text = ocr_result.full_text
 
@@ -360,7 +457,7 @@ def check_label(
         zones = page_zones_map.get(sec_page, [])
         symbols = page_symbols_map.get(sec_page, [])
         barcodes = page_barcodes_map.get(sec_page, [])
-        img_path = page_image_map.get(sec_page)
+        page_img = page_image_map.get(sec_page)
 
         render_dpi = settings.document.render_dpi
         img_size = ocr_result.image_size if ocr_result else (0, 0)
@@ -368,23 +465,25 @@ def check_label(
         sec_aggregated: dict[str, list[MatchResult]] = {}
 
         # ── Rule matching for this section ──
-        for rule in rules:
-            # Create a synthetic OCR result with section text for matching
-            section_ocr = _make_section_ocr(combined_text, ocr_result)
-            match = match_rule_text(rule, section_ocr)
-
-            # Specs validation
-            spec_result = validate_rule_specs(
-                rule=rule,
-                ocr_result=section_ocr,
-                fonts=fonts,
-                zones=zones,
-                symbols=symbols,
-                barcodes=barcodes,
-                page_number=sec_page,
-                dpi=render_dpi,
-                image_size=img_size,
-            )
+        # Synthetic OCR result with section text; all rules scanned in one pass
+        section_ocr = _make_section_ocr(combined_text, ocr_result)
+        section_hits = ruleset.scan(section_ocr.full_text, section_ocr.text_lower)
+        spec_ctx = SpecContext(
+            ocr_result=section_ocr,
+            fonts=fonts,
+            zones=zones,
+            symbols=symbols,
+            barcodes=barcodes,
+            page_number=sec_page,
+            dpi=render_dpi,
+            image_size=img_size,
+            font_index=font_index,
+        )
+        for rule, hits in zip(rules, section_hits):
+            match = match_rule_text(rule, section_ocr, hits)
+
+            # Specs validation (lookups shared across rules via the context)
+            spec_result = validate_rule_specs(rule=rule, context=spec_ctx)
             sec_result.spec_results.append(spec_result)
 
             # Merge spec violations
@@ -419,9 +518,28 @@ def check_label(
 
             rule_id = rule.get("id", "unknown")
             sec_aggregated.setdefault(rule_id, []).append(match)
-            overall_aggregated.setdefault(rule_id, []).append(match)
+
+        # ── Semantic matching: one KB query for all rules ──
+        if semantic_engine and combined_text.strip():
+            try:
+                sem_results = match_rules_semantic(rules, combined_text, engine=semantic_engine)
+            except Exception as e:
+                logger.error("Semantic matching failed: %s — disabled for this label", e)
+                semantic_engine, sem_results = None, []
+            for sem_match in sem_results:
+                sem_match.details = f"[{sec_name}] {sem_match.details}"
+                sec_aggregated.setdefault(sem_match.rule_id, []).append(sem_match)
 
         # ── AI Text Verification for this section ──
+        ai_jobs: list[tuple[str, list]] = []
+        if ai_provider and ai_breaker.is_open:
+            # Provider down: finish the label rule-based instead of waiting on it
+            logger.warning(
+                "  AI unavailable (%s) — rule-based checks only from [%s] on",
+                ai_breaker.last_error, sec_name,
+            )
+            result.ai_unavailable = result.ai_unavailable or ai_breaker.last_error
+            ai_provider = None
         if ai_provider and combined_text.strip():
             ai_mode = getattr(settings.ai, "ai_mode", "smart")
             ai_batch_size = getattr(settings.ai, "batch_size", 5)
@@ -442,33 +560,24 @@ def check_label(
                     "  AI text (%s): Checking %d rules for [%s]…",
                     ai_mode, len(rules_to_verify), sec_name,
                 )
-                try:
-                    ai_text_results = ai_verify_rules_text_batch(
-                        rules_to_verify,
-                        combined_text,
-                        ai_provider,
-                        batch_size=ai_batch_size,
-                    )
-                    for ai_match in ai_text_results:
-                        ai_match.details = f"[{sec_name}] {ai_match.details}"
-                        rid = ai_match.rule_id
-                        sec_aggregated.setdefault(rid, []).append(ai_match)
-                        overall_aggregated.setdefault(rid, []).append(ai_match)
-                    logger.info("  AI text: Done — %d results", len(ai_text_results))
-                except Exception as e:
-                    logger.error("  AI text error for [%s]: %s", sec_name, e)
+                ai_jobs.append(("text", submit_ai_text_batches(
+                    rules_to_verify,
+                    combined_text,
+                    ai_provider,
+                    batch_size=ai_batch_size,
+                )))
 
         # ── AI Vision for this section ──
         # Auto-enable vision for image-only pages (critical for accuracy)
         page_class = pdf_analysis.page_classifications[sec_page - 1] if sec_page <= len(pdf_analysis.page_classifications) else None
         should_use_vision = ai_vision or (page_class and page_class.is_image_only)
         
-        if ai_provider and should_use_vision and img_path:
+        if ai_provider and should_use_vision and page_img:
             ai_batch_size = getattr(settings.ai, "batch_size", 5)
 
             # For image-only pages, prefer embedded images (higher quality)
             # over rendered page images
-            section_img = img_path  # fallback to rendered page
+            section_img: Path | None = None  # fallback: rendered page, below
             
             # Try embedded image first (higher quality for image-only PDFs)
             if sec_page in embedded_image_map and embedded_image_map[sec_page]:
@@ -481,13 +590,17 @@ def check_label(
                 )
             elif section.bbox:
                 # Crop individual section image if bbox is available
-                crop_dir = img_path.parent / "sections"
+                crop_dir = page_img.path.parent / "sections"
                 crop_dir.mkdir(parents=True, exist_ok=True)
                 section_safe = safe_filename(sec_name)
+                if section_safe in vision_crops:
+                    # Same-named section: don't overwrite a crop still queued for AI
+                    section_safe = f"{section_safe}_{sec_idx}"
+                vision_crops[safe_filename(sec_name)] = section_safe
                 crop_path = crop_dir / f"{section_safe}.png"
                 try:
                     section_img = crop_section_image(
-                        full_page_image=img_path,
+                        full_page_image=page_img,
                         bbox=section.bbox,
                         output_path=crop_path,
                         dpi=render_dpi,
@@ -498,22 +611,16 @@ def check_label(
                     )
                 except Exception as e:
                     logger.warning("  Could not crop section image: %s", e)
-                    section_img = img_path
+
+            if section_img is None:
+                # The AI providers read files — write this page's PNG now
+                section_img = page_img.save()
 
             vision_note = " (auto-enabled for image-only page)" if not ai_vision else ""
             logger.info("  AI vision%s: [%s] → %d rules…", vision_note, sec_name, len(rules))
-            try:
-                ai_results = ai_verify_rules_batch(
-                    rules, section_img, ai_provider, batch_size=ai_batch_size,
-                )
-                for ai_match in ai_results:
-                    ai_match.details = f"[{sec_name}] {ai_match.details}"
-                    rid = ai_match.rule_id
-                    sec_aggregated.setdefault(rid, []).append(ai_match)
-                    overall_aggregated.setdefault(rid, []).append(ai_match)
-                logger.info("  AI vision: Done — %d results", len(ai_results))
-            except Exception as e:
-                logger.error("  AI vision error for [%s]: %s", sec_name, e)
+            ai_jobs.append(("vision", submit_ai_vision_batches(
+                rules, section_img, ai_provider, batch_size=ai_batch_size,
+            )))
 
         # ── Symbol Library Comparison for this section ──
         try:
@@ -525,9 +632,9 @@ def check_label(
                 section_img_for_sym = max(
                     embedded_image_map[sec_page], key=lambda p: p.stat().st_size
                 )
-            elif section.bbox and img_path:
-                crop_dir = img_path.parent / "sections"
-                section_safe = safe_filename(sec_name)
+            elif section.bbox and page_img:
+                crop_dir = page_img.path.parent / "sections"
+                section_safe = vision_crops.get(safe_filename(sec_name), safe_filename(sec_name))
                 crop_path = crop_dir / f"{section_safe}.png"
                 if crop_path.exists():
                     section_img_for_sym = crop_path
@@ -542,6 +649,29 @@ def check_label(
         except Exception as e:
             logger.error("  Symbol comparison error for [%s]: %s", sec_name, e)
 
+        pending_sections.append((sec_result, sec_aggregated, ai_jobs))
+
+    # ── Step 6b: Collect AI results and score each section ──
+    for sec_result, sec_aggregated, ai_jobs in pending_sections:
+        sec_name = sec_result.section_name
+        for kind, futures in ai_jobs:
+            ai_results = []
+            for future in futures:
+                try:
+                    ai_results.extend(future.result())
+                except AIUnavailableError as e:
+                    logger.warning("  AI %s unavailable for [%s]: %s", kind, sec_name, e)
+                    result.ai_unavailable = result.ai_unavailable or str(e)
+                except Exception as e:
+                    logger.error("  AI %s error for [%s]: %s", kind, sec_name, e)
+            for ai_match in ai_results:
+                ai_match.details = f"[{sec_name}] {ai_match.details}"
+                sec_aggregated.setdefault(ai_match.rule_id, []).append(ai_match)
+            logger.info("  AI %s [%s]: Done — %d results", kind, sec_name, len(ai_results))
+
+        for rid, matches in sec_aggregated.items():
+            overall_aggregated.setdefault(rid, []).extend(matches)
+
         # ── Score this section ──
         sec_matches = []
         for rid, matches in sec_aggregated.items():
@@ -623,6 +753,10 @@ def check_label(
         "  📏 Spec violations: %d total across %d rules (%d rules had spec failures)",
         total_spec_violations, rules_with_violations, specs_failed,
     )
+    if result.ai_unavailable:
+        logger.warning(
+            "  🤖 AI unavailable (%s) — AI verification incomplete", result.ai_unavailable,
+        )
     if best_sym_comparison and best_sym_comparison.total_required > 0:
         logger.info(
             "  🏷️  Symbol library: %d/%d found | %d partial | %d missing",
@@ -643,6 +777,49 @@ def check_label(
     return result
 
 
+def _assign_ocr_to_sections(
+    sections: list[LabelSection],
+    page_ocr_map: dict[int, OCRResult],
+    merged_ocr_pages: set[int],
+    dpi: int,
+    rotations: dict[int, fitz.Matrix] | None = None,
+) -> dict[int, OCRResult]:
+    """
+    Spatial join: each section gets the OCR words inside its bbox.
+
+    *rotations* maps page number → ``page.rotation_matrix`` so section
+    bboxes follow a ``/Rotate`` page into the rendered word coordinates.
+
+    Returns section index → section OCR result for pages split into two
+    or more sections.  Single-section pages keep the whole page OCR.  So
+    do pages whose OCR was merged with embedded-image OCR: those words
+    and text are not in page coordinates.
+    """
+    by_page: dict[int, list[int]] = {}
+    for idx, section in enumerate(sections):
+        by_page.setdefault(section.page_number, []).append(idx)
+
+    section_ocr: dict[int, OCRResult] = {}
+    for page_num, indices in by_page.items():
+        page_ocr = page_ocr_map.get(page_num)
+        if (
+            page_ocr is None or len(indices) < 2 or page_num in merged_ocr_pages
+            or any(sections[i].bbox is None for i in indices)
+        ):
+            continue
+        parts = split_ocr_by_regions(
+            page_ocr, [sections[i].bbox for i in indices], dpi,
+            (rotations or {}).get(page_num),
+        )
+        section_ocr.update(zip(indices, parts))
+        logger.info(
+            "  Page %d: %d OCR words assigned to %d sections (%s)",
+            page_num, page_ocr.word_count, len(indices),
+            ", ".join(str(p.word_count) for p in parts),
+        )
+    return section_ocr
+
+
 def _make_section_ocr(
     section_text: str, page_ocr: OCRResult | None
 ) -> OCRResult:
@@ -0,0 +1,184 @@
+"""
+Run Ledger
+===========
+Content-hash ledger that lets batch runs skip unchanged labels
+(``processing.resume``).
+
+Each completed label is recorded under the SHA-256 of its PDF together
+with a *run fingerprint* — a digest of the rule files, settings, package
+source and pipeline options.  On the next run a label is reused when
+its PDF hash and the fingerprint both match and every recorded output
+(report-*.json/.md, redlines) still exists on disk.  Anything else —
+new artwork, an edited rule file, a config change, a code change — is
+reprocessed.
+
+The ledger lives at ``outputs/run-ledger.json`` and is only written by
+the parent process, so no locking is needed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from label_compliance.compliance.scorer import ComplianceScore
+from label_compliance.config import SETTINGS_FILE, get_root, get_settings
+from label_compliance.utils.helpers import safe_filename
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+LEDGER_FILENAME = "run-ledger.json"
+LEDGER_VERSION = 1
+
+# ComplianceScore fields persisted in the ledger (counts only, no match lists)
+_SCORE_FIELDS = (
+    "total_rules", "passed", "partial", "failed", "score_pct",
+    "weighted_score", "status", "spec_violation_count", "rules_with_spec_failures",
+)
+
+
+@dataclass
+class LedgerEntry:
+    """One completed label run."""
+
+    pdf_hash: str
+    fingerprint: str
+    label_name: str
+    pdf_path: str
+    profile: str = "default"
+    score: dict | None = None
+    outputs: list[str] = field(default_factory=list)
+    completed_at: str = ""
+
+    def outputs_exist(self) -> bool:
+        return bool(self.outputs) and all(Path(p).exists() for p in self.outputs)
+
+    def to_score(self) -> ComplianceScore | None:
+        if self.score is None:
+            return None
+        return ComplianceScore(label_name=self.label_name, **self.score)
+
+
+class RunLedger:
+    """JSON-backed map of ``(pdf hash, label) → LedgerEntry``."""
+
+    def __init__(self, path: Path | None = None):
+        if path is None:
+            path = get_settings().paths.output_dir / LEDGER_FILENAME
+        self.path = Path(path)
+        self._entries: dict[str, LedgerEntry] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(pdf_path: Path, pdf_hash: str) -> str:
+        # Same artwork under two names yields two reports, so keep both
+        return f"{pdf_hash}:{safe_filename(Path(pdf_path).stem)}"
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable run ledger %s: %s", self.path, e)
+            return
+        if data.get("version") != LEDGER_VERSION:
+            logger.info("Run ledger version changed — starting fresh")
+            return
+        for key, raw in data.get("entries", {}).items():
+            try:
+                self._entries[key] = LedgerEntry(**raw)
+            except TypeError:
+                continue
+
+    def save(self) -> None:
+        """Atomically write the ledger to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": LEDGER_VERSION,
+            "entries": {k: asdict(v) for k, v in sorted(self._entries.items())},
+        }
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def lookup(self, pdf_path: Path, pdf_hash: str, fingerprint: str) -> LedgerEntry | None:
+        """Return the entry for an unchanged label whose outputs still exist."""
+        entry = self._entries.get(self._key(pdf_path, pdf_hash))
+        if entry is None or entry.fingerprint != fingerprint:
+            return None
+        if not entry.outputs_exist():
+            logger.info("Ledger hit for %s but outputs are missing — reprocessing", pdf_path.name)
+            return None
+        return entry
+
+    def record(
+        self,
+        pdf_path: Path,
+        pdf_hash: str,
+        fingerprint: str,
+        label_name: str,
+        profile: str,
+        score: ComplianceScore | None,
+        outputs: list[Path],
+    ) -> LedgerEntry:
+        """Record a successful label run (call :meth:`save` to persist)."""
+        entry = LedgerEntry(
+            pdf_hash=pdf_hash,
+            fingerprint=fingerprint,
+            label_name=label_name,
+            pdf_path=str(pdf_path),
+            profile=profile,
+            score={f: getattr(score, f) for f in _SCORE_FIELDS} if score else None,
+            outputs=[str(p) for p in outputs],
+            completed_at=datetime.now(UTC).isoformat(timespec="seconds"),
+        )
+        self._entries[self._key(pdf_path, pdf_hash)] = entry
+        return entry
+
+
+def run_fingerprint(options: object | None = None) -> str:
+    """Digest of everything besides the PDF that affects a label's outputs.
+
+    Covers every rule YAML, the raw settings file (profiles live there),
+    the effective settings (env overrides), the package version and
+    source, and the pipeline options of this run.
+    """
+    import label_compliance
+
+    h = hashlib.sha256()
+
+    rules_dir = get_root() / "config" / "rules"
+    for rule_file in sorted(rules_dir.glob("*.yaml")):
+        h.update(rule_file.name.encode("utf-8"))
+        h.update(rule_file.read_bytes())
+
+    if SETTINGS_FILE.exists():
+        h.update(SETTINGS_FILE.read_bytes())
+    h.update(repr(get_settings()).encode("utf-8"))
+
+    h.update(label_compliance.__version__.encode("utf-8"))
+    h.update(_source_digest().encode("utf-8"))
+
+    if options is not None:
+        h.update(repr(options).encode("utf-8"))
+
+    return h.hexdigest()
+
+
+def _source_digest() -> str:
+    """Hash of the package's Python sources (the effective "code version")."""
+    pkg_dir = Path(__file__).resolve().parent.parent
+    h = hashlib.sha256()
+    for src in sorted(pkg_dir.rglob("*.py")):
+        h.update(str(src.relative_to(pkg_dir)).encode("utf-8"))
+        h.update(src.read_bytes())
+    return h.hexdigest()
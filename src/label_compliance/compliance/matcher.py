@@ -13,10 +13,13 @@ Three matching layers (used in combination for maximum accuracy):
 from __future__ import annotations
 
 import json
-import re
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from label_compliance.ai.base import AIUnavailableError
+from label_compliance.ai.executor import AIExecutor, get_ai_executor
+from label_compliance.compliance.ruleset import RuleHits, scan_rule
 from label_compliance.document.ocr import OCRResult
 from label_compliance.document.symbol_detector import SymbolMatch
 from label_compliance.utils.log import get_logger
@@ -47,36 +50,35 @@ class MatchResult:
 def match_rule_text(
     rule: dict,
     ocr_result: OCRResult,
+    hits: RuleHits | None = None,
 ) -> MatchResult:
     """
     Match a single rule against OCR text using text markers and patterns.
+
+    *hits* is this rule's entry from ``CompiledRuleSet.scan`` over the
+    same text; without it the rule is scanned on its own.
     """
     markers = rule.get("markers", [])
     pattern = rule.get("pattern")
-    text_lower = ocr_result.text_lower
-    full_text = ocr_result.full_text
+    if hits is None:
+        hits = scan_rule(rule, ocr_result.full_text, ocr_result.text_lower)
 
     matched_markers = []
     locations = []
-    pattern_value = None
 
     # Check text markers
-    for marker in markers:
-        if marker.lower() in text_lower:
-            matched_markers.append(marker)
-            for word in ocr_result.find_text(marker):
-                locations.append({
-                    "text": word.text,
-                    "x": word.x, "y": word.y,
-                    "w": word.w, "h": word.h,
-                })
+    for marker in hits.markers:
+        matched_markers.append(marker)
+        for word in ocr_result.find_text(marker):
+            locations.append({
+                "text": word.text,
+                "x": word.x, "y": word.y,
+                "w": word.w, "h": word.h,
+            })
 
     # Check regex pattern
-    if pattern:
-        m = re.search(pattern, full_text, re.IGNORECASE)
-        if m:
-            pattern_value = m.group(0)
-            matched_markers.append(f"pattern:{pattern_value}")
+    if hits.pattern_value is not None:
+        matched_markers.append(f"pattern:{hits.pattern_value}")
 
     # Determine status
     total_markers = len(markers) + (1 if pattern else 0)
@@ -111,31 +113,52 @@ def match_rule_semantic(
     rule: dict,
     ocr_result: OCRResult,
     threshold: float = 0.65,
+    engine=None,
 ) -> MatchResult:
     """
     Match a rule against OCR text using semantic similarity via KB.
 
     Uses the knowledge base embeddings to find if the OCR text
-    semantically covers the rule's requirement.
+    semantically covers the rule's requirement.  For many rules against
+    one text use ``match_rules_semantic`` — same results, one KB query.
     """
     try:
-        from label_compliance.knowledge_base.store import KnowledgeStore
-
-        store = KnowledgeStore()
-        rule_desc = rule.get("description", "")
+        return match_rules_semantic([rule], ocr_result.full_text, threshold, engine)[0]
+    except Exception as e:
+        logger.debug("Semantic matching failed: %s", e)
+        return MatchResult(
+            rule_id=rule.get("id", "unknown"),
+            rule_description=rule.get("description", ""),
+            iso_ref=rule.get("iso_ref", ""),
+            status="FAIL",
+            confidence=0.0,
+            method="semantic",
+            severity=rule.get("severity", "critical"),
+            new_in_2024=rule.get("new_in_2024", False),
+            details=f"Semantic matching unavailable: {e}",
+        )
 
-        # Search KB for the rule description and see if label text is similar
-        hits = store.search(ocr_result.full_text[:500], n_results=5)
 
-        # Check if any hit matches this rule's section
-        rule_section = rule.get("iso_ref", "")
-        best_sim = 0.0
+def match_rules_semantic(
+    rules: list[dict],
+    text: str,
+    threshold: float = 0.65,
+    engine=None,
+) -> list[MatchResult]:
+    """
+    Semantic match of every rule against one section text.
 
-        for hit in hits:
-            meta = hit.get("metadata", {})
-            if rule_section and meta.get("section", "") in rule_section:
-                best_sim = max(best_sim, hit.get("similarity", 0))
+    The text is embedded and queried once (``SemanticEngine``); each
+    rule is then resolved from the best similarity of its ISO section.
+    Raises if the knowledge base or the embedding model is unavailable.
+    """
+    if engine is None:
+        from label_compliance.knowledge_base.semantic import get_semantic_engine
+        engine = get_semantic_engine()
+    sims = engine.rule_similarities(rules, text)
 
+    results = []
+    for rule, best_sim in zip(rules, sims):
         if best_sim >= threshold:
             status = "PASS"
         elif best_sim >= threshold * 0.6:
@@ -143,7 +166,7 @@ def match_rule_semantic(
         else:
             status = "FAIL"
 
-        return MatchResult(
+        results.append(MatchResult(
             rule_id=rule.get("id", "unknown"),
             rule_description=rule.get("description", ""),
             iso_ref=rule.get("iso_ref", ""),
@@ -154,21 +177,8 @@ def match_rule_semantic(
             severity=rule.get("severity", "critical"),
             new_in_2024=rule.get("new_in_2024", False),
             details=f"Best semantic match: {best_sim:.3f}",
-        )
-
-    except Exception as e:
-        logger.debug("Semantic matching failed: %s", e)
-        return MatchResult(
-            rule_id=rule.get("id", "unknown"),
-            rule_description=rule.get("description", ""),
-            iso_ref=rule.get("iso_ref", ""),
-            status="FAIL",
-            confidence=0.0,
-            method="semantic",
-            severity=rule.get("severity", "critical"),
-            new_in_2024=rule.get("new_in_2024", False),
-            details=f"Semantic matching unavailable: {e}",
-        )
+        ))
+    return results
 
 
 def combine_match_results(results: list[MatchResult]) -> MatchResult:
@@ -413,6 +423,8 @@ def ai_verify_rule_text(
         else:
             logger.warning("AI text response not parseable for rule %s", rule.get("id"))
 
+    except AIUnavailableError:
+        raise  # not a compliance result — the caller reports it
     except Exception as e:
         logger.error("AI text verify failed for rule %s: %s", rule.get("id"), e)
 
@@ -434,95 +446,133 @@ def ai_verify_rules_text_batch(
     ocr_text: str,
     ai_provider,
     batch_size: int = 5,
+    executor: AIExecutor | None = None,
 ) -> list[MatchResult]:
     """
     Use AI text model to verify rules in small batches (no image needed).
     Much faster than vision — suitable for confirming text presence.
+    Batches run concurrently on the AI executor.
 
     Args:
         rules: List of compliance rule dicts to verify.
         ocr_text: Full OCR text from the label.
         ai_provider: An AIProvider instance.
         batch_size: Number of rules per AI call (default 5).
+        executor: AI executor (default: the process-wide one).
 
     Returns:
-        List of MatchResult, one per rule.
+        List of MatchResult, one per rule, in rule order.
     """
+    return gather_ai_results(
+        submit_ai_text_batches(rules, ocr_text, ai_provider, batch_size, executor),
+    )
+
+
+def submit_ai_text_batches(
+    rules: list[dict],
+    ocr_text: str,
+    ai_provider,
+    batch_size: int = 5,
+    executor: AIExecutor | None = None,
+) -> list[Future[list[MatchResult]]]:
+    """Start ``ai_verify_rules_text_batch`` without waiting — one future per batch."""
+    executor = executor or get_ai_executor()
+    return [
+        executor.submit(
+            _ai_text_batch, rules[start:start + batch_size], start, ocr_text, ai_provider,
+        )
+        for start in range(0, len(rules), batch_size)
+    ]
+
+
+def gather_ai_results(futures: list[Future[list[MatchResult]]]) -> list[MatchResult]:
+    """Batch results in submission order, whatever order they finished in."""
+    results: list[MatchResult] = []
+    for future in futures:
+        results.extend(future.result())
+    return results
+
+
+def _ai_text_batch(
+    batch: list[dict],
+    batch_start: int,
+    ocr_text: str,
+    ai_provider,
+) -> list[MatchResult]:
+    """One text batch: a single AI call, falling back to one call per rule."""
     label_text = ocr_text[:2000] if len(ocr_text) > 2000 else ocr_text
     all_results: list[MatchResult] = []
 
-    # Split rules into small batches
-    for batch_start in range(0, len(rules), batch_size):
-        batch = rules[batch_start:batch_start + batch_size]
+    # Build compact rules list for prompt
+    rules_desc = "\n".join(
+        f"- {r.get('id', '?')}: {r.get('description', '')} "
+        f"(look for: {', '.join(r.get('markers', [])[:5])})"
+        for r in batch
+    )
 
-        # Build compact rules list for prompt
-        rules_desc = "\n".join(
-            f"- {r.get('id', '?')}: {r.get('description', '')} "
-            f"(look for: {', '.join(r.get('markers', [])[:5])})"
-            for r in batch
-        )
+    prompt = _AI_BATCH_TEXT_PROMPT.format(
+        rules_list=rules_desc,
+        label_text=label_text,
+    )
 
-        prompt = _AI_BATCH_TEXT_PROMPT.format(
-            rules_list=rules_desc,
-            label_text=label_text,
-        )
+    try:
+        raw = ai_provider.analyze(prompt)
+        parsed = _parse_ai_json(raw)
+
+        # Handle wrapped format {"results": [...]}
+        if parsed and isinstance(parsed, dict) and "results" in parsed:
+            parsed = parsed["results"]
+
+        if parsed and isinstance(parsed, list):
+            ai_map = {}
+            for item in parsed:
+                if isinstance(item, dict) and "rule_id" in item:
+                    ai_map[item["rule_id"]] = item
 
-        try:
-            raw = ai_provider.analyze(prompt)
-            parsed = _parse_ai_json(raw)
-
-            # Handle wrapped format {"results": [...]}
-            if parsed and isinstance(parsed, dict) and "results" in parsed:
-                parsed = parsed["results"]
-
-            if parsed and isinstance(parsed, list):
-                ai_map = {}
-                for item in parsed:
-                    if isinstance(item, dict) and "rule_id" in item:
-                        ai_map[item["rule_id"]] = item
-
-                for rule in batch:
-                    rid = rule.get("id", "unknown")
-                    ai_result = ai_map.get(rid, {})
-                    status = ai_result.get("status", "FAIL").upper()
-                    if status not in ("PASS", "PARTIAL", "FAIL"):
-                        status = "FAIL"
-
-                    all_results.append(MatchResult(
-                        rule_id=rid,
-                        rule_description=rule.get("description", ""),
-                        iso_ref=rule.get("iso_ref", ""),
-                        status=status,
-                        confidence=float(ai_result.get("confidence", 0.0)),
-                        method="ai_text",
-                        evidence=ai_result.get("evidence", []),
-                        severity=rule.get("severity", "critical"),
-                        new_in_2024=rule.get("new_in_2024", False),
-                        details=ai_result.get("reasoning", ""),
-                    ))
-            else:
-                # Batch parse failed — fall back to individual
-                logger.warning(
-                    "AI text batch %d-%d parse failed, trying individual",
-                    batch_start, batch_start + len(batch),
-                )
-                for rule in batch:
-                    all_results.append(ai_verify_rule_text(rule, ocr_text, ai_provider))
-
-        except Exception as e:
-            logger.error("AI text batch error: %s", e)
             for rule in batch:
+                rid = rule.get("id", "unknown")
+                ai_result = ai_map.get(rid, {})
+                status = ai_result.get("status", "FAIL").upper()
+                if status not in ("PASS", "PARTIAL", "FAIL"):
+                    status = "FAIL"
+
                 all_results.append(MatchResult(
-                    rule_id=rule.get("id", "unknown"),
+                    rule_id=rid,
                     rule_description=rule.get("description", ""),
                     iso_ref=rule.get("iso_ref", ""),
-                    status="FAIL",
-                    confidence=0.0,
+                    status=status,
+                    confidence=float(ai_result.get("confidence", 0.0)),
                     method="ai_text",
+                    evidence=ai_result.get("evidence", []),
                     severity=rule.get("severity", "critical"),
                     new_in_2024=rule.get("new_in_2024", False),
-                    details=f"AI text batch error: {e}",
+                    details=ai_result.get("reasoning", ""),
                 ))
+        else:
+            # Batch parse failed — fall back to individual
+            logger.warning(
+                "AI text batch %d-%d parse failed, trying individual",
+                batch_start, batch_start + len(batch),
+            )
+            for rule in batch:
+                all_results.append(ai_verify_rule_text(rule, ocr_text, ai_provider))
+
+    except AIUnavailableError:
+        raise  # not a compliance result — the caller reports it
+    except Exception as e:
+        logger.error("AI text batch error: %s", e)
+        for rule in batch:
+            all_results.append(MatchResult(
+                rule_id=rule.get("id", "unknown"),
+                rule_description=rule.get("description", ""),
+                iso_ref=rule.get("iso_ref", ""),
+                status="FAIL",
+                confidence=0.0,
+                method="ai_text",
+                severity=rule.get("severity", "critical"),
+                new_in_2024=rule.get("new_in_2024", False),
+                details=f"AI text batch error: {e}",
+            ))
 
     return all_results
 
@@ -568,6 +618,8 @@ def ai_verify_rule(
         else:
             logger.warning("AI vision response not parseable for rule %s", rule.get("id"))
 
+    except AIUnavailableError:
+        raise  # not a compliance result — the caller reports it
     except Exception as e:
         logger.error("AI vision failed for rule %s: %s", rule.get("id"), e)
 
@@ -589,78 +641,108 @@ def ai_verify_rules_batch(
     image_path: str | Path,
     ai_provider,
     batch_size: int = 5,
+    executor: AIExecutor | None = None,
 ) -> list[MatchResult]:
     """
     Use multimodal AI vision model to verify rules in small batches.
-    Splits into groups of `batch_size` to avoid overwhelming the model.
+    Splits into groups of `batch_size` to avoid overwhelming the model;
+    batches run concurrently on the AI executor.
     """
-    all_results: list[MatchResult] = []
+    return gather_ai_results(
+        submit_ai_vision_batches(rules, image_path, ai_provider, batch_size, executor),
+    )
 
-    for batch_start in range(0, len(rules), batch_size):
-        batch = rules[batch_start:batch_start + batch_size]
 
-        rules_desc = "\n".join(
-            f"- {r.get('id', '?')}: {r.get('description', '')} "
-            f"(look for: {', '.join(r.get('markers', [])[:5])})"
-            for r in batch
+def submit_ai_vision_batches(
+    rules: list[dict],
+    image_path: str | Path,
+    ai_provider,
+    batch_size: int = 5,
+    executor: AIExecutor | None = None,
+) -> list[Future[list[MatchResult]]]:
+    """Start ``ai_verify_rules_batch`` without waiting — one future per batch."""
+    executor = executor or get_ai_executor()
+    return [
+        executor.submit(
+            _ai_vision_batch, rules[start:start + batch_size], start, image_path, ai_provider,
         )
+        for start in range(0, len(rules), batch_size)
+    ]
+
+
+def _ai_vision_batch(
+    batch: list[dict],
+    batch_start: int,
+    image_path: str | Path,
+    ai_provider,
+) -> list[MatchResult]:
+    """One vision batch: a single AI call, falling back to one call per rule."""
+    all_results: list[MatchResult] = []
+
+    rules_desc = "\n".join(
+        f"- {r.get('id', '?')}: {r.get('description', '')} "
+        f"(look for: {', '.join(r.get('markers', [])[:5])})"
+        for r in batch
+    )
+
+    prompt = _AI_VISION_PROMPT.format(rules_list=rules_desc)
+
+    try:
+        raw = ai_provider.analyze_with_image(prompt, str(image_path))
+        parsed = _parse_ai_json(raw)
+
+        # Handle wrapped format {"results": [...]}
+        if parsed and isinstance(parsed, dict) and "results" in parsed:
+            parsed = parsed["results"]
+
+        if parsed and isinstance(parsed, list):
+            ai_map = {}
+            for item in parsed:
+                if isinstance(item, dict) and "rule_id" in item:
+                    ai_map[item["rule_id"]] = item
 
-        prompt = _AI_VISION_PROMPT.format(rules_list=rules_desc)
-
-        try:
-            raw = ai_provider.analyze_with_image(prompt, str(image_path))
-            parsed = _parse_ai_json(raw)
-
-            # Handle wrapped format {"results": [...]}
-            if parsed and isinstance(parsed, dict) and "results" in parsed:
-                parsed = parsed["results"]
-
-            if parsed and isinstance(parsed, list):
-                ai_map = {}
-                for item in parsed:
-                    if isinstance(item, dict) and "rule_id" in item:
-                        ai_map[item["rule_id"]] = item
-
-                for rule in batch:
-                    rid = rule.get("id", "unknown")
-                    ai_result = ai_map.get(rid, {})
-                    status = ai_result.get("status", "FAIL").upper()
-                    if status not in ("PASS", "PARTIAL", "FAIL"):
-                        status = "FAIL"
-
-                    all_results.append(MatchResult(
-                        rule_id=rid,
-                        rule_description=rule.get("description", ""),
-                        iso_ref=rule.get("iso_ref", ""),
-                        status=status,
-                        confidence=float(ai_result.get("confidence", 0.0)),
-                        method="ai_vision",
-                        evidence=ai_result.get("evidence", []),
-                        severity=rule.get("severity", "critical"),
-                        new_in_2024=rule.get("new_in_2024", False),
-                        details=ai_result.get("reasoning", ""),
-                    ))
-            else:
-                logger.warning(
-                    "AI vision batch %d-%d parse failed, trying individual",
-                    batch_start, batch_start + len(batch),
-                )
-                for rule in batch:
-                    all_results.append(ai_verify_rule(rule, image_path, ai_provider))
-
-        except Exception as e:
-            logger.error("AI vision batch error: %s", e)
             for rule in batch:
+                rid = rule.get("id", "unknown")
+                ai_result = ai_map.get(rid, {})
+                status = ai_result.get("status", "FAIL").upper()
+                if status not in ("PASS", "PARTIAL", "FAIL"):
+                    status = "FAIL"
+
                 all_results.append(MatchResult(
-                    rule_id=rule.get("id", "unknown"),
+                    rule_id=rid,
                     rule_description=rule.get("description", ""),
                     iso_ref=rule.get("iso_ref", ""),
-                    status="FAIL",
-                    confidence=0.0,
+                    status=status,
+                    confidence=float(ai_result.get("confidence", 0.0)),
                     method="ai_vision",
+                    evidence=ai_result.get("evidence", []),
                     severity=rule.get("severity", "critical"),
                     new_in_2024=rule.get("new_in_2024", False),
-                    details=f"AI vision batch error: {e}",
+                    details=ai_result.get("reasoning", ""),
                 ))
+        else:
+            logger.warning(
+                "AI vision batch %d-%d parse failed, trying individual",
+                batch_start, batch_start + len(batch),
+            )
+            for rule in batch:
+                all_results.append(ai_verify_rule(rule, image_path, ai_provider))
+
+    except AIUnavailableError:
+        raise  # not a compliance result — the caller reports it
+    except Exception as e:
+        logger.error("AI vision batch error: %s", e)
+        for rule in batch:
+            all_results.append(MatchResult(
+                rule_id=rule.get("id", "unknown"),
+                rule_description=rule.get("description", ""),
+                iso_ref=rule.get("iso_ref", ""),
+                status="FAIL",
+                confidence=0.0,
+                method="ai_vision",
+                severity=rule.get("severity", "critical"),
+                new_in_2024=rule.get("new_in_2024", False),
+                details=f"AI vision batch error: {e}",
+            ))
 
     return all_results
@@ -7,8 +7,8 @@ Rules define what to check on each label.
 
 from __future__ import annotations
 
-from pathlib import Path
 import importlib
+from pathlib import Path
 
 try:
     yaml = importlib.import_module("yaml")
@@ -17,7 +17,8 @@ except ModuleNotFoundError as exc:  # pragma: no cover
         "PyYAML is required to load compliance rules. Install it with: pip install pyyaml"
     ) from exc
 
-from label_compliance.config import get_settings, get_root
+from label_compliance.compliance.ruleset import clear_compiled_rules, compile_rules
+from label_compliance.config import get_root, get_settings
 from label_compliance.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -69,6 +70,7 @@ def load_rules(rule_files: list[str] | None = None) -> list[dict]:
         logger.info("Loaded %d rules from %s (%s)", len(rules), filename, standard)
 
     _rules_cache[cache_key] = all_rules
+    compile_rules(all_rules)  # marker automaton + regexes, once per rule set
     logger.info("Total rules loaded: %d", len(all_rules))
     return all_rules
 
@@ -92,6 +94,7 @@ def reload_rules() -> list[dict]:
     """Force reload of rules (clears cache)."""
     global _rules_cache
     _rules_cache = {}
+    clear_compiled_rules()
     return load_rules()
 
 
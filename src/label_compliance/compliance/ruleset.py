@@ -0,0 +1,164 @@
+"""
+Compiled Rule Set
+==================
+Evaluates every rule's text markers and regex pattern against a text
+in one call.
+
+``match_rule_text`` and ``detect_symbols_from_ocr`` used to loop
+rules × markers with ``marker.lower() in text`` and run
+``re.search`` on uncompiled patterns — again for every section.  A
+``CompiledRuleSet`` is built once per rule list (``load_rules`` builds
+it alongside its cache):
+
+    - markers are lowered and deduplicated once, so a marker shared by
+      several rules is searched for once per text (``str.find``),
+    - patterns are compiled once (``re.IGNORECASE``) and each distinct
+      pattern is searched once per text.
+
+``scan()`` returns one ``RuleHits`` per rule, in rule order, with the
+matched markers and their offsets.  ``scan_rule()`` is the plain
+per-rule equivalent for one-off calls.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import cache
+
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class RuleHits:
+    """What one rule's markers and pattern matched in a text."""
+
+    markers: list[str] = field(default_factory=list)  # matched markers, in rule order
+    # marker → starts in the lowered text
+    offsets: dict[str, list[int]] = field(default_factory=dict)
+    pattern_value: str | None = None  # first pattern match (None = no match)
+    pattern_span: tuple[int, int] | None = None
+
+    @property
+    def found(self) -> bool:
+        return bool(self.markers) or self.pattern_value is not None
+
+
+# ── Rules ───────────────────────────────────────────
+
+
+@cache
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Rule ``pattern`` as matched everywhere: case-insensitive."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _markers(rule: dict) -> list[str]:
+    return [str(m) for m in rule.get("markers") or []]
+
+
+def _pattern(rule: dict) -> re.Pattern | None:
+    pattern = rule.get("pattern")
+    if not pattern:
+        return None
+    try:
+        return compile_pattern(pattern)
+    except re.error as e:
+        raise ValueError(f"Rule {rule.get('id', '?')}: invalid pattern {pattern!r}: {e}") from e
+
+
+def _apply_pattern(hits: RuleHits, regex: re.Pattern | None, match: re.Match | None) -> None:
+    if regex is not None and match is not None:
+        hits.pattern_value = match.group(0)
+        hits.pattern_span = match.span()
+
+
+def _find_all(text_lower: str, needle: str) -> list[int]:
+    """Start of every (overlapping) occurrence of *needle*."""
+    if not needle:
+        return [0]
+    starts = []
+    pos = text_lower.find(needle)
+    while pos != -1:
+        starts.append(pos)
+        pos = text_lower.find(needle, pos + 1)
+    return starts
+
+
+def scan_rule(rule: dict, text: str, text_lower: str | None = None) -> RuleHits:
+    """One rule against *text*, without a compiled set (same result as ``scan``)."""
+    if text_lower is None:
+        text_lower = text.lower()
+    hits = RuleHits()
+    for marker in _markers(rule):
+        starts = _find_all(text_lower, marker.lower())
+        if starts:
+            hits.markers.append(marker)
+            hits.offsets[marker] = starts
+    regex = _pattern(rule)
+    _apply_pattern(hits, regex, regex.search(text) if regex else None)
+    return hits
+
+
+class CompiledRuleSet:
+    """A rule list prepared for evaluation in one call (see module doc)."""
+
+    def __init__(self, rules: list[dict]):
+        self.rules = rules
+        self._markers = [_markers(rule) for rule in rules]
+        self._regexes = [_pattern(rule) for rule in rules]
+        self._needles = list(dict.fromkeys(m.lower() for ms in self._markers for m in ms))
+        logger.debug(
+            "Compiled %d rules: %d distinct markers, %d patterns",
+            len(rules), len(self._needles),
+            len({r.pattern for r in self._regexes if r is not None}),
+        )
+
+    def scan(self, text: str, text_lower: str | None = None) -> list[RuleHits]:
+        """Evaluate every rule against *text*; one ``RuleHits`` per rule."""
+        if text_lower is None:
+            text_lower = text.lower()
+
+        starts = {needle: _find_all(text_lower, needle) for needle in self._needles}
+
+        matches: dict[re.Pattern, re.Match | None] = {}
+        results = []
+        for markers, regex in zip(self._markers, self._regexes):
+            hits = RuleHits()
+            for marker in markers:
+                found = starts[marker.lower()]
+                if found:
+                    hits.markers.append(marker)
+                    hits.offsets[marker] = found
+            if regex is not None and regex not in matches:
+                matches[regex] = regex.search(text)
+            _apply_pattern(hits, regex, matches.get(regex))
+            results.append(hits)
+        return results
+
+
+# Rule lists with a cached set; the oldest is dropped beyond this
+_MAX_COMPILED = 8
+_compiled: dict[int, CompiledRuleSet] = {}
+
+
+def compile_rules(rules: list[dict]) -> CompiledRuleSet:
+    """The ``CompiledRuleSet`` for this rule list, built on first use.
+
+    Keyed by the list object — the set keeps its list alive, so the id
+    cannot be reused while cached.  ``reload_rules`` clears the cache.
+    """
+    ruleset = _compiled.get(id(rules))
+    if ruleset is None or ruleset.rules is not rules:
+        ruleset = CompiledRuleSet(rules)
+        _compiled.pop(id(rules), None)
+        while len(_compiled) >= _MAX_COMPILED:
+            del _compiled[next(iter(_compiled))]
+        _compiled[id(rules)] = ruleset
+    return ruleset
+
+
+def clear_compiled_rules() -> None:
+    _compiled.clear()
@@ -10,6 +10,9 @@ and what the system *enforces*. Every spec field is consumed here.
 
 Physical measurement: Images are rendered at a known DPI (default 300),
 so pixels can be converted to mm:  mm = pixels * 25.4 / DPI
+
+The checks read the label data through a ``SpecContext`` — built once
+per section, it shares marker lookups and word geometry across rules.
 """
 
 from __future__ import annotations
@@ -18,8 +21,11 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+
 from label_compliance.document.font_analyzer import FontInfo
 from label_compliance.document.ocr import OCRResult, OCRWord
+from label_compliance.document.span_index import SpanIndex
 from label_compliance.document.layout import Zone
 from label_compliance.document.symbol_detector import SymbolMatch
 from label_compliance.document.barcode_reader import BarcodeResult
@@ -90,6 +96,104 @@ class SpecsResult:
         return "FAIL"
 
 
+# ── Spec Context ───────────────────────────────────
+
+
+@dataclass
+class SpecContext:
+    """
+    Everything ``validate_rule_specs`` looks at for one section.
+
+    Built once per section, so the per-rule checks share the lookups
+    instead of each rescanning all OCR words and font spans: marker →
+    words (through the OCR result's word index), marker → font spans,
+    word centres as NumPy arrays, and text-level facts (upper-cased
+    text, detected languages).
+    """
+
+    ocr_result: OCRResult | None = None
+    fonts: list[FontInfo] | None = None
+    zones: list[Zone] | None = None
+    symbols: list[SymbolMatch] | None = None
+    barcodes: list[BarcodeResult] | None = None
+    page_number: int = 0
+    dpi: int = 300
+    image_size: tuple[int, int] = (0, 0)
+    font_index: SpanIndex | None = None
+    _text_upper: str | None = field(default=None, init=False, repr=False)
+    _languages: set[str] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.font_index is None:
+            self.font_index = SpanIndex.from_fonts(self.fonts)
+
+    # ── Words ──
+
+    def word_ids(self, markers: list[str]) -> np.ndarray:
+        """Indices of OCR words matching any marker (one run per marker)."""
+        if not self.ocr_result or not markers:
+            return np.empty(0, dtype=np.int64)
+        index = self.ocr_result.index
+        return np.concatenate([index.find(m) for m in markers])
+
+    def marker_words(self, markers: list[str]) -> list[OCRWord]:
+        """All OCR words matching any of the markers."""
+        words = self.ocr_result.words if self.ocr_result else []
+        return [words[i] for i in self.word_ids(markers)]
+
+    def word_centers(self, ids: np.ndarray) -> np.ndarray:
+        """``(n, 2)`` array of word box centres."""
+        index = self.ocr_result.index
+        return np.column_stack((index.cx[ids], index.cy[ids]))
+
+    # ── Font spans ──
+
+    def font_spans(self, markers: list[str]) -> list[FontInfo]:
+        """Font spans whose text matches any marker, in span order."""
+        if not self.font_index.fonts:
+            return []
+        ids: set[int] = set()
+        for marker in markers:
+            ids.update(self.font_index.find(marker))
+        return [self.font_index.fonts[i] for i in sorted(ids)]
+
+    # ── Text ──
+
+    @property
+    def text_upper(self) -> str:
+        if self._text_upper is None:
+            self._text_upper = self.ocr_result.full_text.upper() if self.ocr_result else ""
+        return self._text_upper
+
+    def languages(self) -> set[str]:
+        """Language codes found in the text (``xx:`` prefixes, language names)."""
+        if self._languages is None:
+            full_text = self.ocr_result.full_text if self.ocr_result else ""
+            found = set(_LANG_PREFIX.findall(full_text))
+            text_lower = self.ocr_result.text_lower if self.ocr_result else ""
+            for name, code in _LANG_NAMES.items():
+                if name in text_lower:
+                    found.add(code)
+            self._languages = found
+        return self._languages
+
+
+# Detect language prefixes (en:, de:, fr:, etc.)
+_LANG_PREFIX = re.compile(r'\b([a-z]{2}):', re.IGNORECASE)
+
+# Also check for common ISO 639-1 language blocks
+# Some labels use section headers like "English", "Français", etc.
+_LANG_NAMES = {
+    "english": "en", "deutsch": "de", "français": "fr",
+    "español": "es", "italiano": "it", "nederlands": "nl",
+    "português": "pt", "polski": "pl", "svenska": "sv",
+    "dansk": "da", "suomi": "fi", "norsk": "no",
+}
+
+# Notified body number: 4 digits directly before/after "CE"
+_NB_NUMBER = re.compile(r'CE\s*(\d{4})|(\d{4})\s*CE', re.IGNORECASE)
+
+
 # ── Main Validation Entry Point ───────────────────────
 
 
@@ -103,6 +207,7 @@ def validate_rule_specs(
     page_number: int = 0,
     dpi: int = 300,
     image_size: tuple[int, int] = (0, 0),
+    context: SpecContext | None = None,
 ) -> SpecsResult:
     """
     Validate ALL specs fields of a rule against actual label data.
@@ -120,6 +225,10 @@ def validate_rule_specs(
     - table_ref: table reference requirements
     - symbol_ref: symbol reference requirements
     - color_requirements: text/symbol color
+
+    Pass *context* (one ``SpecContext`` per section) when validating many
+    rules against the same data; the individual arguments are then
+    ignored.
     """
     specs = rule.get("specs", {})
     rule_id = rule.get("id", "unknown")
@@ -134,92 +243,66 @@ def validate_rule_specs(
         result.add_pass("No specs defined — text matching only")
         return result
 
+    ctx = context or SpecContext(
+        ocr_result=ocr_result, fonts=fonts, zones=zones, symbols=symbols,
+        barcodes=barcodes, page_number=page_number, dpi=dpi, image_size=image_size,
+    )
+
     # ── 1. min_height_mm — physical height check ──────
     if "min_height_mm" in specs:
-        _check_min_height(
-            result, specs, rule_id, severity, iso_ref,
-            ocr_result, fonts, zones, symbols, dpi, page_number, markers,
-        )
+        _check_min_height(result, specs, rule_id, severity, iso_ref, ctx, markers)
 
     # ── 2. min_font_size_pt — font point size check ──
     if "min_font_size_pt" in specs:
-        _check_min_font_size(
-            result, specs, rule_id, severity, iso_ref, fonts, markers, page_number,
-        )
+        _check_min_font_size(result, specs, rule_id, severity, iso_ref, ctx, markers)
 
     # ── 3. font_style — bold/italic requirement ──────
     if "font_style" in specs:
-        _check_font_style(
-            result, specs, rule_id, severity, iso_ref, fonts, markers, page_number,
-        )
+        _check_font_style(result, specs, rule_id, severity, iso_ref, ctx, markers)
 
     # ── 4. must_include — required sub-elements ──────
     if "must_include" in specs:
-        _check_must_include(
-            result, specs, rule_id, severity, iso_ref, ocr_result, page_number,
-        )
+        _check_must_include(result, specs, rule_id, severity, iso_ref, ctx)
 
     # ── 5. must_be_adjacent_to — positional check ────
     if "must_be_adjacent_to" in specs:
-        _check_adjacency(
-            result, specs, rule_id, severity, iso_ref,
-            ocr_result, markers, dpi, page_number,
-        )
+        _check_adjacency(result, specs, rule_id, severity, iso_ref, ctx, markers)
 
     # ── 6. position — required placement zone ────────
     if "position" in specs:
-        _check_position(
-            result, specs, rule_id, severity, iso_ref,
-            ocr_result, markers, image_size, page_number,
-        )
+        _check_position(result, specs, rule_id, severity, iso_ref, ctx, markers)
 
     # ── 7. valid_classifications — allowed values ────
     if "valid_classifications" in specs:
-        _check_valid_classifications(
-            result, specs, rule_id, severity, iso_ref, ocr_result, page_number,
-        )
+        _check_valid_classifications(result, specs, rule_id, severity, iso_ref, ctx)
 
     # ── 8. min_languages — multilingual check ────────
     if "min_languages" in specs:
-        _check_min_languages(
-            result, specs, rule_id, severity, iso_ref, ocr_result, page_number,
-        )
+        _check_min_languages(result, specs, rule_id, severity, iso_ref, ctx)
 
     # ── 9. formats — barcode format requirements ─────
     if "formats" in specs:
-        _check_barcode_formats(
-            result, specs, rule_id, severity, iso_ref, barcodes, page_number,
-        )
+        _check_barcode_formats(result, specs, rule_id, severity, iso_ref, ctx)
 
     # ── 10. must_include_nb_number — notified body ───
     if specs.get("must_include_nb_number"):
-        _check_nb_number(
-            result, specs, rule_id, severity, iso_ref, ocr_result, page_number,
-        )
+        _check_nb_number(result, specs, rule_id, severity, iso_ref, ctx)
 
     # ── 11. valid_methods — sterilization methods ────
     if "valid_methods" in specs:
-        _check_valid_methods(
-            result, specs, rule_id, severity, iso_ref, ocr_result, page_number,
-        )
+        _check_valid_methods(result, specs, rule_id, severity, iso_ref, ctx)
 
     # ── 12. table_ref — table reference ──────────────
     if "table_ref" in specs:
-        _check_table_ref(
-            result, specs, rule_id, severity, iso_ref, ocr_result, page_number,
-        )
+        _check_table_ref(result, specs, rule_id, severity, iso_ref, ctx)
 
     # ── 13. color_requirements ───────────────────────
     if "color_requirements" in specs:
-        _check_color(
-            result, specs, rule_id, severity, iso_ref, fonts, markers, page_number,
-        )
+        _check_color(result, specs, rule_id, severity, iso_ref, ctx, markers)
 
     # ── 14. min_contrast_ratio ───────────────────────
     if "min_contrast_ratio" in specs:
-        _check_contrast(
-            result, specs, rule_id, severity, iso_ref, fonts, markers, page_number,
-        )
+        _check_contrast(result, specs, rule_id, severity, iso_ref, ctx, markers)
 
     return result
 
@@ -229,53 +312,21 @@ def validate_rule_specs(
 # ═══════════════════════════════════════════════════════
 
 
-def _find_marker_words(
-    ocr_result: OCRResult | None, markers: list[str],
-) -> list[OCRWord]:
-    """Find all OCR words matching any of the markers."""
-    if not ocr_result:
-        return []
-    words = []
-    for marker in markers:
-        words.extend(ocr_result.find_text(marker))
-    return words
-
-
-def _find_font_spans_for_markers(
-    fonts: list[FontInfo] | None, markers: list[str],
-) -> list[FontInfo]:
-    """Find font spans whose text matches any marker."""
-    if not fonts:
-        return []
-    spans = []
-    for f in fonts:
-        text_lower = f.text.lower()
-        for marker in markers:
-            if marker.lower() in text_lower:
-                spans.append(f)
-                break
-    return spans
-
-
 def _check_min_height(
     result: SpecsResult,
     specs: dict,
     rule_id: str,
     severity: str,
     iso_ref: str,
-    ocr_result: OCRResult | None,
-    fonts: list[FontInfo] | None,
-    zones: list[Zone] | None,
-    symbols: list[SymbolMatch] | None,
-    dpi: int,
-    page_number: int,
+    ctx: SpecContext,
     markers: list[str],
 ) -> None:
     """Check physical height of text/symbol meets min_height_mm."""
+    symbols, dpi, page_number = ctx.symbols, ctx.dpi, ctx.page_number
     min_h_mm = specs["min_height_mm"]
 
     # Strategy 1: Check font spans from PDF (most accurate for text)
-    font_spans = _find_font_spans_for_markers(fonts, markers)
+    font_spans = ctx.font_spans(markers)
     if font_spans:
         for span in font_spans:
             actual_h_mm = pt_to_mm(span.size)
@@ -298,7 +349,7 @@ def _check_min_height(
         return
 
     # Strategy 2: Check OCR word bounding boxes (for image-based symbols)
-    marker_words = _find_marker_words(ocr_result, markers)
+    marker_words = ctx.marker_words(markers)
     if marker_words:
         for word in marker_words:
             actual_h_mm = px_to_mm(word.h, dpi)
@@ -363,13 +414,13 @@ def _check_min_font_size(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    fonts: list[FontInfo] | None,
+    ctx: SpecContext,
     markers: list[str],
-    page_number: int,
 ) -> None:
     """Check font size meets minimum point size requirement."""
+    page_number = ctx.page_number
     min_pt = specs["min_font_size_pt"]
-    spans = _find_font_spans_for_markers(fonts, markers)
+    spans = ctx.font_spans(markers)
 
     if not spans:
         result.add_violation(SpecViolation(
@@ -408,13 +459,13 @@ def _check_font_style(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    fonts: list[FontInfo] | None,
+    ctx: SpecContext,
     markers: list[str],
-    page_number: int,
 ) -> None:
     """Check font style (bold/italic) requirements."""
+    page_number = ctx.page_number
     required_style = specs["font_style"]  # "bold", "italic", "bold_italic"
-    spans = _find_font_spans_for_markers(fonts, markers)
+    spans = ctx.font_spans(markers)
 
     if not spans:
         result.add_violation(SpecViolation(
@@ -466,10 +517,10 @@ def _check_must_include(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    ocr_result: OCRResult | None,
-    page_number: int,
+    ctx: SpecContext,
 ) -> None:
     """Check that all required sub-elements are present in text."""
+    ocr_result, page_number = ctx.ocr_result, ctx.page_number
     must_include = specs["must_include"]
     if not ocr_result:
         for item in must_include:
@@ -525,10 +576,8 @@ def _check_adjacency(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    ocr_result: OCRResult | None,
+    ctx: SpecContext,
     markers: list[str],
-    dpi: int,
-    page_number: int,
 ) -> None:
     """
     Check that a symbol/text is adjacent to (near) another element.
@@ -536,6 +585,7 @@ def _check_adjacency(
     Adjacency = the two elements' bounding boxes are within a threshold
     distance (default 15mm, ~177px at 300dpi).
     """
+    ocr_result, dpi, page_number = ctx.ocr_result, ctx.dpi, ctx.page_number
     adjacent_to = specs["must_be_adjacent_to"]
     max_distance_mm = specs.get("adjacency_max_mm", 15.0)
     max_distance_px = mm_to_px(max_distance_mm, dpi)
@@ -552,12 +602,11 @@ def _check_adjacency(
         ))
         return
 
-    # Find words for the marker element
-    marker_words = _find_marker_words(ocr_result, markers)
-    # Find words for the adjacent element
-    adjacent_words = ocr_result.find_text(adjacent_to)
+    # Word ids for the marker element and for the adjacent element
+    marker_ids = ctx.word_ids(markers)
+    adjacent_ids = ctx.word_ids([adjacent_to])
 
-    if not marker_words:
+    if not marker_ids.size:
         result.add_violation(SpecViolation(
             rule_id=rule_id,
             spec_field="must_be_adjacent_to",
@@ -569,7 +618,7 @@ def _check_adjacency(
         ))
         return
 
-    if not adjacent_words:
+    if not adjacent_ids.size:
         result.add_violation(SpecViolation(
             rule_id=rule_id,
             spec_field="must_be_adjacent_to",
@@ -582,19 +631,13 @@ def _check_adjacency(
         return
 
     # Check closest distance between any marker word and any adjacent word
-    min_dist_px = float("inf")
-    best_pair = (None, None)
-
-    for mw in marker_words:
-        mx_center = mw.x + mw.w / 2
-        my_center = mw.y + mw.h / 2
-        for aw in adjacent_words:
-            ax_center = aw.x + aw.w / 2
-            ay_center = aw.y + aw.h / 2
-            dist = ((mx_center - ax_center) ** 2 + (my_center - ay_center) ** 2) ** 0.5
-            if dist < min_dist_px:
-                min_dist_px = dist
-                best_pair = (mw, aw)
+    # (all pairs at once; argmin keeps the first closest pair in word order)
+    delta = ctx.word_centers(marker_ids)[:, None, :] - ctx.word_centers(adjacent_ids)[None, :, :]
+    dists = np.sqrt((delta ** 2).sum(axis=2))
+    mi, ai = np.unravel_index(int(np.argmin(dists)), dists.shape)
+    min_dist_px = float(dists[mi, ai])
+    words = ocr_result.words
+    best_pair = (words[marker_ids[mi]], words[adjacent_ids[ai]])
 
     min_dist_mm = px_to_mm(min_dist_px, dpi)
 
@@ -627,10 +670,8 @@ def _check_position(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    ocr_result: OCRResult | None,
+    ctx: SpecContext,
     markers: list[str],
-    image_size: tuple[int, int],
-    page_number: int,
 ) -> None:
     """
     Check that an element appears in the required zone of the label.
@@ -640,6 +681,7 @@ def _check_position(
 
     The image is divided into a 3x3 grid for zone detection.
     """
+    ocr_result, image_size, page_number = ctx.ocr_result, ctx.image_size, ctx.page_number
     required_position = specs["position"]
     if not ocr_result or image_size == (0, 0):
         result.add_violation(SpecViolation(
@@ -653,8 +695,8 @@ def _check_position(
         ))
         return
 
-    marker_words = _find_marker_words(ocr_result, markers)
-    if not marker_words:
+    marker_ids = ctx.word_ids(markers)
+    if not marker_ids.size:
         result.add_violation(SpecViolation(
             rule_id=rule_id,
             spec_field="position",
@@ -668,8 +710,7 @@ def _check_position(
 
     img_w, img_h = image_size
     # Use the centroid of all marker words
-    cx = sum(w.x + w.w / 2 for w in marker_words) / len(marker_words)
-    cy = sum(w.y + w.h / 2 for w in marker_words) / len(marker_words)
+    cx, cy = (float(c) for c in ctx.word_centers(marker_ids).sum(axis=0) / marker_ids.size)
 
     # Determine which zone the element is in
     x_zone = "left" if cx < img_w / 3 else ("right" if cx > 2 * img_w / 3 else "center")
@@ -723,10 +764,10 @@ def _check_valid_classifications(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    ocr_result: OCRResult | None,
-    page_number: int,
+    ctx: SpecContext,
 ) -> None:
     """Check that a valid classification code appears in the text."""
+    ocr_result, page_number = ctx.ocr_result, ctx.page_number
     valid = specs["valid_classifications"]
     if not ocr_result:
         result.add_violation(SpecViolation(
@@ -740,7 +781,7 @@ def _check_valid_classifications(
         ))
         return
 
-    text_upper = ocr_result.full_text.upper()
+    text_upper = ctx.text_upper
     found_codes = []
 
     for item in valid:
@@ -774,10 +815,10 @@ def _check_min_languages(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    ocr_result: OCRResult | None,
-    page_number: int,
+    ctx: SpecContext,
 ) -> None:
     """Check minimum number of languages present."""
+    ocr_result, page_number = ctx.ocr_result, ctx.page_number
     min_langs = specs["min_languages"]
     if not ocr_result:
         result.add_violation(SpecViolation(
@@ -791,22 +832,7 @@ def _check_min_languages(
         ))
         return
 
-    # Detect language prefixes (en:, de:, fr:, etc.)
-    lang_pattern = re.compile(r'\b([a-z]{2}):', re.IGNORECASE)
-    found_langs = set(lang_pattern.findall(ocr_result.full_text))
-
-    # Also check for common ISO 639-1 language blocks
-    # Some labels use section headers like "English", "Français", etc.
-    lang_names = {
-        "english": "en", "deutsch": "de", "français": "fr",
-        "español": "es", "italiano": "it", "nederlands": "nl",
-        "português": "pt", "polski": "pl", "svenska": "sv",
-        "dansk": "da", "suomi": "fi", "norsk": "no",
-    }
-    text_lower = ocr_result.text_lower
-    for name, code in lang_names.items():
-        if name in text_lower:
-            found_langs.add(code)
+    found_langs = ctx.languages()
 
     if len(found_langs) >= min_langs:
         result.add_pass(
@@ -831,10 +857,10 @@ def _check_barcode_formats(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    barcodes: list[BarcodeResult] | None,
-    page_number: int,
+    ctx: SpecContext,
 ) -> None:
     """Check that required barcode formats are present."""
+    barcodes, page_number = ctx.barcodes, ctx.page_number
     required_formats = specs["formats"]
     if not barcodes:
         result.add_violation(SpecViolation(
@@ -885,10 +911,10 @@ def _check_nb_number(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    ocr_result: OCRResult | None,
-    page_number: int,
+    ctx: SpecContext,
 ) -> None:
     """Check that a notified body number appears next to CE mark."""
+    ocr_result, page_number = ctx.ocr_result, ctx.page_number
     if not ocr_result:
         result.add_violation(SpecViolation(
             rule_id=rule_id,
@@ -902,8 +928,7 @@ def _check_nb_number(
         return
 
     # Look for 4-digit notified body number near "CE"
-    nb_pattern = re.compile(r'CE\s*(\d{4})|(\d{4})\s*CE', re.IGNORECASE)
-    match = nb_pattern.search(ocr_result.full_text)
+    match = _NB_NUMBER.search(ocr_result.full_text)
 
     if match:
         nb_num = match.group(1) or match.group(2)
@@ -942,10 +967,10 @@ def _check_valid_methods(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    ocr_result: OCRResult | None,
-    page_number: int,
+    ctx: SpecContext,
 ) -> None:
     """Check that a valid sterilization method is indicated."""
+    ocr_result, page_number = ctx.ocr_result, ctx.page_number
     valid_methods = specs["valid_methods"]
     if not ocr_result:
         result.add_violation(SpecViolation(
@@ -991,10 +1016,10 @@ def _check_table_ref(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    ocr_result: OCRResult | None,
-    page_number: int,
+    ctx: SpecContext,
 ) -> None:
     """Check that a referenced table's content is present."""
+    ocr_result, page_number = ctx.ocr_result, ctx.page_number
     table_ref = specs["table_ref"]
     if not ocr_result:
         result.add_violation(SpecViolation(
@@ -1019,7 +1044,7 @@ def _check_table_ref(
             codes = [
                 (c.get("code", "") if isinstance(c, dict) else str(c)) for c in valid
             ]
-            found = [c for c in codes if c.upper() in ocr_result.full_text.upper()]
+            found = [c for c in codes if c.upper() in ctx.text_upper]
             if found:
                 result.add_pass(
                     f"Table {table_ref} content present via codes: {found}"
@@ -1043,11 +1068,11 @@ def _check_color(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    fonts: list[FontInfo] | None,
+    ctx: SpecContext,
     markers: list[str],
-    page_number: int,
 ) -> None:
     """Check text/symbol color requirements."""
+    page_number = ctx.page_number
     color_req = specs["color_requirements"]
     required_color = color_req if isinstance(color_req, str) else color_req.get("color", "black")
 
@@ -1060,7 +1085,7 @@ def _check_color(
         "white": 0xFFFFFF,
     }
 
-    spans = _find_font_spans_for_markers(fonts, markers)
+    spans = ctx.font_spans(markers)
     if not spans:
         result.add_violation(SpecViolation(
             rule_id=rule_id,
@@ -1103,17 +1128,17 @@ def _check_contrast(
     rule_id: str,
     severity: str,
     iso_ref: str,
-    fonts: list[FontInfo] | None,
+    ctx: SpecContext,
     markers: list[str],
-    page_number: int,
 ) -> None:
     """
     Basic contrast ratio check between text and background.
     This is a simplified check — full WCAG contrast requires
     sampling the actual background color behind the text.
     """
+    page_number = ctx.page_number
     min_ratio = specs["min_contrast_ratio"]
-    spans = _find_font_spans_for_markers(fonts, markers)
+    spans = ctx.font_spans(markers)
 
     if not spans:
         result.add_violation(SpecViolation(
@@ -33,6 +33,7 @@ class PathSettings:
     redline_dir: Path = field(default_factory=lambda: ROOT / "outputs" / "redlines")
     report_dir: Path = field(default_factory=lambda: ROOT / "outputs" / "reports")
     log_dir: Path = field(default_factory=lambda: ROOT / "outputs" / "logs")
+    cache_dir: Path = field(default_factory=lambda: ROOT / "data" / "cache")
 
 
 @dataclass
@@ -41,6 +42,9 @@ class KBSettings:
     chunk_size: int = 500
     chunk_overlap: int = 50
     embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_cache: bool = True
+    embedding_cache_mb: int = 256
+    vector_backend: str = "chromadb"  # "chromadb" | "numpy"
 
 
 @dataclass
@@ -49,6 +53,19 @@ class DocumentSettings:
     ocr_language: str = "eng"
     ocr_min_confidence: int = 30
     ocr_preprocess: list[str] = field(default_factory=lambda: ["grayscale", "threshold", "denoise"])
+    page_cache_mb: int = 512
+    save_page_images: bool = False
+    vector_fast_path: bool = True
+    ocr_cache: bool = True
+    ocr_cache_mb: int = 512
+    ocr_workers: int = 0  # 0 = auto
+    ocr_probe: bool = True
+    ocr_probe_margin: float = 0.25
+    ocr_target_confidence: int = 85
+    ocr_target_words: int = 150
+    ocr_tile_above: int = 6000  # 0 = never tile
+    ocr_tile_px: int = 2048
+    ocr_tile_overlap: int = 256
 
 
 @dataclass
@@ -97,6 +114,22 @@ class AISettings:
     ai_mode: str = "smart"
     # Max rules per batch for AI (smaller = better accuracy for small models)
     batch_size: int = 5
+    # Concurrent AI calls (1 = sequential) and shared rate limits (0 = unlimited)
+    max_concurrency: int = 4
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+    # Response cache (ai/cache.py): "off", "read" or "readwrite"
+    cache: str = "readwrite"
+    cache_mb: int = 256
+    cache_ttl_days: float = 30
+    # Resilience (ai/resilience.py): retries with jittered backoff, per-call
+    # timeout (seconds, 0 = none) and the circuit breaker
+    max_retries: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    request_timeout: float = 120.0
+    breaker_threshold: int = 5
+    breaker_cooldown: float = 60.0
     # Redline (o3 vision) settings
     redline_model: str = "o3"
     redline_pass0_reasoning_effort: str = "low"
@@ -105,6 +138,12 @@ class AISettings:
     redline_pass0_max_completion_tokens: int = 16000
     redline_pass1_max_completion_tokens: int = 16000
     redline_pass2_max_completion_tokens: int = 8000
+    # Pages to review (1-based, e.g. "1-3,5"; "all" = every page) and how
+    # many page pipelines (Pass 0 + Pass 1) run at once
+    redline_pages: str = "all"
+    redline_page_concurrency: int = 3
+    # Reuse the compiled KB/symbol/rules prompt context (redline/context_bundle.py)
+    redline_context_cache: bool = True
     # Panel filtering controls for redline pipeline
     redline_skip_panel_types: list[str] = field(
         default_factory=lambda: [
@@ -166,6 +205,22 @@ class Settings:
 
 _settings: Settings | None = None
 
+# Modes of the AI response cache (ai/cache.py)
+AI_CACHE_MODES = ("off", "read", "readwrite")
+
+
+def _ai_cache_mode(value) -> str:
+    """``ai.cache`` as a mode — YAML 1.1 reads a bare ``off``/``on`` as a boolean."""
+    if isinstance(value, bool):
+        return "readwrite" if value else "off"
+    mode = str(value).strip().lower()
+    if mode not in AI_CACHE_MODES:
+        raise ValueError(
+            f"Invalid ai.cache {value!r} in {SETTINGS_FILE.name} "
+            f"(expected one of: {', '.join(AI_CACHE_MODES)})"
+        )
+    return mode
+
 
 def _load_yaml() -> dict:
     """Load the YAML config file."""
@@ -197,6 +252,9 @@ def get_settings() -> Settings:
         chunk_size=kb_raw.get("chunk_size", 500),
         chunk_overlap=kb_raw.get("chunk_overlap", 50),
         embedding_model=os.getenv("EMBEDDING_MODEL", kb_raw.get("embedding_model", "all-MiniLM-L6-v2")),
+        embedding_cache=kb_raw.get("embedding_cache", True),
+        embedding_cache_mb=kb_raw.get("embedding_cache_mb", 256),
+        vector_backend=kb_raw.get("vector_backend", "chromadb"),
     )
 
     doc_raw = raw.get("document", {})
@@ -205,6 +263,19 @@ def get_settings() -> Settings:
         ocr_language=doc_raw.get("ocr_language", "eng"),
         ocr_min_confidence=doc_raw.get("ocr_min_confidence", 30),
         ocr_preprocess=doc_raw.get("ocr_preprocess", ["grayscale", "threshold", "denoise"]),
+        page_cache_mb=int(doc_raw.get("page_cache_mb", 512)),
+        save_page_images=bool(doc_raw.get("save_page_images", False)),
+        vector_fast_path=bool(doc_raw.get("vector_fast_path", True)),
+        ocr_cache=bool(doc_raw.get("ocr_cache", True)),
+        ocr_cache_mb=int(doc_raw.get("ocr_cache_mb", 512)),
+        ocr_workers=int(doc_raw.get("ocr_workers", 0)),
+        ocr_probe=bool(doc_raw.get("ocr_probe", True)),
+        ocr_probe_margin=float(doc_raw.get("ocr_probe_margin", 0.25)),
+        ocr_target_confidence=int(doc_raw.get("ocr_target_confidence", 85)),
+        ocr_target_words=int(doc_raw.get("ocr_target_words", 150)),
+        ocr_tile_above=int(doc_raw.get("ocr_tile_above", 6000)),
+        ocr_tile_px=int(doc_raw.get("ocr_tile_px", 2048)),
+        ocr_tile_overlap=int(doc_raw.get("ocr_tile_overlap", 256)),
     )
 
     comp_raw = raw.get("compliance", {})
@@ -240,6 +311,18 @@ def get_settings() -> Settings:
         enable_reasoning=ai_raw.get("enable_reasoning", True),
         ai_mode=ai_raw.get("ai_mode", "smart"),
         batch_size=ai_raw.get("batch_size", 5),
+        max_concurrency=ai_raw.get("max_concurrency", 4),
+        requests_per_minute=ai_raw.get("requests_per_minute", 0),
+        tokens_per_minute=ai_raw.get("tokens_per_minute", 0),
+        cache=_ai_cache_mode(ai_raw.get("cache", "readwrite")),
+        cache_mb=ai_raw.get("cache_mb", 256),
+        cache_ttl_days=ai_raw.get("cache_ttl_days", 30),
+        max_retries=ai_raw.get("max_retries", 3),
+        backoff_base=ai_raw.get("backoff_base", 1.0),
+        backoff_max=ai_raw.get("backoff_max", 30.0),
+        request_timeout=ai_raw.get("request_timeout", 120.0),
+        breaker_threshold=ai_raw.get("breaker_threshold", 5),
+        breaker_cooldown=ai_raw.get("breaker_cooldown", 60.0),
         redline_model=ai_raw.get("redline_model", "o3"),
         redline_pass0_reasoning_effort=ai_raw.get("redline_pass0_reasoning_effort", "low"),
         redline_pass1_reasoning_effort=ai_raw.get("redline_pass1_reasoning_effort", "medium"),
@@ -247,6 +330,9 @@ def get_settings() -> Settings:
         redline_pass0_max_completion_tokens=ai_raw.get("redline_pass0_max_completion_tokens", 16000),
         redline_pass1_max_completion_tokens=ai_raw.get("redline_pass1_max_completion_tokens", 16000),
         redline_pass2_max_completion_tokens=ai_raw.get("redline_pass2_max_completion_tokens", 8000),
+        redline_pages=str(ai_raw.get("redline_pages", "all")),
+        redline_page_concurrency=ai_raw.get("redline_page_concurrency", 3),
+        redline_context_cache=ai_raw.get("redline_context_cache", True),
         redline_skip_panel_types=ai_raw.get(
             "redline_skip_panel_types",
             ["data_table", "title_block", "revision_table", "notes_block", "drawing_info"],
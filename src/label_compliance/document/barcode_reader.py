@@ -16,10 +16,14 @@ from pathlib import Path
 import cv2
 import numpy as np
 
+from label_compliance.document.page_images import PageImage, as_page_image
 from label_compliance.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+# Dense 2D codes (DataMatrix) lose modules below full resolution
+BARCODE_LEVEL = "native"
+
 # On macOS ARM, Homebrew installs libraries to /opt/homebrew/lib which isn't
 # in the default dynamic linker search path.  pyzbar uses ctypes.util.find_library
 # which relies on DYLD_LIBRARY_PATH.  We add the path before pyzbar is imported.
@@ -49,14 +53,15 @@ class BarcodeResult:
     expiry: str | None = None
 
 
-def read_barcodes(image_path: Path) -> list[BarcodeResult]:
+def read_barcodes(image_path: Path | PageImage) -> list[BarcodeResult]:
     """
     Read all barcodes from an image.
 
     Uses pyzbar for 1D/2D barcode decoding.
     Falls back to OpenCV detection if pyzbar not available.
     """
-    img = cv2.imread(str(image_path))
+    source = as_page_image(image_path).at(BARCODE_LEVEL)
+    img = source.bgr
     if img is None:
         return []
 
@@ -65,7 +70,7 @@ def read_barcodes(image_path: Path) -> list[BarcodeResult]:
     try:
         from pyzbar.pyzbar import decode, ZBarSymbol
 
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        gray = source.gray
 
         # Try multiple preprocessing approaches
         images_to_scan = [
@@ -104,7 +109,7 @@ def read_barcodes(image_path: Path) -> list[BarcodeResult]:
     except ImportError:
         logger.warning("pyzbar not available — barcode scanning disabled")
 
-    logger.debug("Barcodes found in %s: %d", image_path.name, len(results))
+    logger.debug("Barcodes found in %s: %d", source.name, len(results))
     return results
 
 
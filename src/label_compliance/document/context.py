@@ -0,0 +1,215 @@
+"""
+Document Context
+=================
+Per-label parse cache shared by every document module.
+
+A label check used to open the same PDF a dozen times — pdfplumber in
+``read_pdf``, the segmenter's revision / configuration tables, PyMuPDF
+in page classification (twice), segmentation, font extraction,
+rendering and image extraction — and each pass re-ran
+``page.get_text("dict")`` or ``extract_tables()``.
+
+``DocumentContext`` owns **one** PyMuPDF ``Document`` and **one**
+pdfplumber handle (both opened lazily) and memoizes the per-page
+artefacts those modules need:
+
+    text_dict(n)      → ``page.get_text("dict")`` (whitespace preserved)
+    text(n)           → ``page.get_text()``
+    words(n)          → ``page.get_text("words")``
+    spans(n)          → text spans from the text dict
+    span_index        → ``SpanIndex`` over every page's spans (fonts)
+    plumber_text(n)   → pdfplumber ``extract_text()``
+    tables(n)         → pdfplumber ``extract_tables()`` (raw cells)
+    images(n)         → ``page.get_images(full=True)``
+    extract_image(x)  → ``doc.extract_image(xref)``
+
+It also carries the label's extracted embedded images (``embedded``,
+keyed by xref) so the segmenter and the checker write and OCR each
+embedded raster once — see ``image_extractor``.
+
+Page numbers are 1-based, like everywhere else in the package.
+
+Document functions accept either a path or a context::
+
+    with DocumentContext(pdf_path) as ctx:
+        pdf_data = read_pdf(ctx)
+        seg = segment_pdf(ctx)
+        fonts = extract_fonts(ctx)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import fitz  # PyMuPDF
+
+from label_compliance.utils.log import get_logger
+
+if TYPE_CHECKING:
+    from label_compliance.document.image_extractor import EmbeddedImage
+    from label_compliance.document.span_index import SpanIndex
+
+logger = get_logger(__name__)
+
+
+class DocumentContext:
+    """One parsed label PDF with lazily memoized per-page data."""
+
+    def __init__(self, pdf_path: Path | str):
+        self.path = Path(pdf_path)
+        self._doc: fitz.Document | None = None
+        self._plumber = None
+        self._text_dicts: dict[int, dict] = {}
+        self._texts: dict[int, str] = {}
+        self._words: dict[int, list[tuple]] = {}
+        self._spans: dict[int, list[dict]] = {}
+        self._plumber_texts: dict[int, str] = {}
+        self._tables: dict[int, list] = {}
+        self._images: dict[int, list[tuple]] = {}
+        self._extracted: dict[int, dict] = {}
+        self._span_index: SpanIndex | None = None
+        # Saved embedded images (and their OCR), shared across stages
+        self.embedded: dict[int, EmbeddedImage] = {}
+
+    # ── Lifecycle ──────────────────────────────────────
+
+    def __enter__(self) -> DocumentContext:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close both underlying handles (memoized data stays usable)."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        if self._plumber is not None:
+            self._plumber.close()
+            self._plumber = None
+
+    # ── Handles ────────────────────────────────────────
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def doc(self) -> fitz.Document:
+        """The shared PyMuPDF document (opened on first use)."""
+        if self._doc is None:
+            self._doc = fitz.open(str(self.path))
+        return self._doc
+
+    @property
+    def plumber(self):
+        """The shared pdfplumber PDF (opened on first use)."""
+        if self._plumber is None:
+            import pdfplumber
+            self._plumber = pdfplumber.open(str(self.path))
+        return self._plumber
+
+    @property
+    def page_count(self) -> int:
+        return len(self.doc)
+
+    @property
+    def page_numbers(self) -> range:
+        return range(1, self.page_count + 1)
+
+    @property
+    def metadata(self) -> dict:
+        return dict(self.doc.metadata) if self.doc.metadata else {}
+
+    def page(self, page_number: int) -> fitz.Page:
+        return self.doc[page_number - 1]
+
+    def plumber_page(self, page_number: int):
+        return self.plumber.pages[page_number - 1]
+
+    # ── Memoized PyMuPDF artefacts ────────────────────
+
+    def text_dict(self, page_number: int) -> dict:
+        if page_number not in self._text_dicts:
+            self._text_dicts[page_number] = self.page(page_number).get_text(
+                "dict", flags=fitz.TEXT_PRESERVE_WHITESPACE,
+            )
+        return self._text_dicts[page_number]
+
+    def blocks(self, page_number: int) -> list[dict]:
+        return self.text_dict(page_number).get("blocks", [])
+
+    def text(self, page_number: int) -> str:
+        if page_number not in self._texts:
+            self._texts[page_number] = self.page(page_number).get_text()
+        return self._texts[page_number]
+
+    def words(self, page_number: int) -> list[tuple]:
+        """``(x0, y0, x1, y1, word, block_no, line_no, word_no)`` in PDF points."""
+        if page_number not in self._words:
+            self._words[page_number] = self.page(page_number).get_text("words")
+        return self._words[page_number]
+
+    @property
+    def full_text(self) -> str:
+        return "\n".join(self.text(n) for n in self.page_numbers)
+
+    def spans(self, page_number: int) -> list[dict]:
+        """All text spans on a page, in reading order."""
+        if page_number not in self._spans:
+            self._spans[page_number] = [
+                span
+                for block in self.blocks(page_number)
+                if block.get("type") == 0
+                for line in block.get("lines", [])
+                for span in line.get("spans", [])
+            ]
+        return self._spans[page_number]
+
+    @property
+    def span_index(self) -> SpanIndex:
+        """Columnar index of all text spans (fonts), built on first use."""
+        if self._span_index is None:
+            from label_compliance.document.span_index import SpanIndex
+            self._span_index = SpanIndex.from_context(self)
+        return self._span_index
+
+    def images(self, page_number: int) -> list[tuple]:
+        if page_number not in self._images:
+            self._images[page_number] = self.page(page_number).get_images(full=True)
+        return self._images[page_number]
+
+    def extract_image(self, xref: int) -> dict:
+        """Decoded embedded image (``{"image", "ext", "width", "height", ...}``)."""
+        if xref not in self._extracted:
+            self._extracted[xref] = self.doc.extract_image(xref)
+        return self._extracted[xref]
+
+    # ── Memoized pdfplumber artefacts ─────────────────
+
+    def plumber_text(self, page_number: int) -> str:
+        if page_number not in self._plumber_texts:
+            self._plumber_texts[page_number] = self.plumber_page(page_number).extract_text() or ""
+        return self._plumber_texts[page_number]
+
+    def tables(self, page_number: int) -> list[list[list]]:
+        """Raw pdfplumber tables (cells may be ``None``)."""
+        if page_number not in self._tables:
+            self._tables[page_number] = self.plumber_page(page_number).extract_tables() or []
+        return self._tables[page_number]
+
+
+@contextmanager
+def use_context(source: Path | str | DocumentContext) -> Iterator[DocumentContext]:
+    """Yield a context for *source*, closing it afterwards only if we opened it."""
+    if isinstance(source, DocumentContext):
+        yield source
+        return
+    ctx = DocumentContext(source)
+    try:
+        yield ctx
+    finally:
+        ctx.close()
@@ -10,8 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-import fitz  # PyMuPDF
-
+from label_compliance.document.context import DocumentContext, use_context
 from label_compliance.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -31,45 +30,24 @@ class FontInfo:
     bbox: tuple[float, float, float, float] = (0, 0, 0, 0)
 
 
-def extract_fonts(pdf_path: Path) -> list[FontInfo]:
+def extract_fonts(pdf_path: Path | DocumentContext) -> list[FontInfo]:
     """
     Extract all font usage from a PDF with context.
 
     Returns a list of FontInfo objects, one per text span,
     with font name, size, style, and the text rendered in that font.
+    Accepts a path or a shared ``DocumentContext``; with a context the
+    list is the one held by ``ctx.span_index`` (shared, don't mutate).
     """
     fonts: list[FontInfo] = []
 
-    try:
-        doc = fitz.open(str(pdf_path))
-        for page_num, page in enumerate(doc, 1):
-            blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)["blocks"]
-            for block in blocks:
-                if block.get("type") != 0:
-                    continue
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        text = span.get("text", "").strip()
-                        if not text:
-                            continue
-
-                        flags = span.get("flags", 0)
-                        fonts.append(FontInfo(
-                            name=span.get("font", "unknown"),
-                            size=round(span.get("size", 0), 1),
-                            is_bold=bool(flags & 2**4),   # bit 4 = bold
-                            is_italic=bool(flags & 2**1),  # bit 1 = italic
-                            color=span.get("color", 0),
-                            text=text[:200],
-                            page=page_num,
-                            bbox=tuple(span.get("bbox", (0, 0, 0, 0))),
-                        ))
-
-        doc.close()
-    except Exception:
-        logger.exception("Font extraction failed: %s", pdf_path.name)
-
-    logger.debug("Extracted %d font spans from %s", len(fonts), pdf_path.name)
+    with use_context(pdf_path) as ctx:
+        try:
+            fonts = ctx.span_index.fonts
+        except Exception:
+            logger.exception("Font extraction failed: %s", ctx.name)
+
+        logger.debug("Extracted %d font spans from %s", len(fonts), ctx.name)
     return fonts
 
 
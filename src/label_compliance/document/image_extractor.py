@@ -22,12 +22,16 @@ from __future__ import annotations
 import io
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import fitz  # PyMuPDF
 from PIL import Image
 
+from label_compliance.document.context import DocumentContext, use_context
 from label_compliance.utils.log import get_logger
 
+if TYPE_CHECKING:
+    from label_compliance.document.ocr import OCRResult
+
 logger = get_logger(__name__)
 
 
@@ -47,6 +51,7 @@ class EmbeddedImage:
     page_number: int  # 1-based
     image_bytes: bytes = field(repr=False)
     saved_path: Path | None = None
+    ocr: OCRResult | None = field(default=None, repr=False)  # set once by ocr_embedded_image
 
     @property
     def area(self) -> int:
@@ -67,10 +72,15 @@ class PageClassification:
     embedded_image_count: int
     total_image_area: int
 
+    @property
+    def has_vector_text(self) -> bool:
+        """Whether the page has a real text layer (more than trivial whitespace)."""
+        return self.text_length > 50
+
     @property
     def page_type(self) -> str:
         """Classify as IMAGE_ONLY, MIXED, or TEXT_ONLY."""
-        has_text = self.text_length > 50  # more than trivial whitespace
+        has_text = self.has_vector_text
         has_images = self.embedded_image_count > 0 and self.total_image_area >= _MIN_IMAGE_AREA
         if has_images and not has_text:
             return "IMAGE_ONLY"
@@ -110,7 +120,7 @@ class PDFImageAnalysis:
         return [pc.page_number for pc in self.page_classifications if pc.page_type == "MIXED"]
 
 
-def classify_pdf_pages(pdf_path: Path) -> PDFImageAnalysis:
+def classify_pdf_pages(pdf_path: Path | DocumentContext) -> PDFImageAnalysis:
     """
     Classify each page of a PDF as IMAGE_ONLY, MIXED, or TEXT_ONLY.
 
@@ -120,46 +130,35 @@ def classify_pdf_pages(pdf_path: Path) -> PDFImageAnalysis:
     - MIXED: Use both text extraction AND embedded image OCR
 
     Args:
-        pdf_path: Path to the PDF file.
+        pdf_path: Path to the PDF file, or a shared ``DocumentContext``.
 
     Returns:
         PDFImageAnalysis with per-page classifications.
     """
-    pdf_path = Path(pdf_path)
-    doc = fitz.open(str(pdf_path))
-    result = PDFImageAnalysis(pdf_path=pdf_path, total_pages=len(doc))
-
-    for page_idx in range(len(doc)):
-        page = doc[page_idx]
-        page_num = page_idx + 1
-
-        text = page.get_text().strip()
-        images = page.get_images(full=True)
-
-        total_area = 0
-        significant_count = 0
-
-        for img_info in images:
-            xref = img_info[0]
-            try:
-                base_img = doc.extract_image(xref)
-                w, h = base_img["width"], base_img["height"]
-                area = w * h
+    with use_context(pdf_path) as ctx:
+        result = PDFImageAnalysis(pdf_path=ctx.path, total_pages=ctx.page_count)
+
+        for page_num in ctx.page_numbers:
+            text = ctx.text(page_num).strip()
+
+            total_area = 0
+            significant_count = 0
+
+            # get_images(full=True) already carries the pixel size
+            # (xref, smask, width, height, ...) — no need to decode
+            for img_info in ctx.images(page_num):
+                area = img_info[2] * img_info[3]
                 total_area += area
                 if area >= _MIN_IMAGE_AREA:
                     significant_count += 1
-            except Exception:
-                pass
-
-        pc = PageClassification(
-            page_number=page_num,
-            text_length=len(text),
-            embedded_image_count=significant_count,
-            total_image_area=total_area,
-        )
-        result.page_classifications.append(pc)
 
-    doc.close()
+            pc = PageClassification(
+                page_number=page_num,
+                text_length=len(text),
+                embedded_image_count=significant_count,
+                total_image_area=total_area,
+            )
+            result.page_classifications.append(pc)
 
     # Log summary
     img_only = [pc.page_number for pc in result.page_classifications if pc.is_image_only]
@@ -167,14 +166,15 @@ def classify_pdf_pages(pdf_path: Path) -> PDFImageAnalysis:
     text_only = [pc.page_number for pc in result.page_classifications if pc.page_type == "TEXT_ONLY"]
     logger.info(
         "PDF classification %s: %d pages — IMAGE_ONLY=%s, MIXED=%s, TEXT_ONLY=%s",
-        pdf_path.name, result.total_pages, img_only or "none", mixed or "none", text_only or "none",
+        result.pdf_path.name, result.total_pages,
+        img_only or "none", mixed or "none", text_only or "none",
     )
 
     return result
 
 
 def extract_embedded_images(
-    pdf_path: Path,
+    pdf_path: Path | DocumentContext,
     output_dir: Path,
     pages: list[int] | None = None,
     min_area: int = _MIN_IMAGE_AREA,
@@ -187,86 +187,94 @@ def extract_embedded_images(
     extracts the label artwork images embedded alongside vector text.
 
     Args:
-        pdf_path: Path to the PDF file.
+        pdf_path: Path to the PDF file, or a shared ``DocumentContext``.
         output_dir: Directory to save extracted images.
         pages: Specific pages to extract from (1-based). None = all pages.
         min_area: Minimum image area in pixels to extract.
 
     Returns:
         List of EmbeddedImage objects with saved file paths.
+
+    With a shared ``DocumentContext``, images already saved to
+    ``output_dir`` by an earlier stage are returned as-is (same objects,
+    including any OCR result) instead of being decoded and written again.
     """
-    pdf_path = Path(pdf_path)
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    doc = fitz.open(str(pdf_path))
     extracted: list[EmbeddedImage] = []
     seen_xrefs: set[int] = set()
 
-    for page_idx in range(len(doc)):
-        page_num = page_idx + 1
-        if pages and page_num not in pages:
-            continue
-
-        page = doc[page_idx]
-        images = page.get_images(full=True)
-
-        for img_idx, img_info in enumerate(images):
-            xref = img_info[0]
-
-            # Skip duplicate xrefs (same image referenced multiple times)
-            if xref in seen_xrefs:
+    with use_context(pdf_path) as ctx:
+        for page_num in ctx.page_numbers:
+            if pages and page_num not in pages:
                 continue
-            seen_xrefs.add(xref)
 
-            try:
-                base_img = doc.extract_image(xref)
-                w, h = base_img["width"], base_img["height"]
-                ext = base_img["ext"]
-                img_bytes = base_img["image"]
+            for img_idx, img_info in enumerate(ctx.images(page_num)):
+                xref = img_info[0]
 
-                if w * h < min_area:
-                    logger.debug(
-                        "  Skipping small image xref=%d (%dx%d) on page %d",
-                        xref, w, h, page_num,
-                    )
+                # Skip duplicate xrefs (same image referenced multiple times)
+                if xref in seen_xrefs:
                     continue
+                seen_xrefs.add(xref)
+
+                try:
+                    if img_info[2] * img_info[3] < min_area:
+                        logger.debug(
+                            "  Skipping small image xref=%d (%dx%d) on page %d",
+                            xref, img_info[2], img_info[3], page_num,
+                        )
+                        continue
+
+                    cached = ctx.embedded.get(xref)
+                    if (
+                        cached is not None
+                        and cached.saved_path is not None
+                        and cached.saved_path.parent == output_dir
+                        and cached.saved_path.exists()
+                    ):
+                        extracted.append(cached)
+                        continue
+
+                    base_img = ctx.extract_image(xref)
+                    w, h = base_img["width"], base_img["height"]
+                    ext = base_img["ext"]
+                    img_bytes = base_img["image"]
+
+                    # Save the image
+                    img_filename = f"page-{page_num:02d}_embedded-{img_idx:02d}_{w}x{h}.{ext}"
+                    img_path = output_dir / img_filename
+                    img_path.write_bytes(img_bytes)
+
+                    emb = EmbeddedImage(
+                        xref=xref,
+                        width=w,
+                        height=h,
+                        extension=ext,
+                        page_number=page_num,
+                        image_bytes=img_bytes,
+                        saved_path=img_path,
+                    )
+                    extracted.append(emb)
+                    ctx.embedded[xref] = emb
 
-                # Save the image
-                img_filename = f"page-{page_num:02d}_embedded-{img_idx:02d}_{w}x{h}.{ext}"
-                img_path = output_dir / img_filename
-                img_path.write_bytes(img_bytes)
-
-                emb = EmbeddedImage(
-                    xref=xref,
-                    width=w,
-                    height=h,
-                    extension=ext,
-                    page_number=page_num,
-                    image_bytes=img_bytes,
-                    saved_path=img_path,
-                )
-                extracted.append(emb)
-
-                logger.debug(
-                    "  Extracted image: page %d, %dx%d %s → %s",
-                    page_num, w, h, ext, img_path.name,
-                )
-
-            except Exception as e:
-                logger.warning("Failed to extract image xref=%d: %s", xref, e)
+                    logger.debug(
+                        "  Extracted image: page %d, %dx%d %s → %s",
+                        page_num, w, h, ext, img_path.name,
+                    )
 
-    doc.close()
+                except Exception as e:
+                    logger.warning("Failed to extract image xref=%d: %s", xref, e)
 
-    logger.info(
-        "Extracted %d embedded images from %s",
-        len(extracted), pdf_path.name,
-    )
+        logger.info(
+            "Extracted %d embedded images from %s",
+            len(extracted), ctx.name,
+        )
     return extracted
 
 
 def extract_and_ocr_embedded_images(
-    pdf_path: Path,
+    pdf_path: Path | DocumentContext,
     output_dir: Path,
     pages: list[int] | None = None,
 ) -> dict[int, str]:
@@ -278,15 +286,13 @@ def extract_and_ocr_embedded_images(
     returns the OCR text organized by page number.
 
     Args:
-        pdf_path: Path to the PDF file.
+        pdf_path: Path to the PDF file, or a shared ``DocumentContext``.
         output_dir: Directory to save extracted images.
         pages: Specific pages to process (1-based). None = all.
 
     Returns:
         Dict mapping page_number → OCR text from embedded images.
     """
-    from label_compliance.document.ocr import run_ocr
-
     images = extract_embedded_images(pdf_path, output_dir, pages=pages)
 
     page_texts: dict[int, list[str]] = {}
@@ -296,7 +302,7 @@ def extract_and_ocr_embedded_images(
             continue
 
         # Run OCR on the extracted image with enhanced settings
-        ocr_result = run_ocr(emb.saved_path, preprocess=True)
+        ocr_result = ocr_embedded_image(emb)
 
         page_texts.setdefault(emb.page_number, []).append(ocr_result.full_text)
 
@@ -318,8 +324,22 @@ def extract_and_ocr_embedded_images(
     return result
 
 
+def ocr_embedded_image(emb: EmbeddedImage) -> OCRResult:
+    """OCR a saved embedded image, at most once per image object.
+
+    The result is stored on ``emb.ocr``; with a shared ``DocumentContext``
+    the segmenter and the checker get the same object back, so a large
+    scan pays for (multi-strategy) OCR a single time.
+    """
+    from label_compliance.document.ocr import run_ocr
+
+    if emb.ocr is None:
+        emb.ocr = run_ocr(emb.saved_path, preprocess=True)
+    return emb.ocr
+
+
 def get_best_text_for_page(
-    pdf_path: Path,
+    pdf_path: Path | DocumentContext,
     page_number: int,
     output_dir: Path,
     classification: PageClassification | None = None,
@@ -341,31 +361,27 @@ def get_best_text_for_page(
     Returns:
         Best extracted text for the page.
     """
-    from label_compliance.document.ocr import run_ocr
-
-    doc = fitz.open(str(pdf_path))
-    page = doc[page_number - 1]
-    vector_text = page.get_text().strip()
-    doc.close()
-
-    if classification is None:
-        analysis = classify_pdf_pages(pdf_path)
-        classification = analysis.page_classifications[page_number - 1]
-
-    texts = []
-
-    # Always include vector text if available
-    if vector_text:
-        texts.append(vector_text)
-
-    # For IMAGE_ONLY or MIXED pages, also extract and OCR embedded images
-    if classification.page_type in ("IMAGE_ONLY", "MIXED"):
-        embedded_texts = extract_and_ocr_embedded_images(
-            pdf_path, output_dir, pages=[page_number]
-        )
-        emb_text = embedded_texts.get(page_number, "")
-        if emb_text.strip():
-            texts.append(emb_text)
+    with use_context(pdf_path) as ctx:
+        vector_text = ctx.text(page_number).strip()
+
+        if classification is None:
+            analysis = classify_pdf_pages(ctx)
+            classification = analysis.page_classifications[page_number - 1]
+
+        texts = []
+
+        # Always include vector text if available
+        if vector_text:
+            texts.append(vector_text)
+
+        # For IMAGE_ONLY or MIXED pages, also extract and OCR embedded images
+        if classification.page_type in ("IMAGE_ONLY", "MIXED"):
+            embedded_texts = extract_and_ocr_embedded_images(
+                ctx, output_dir, pages=[page_number]
+            )
+            emb_text = embedded_texts.get(page_number, "")
+            if emb_text.strip():
+                texts.append(emb_text)
 
     combined = "\n".join(texts)
     logger.debug(
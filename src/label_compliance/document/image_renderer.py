@@ -3,6 +3,10 @@ Image Renderer
 ================
 Renders PDF pages as high-res PNG images for OCR and visual analysis.
 Uses PyMuPDF (fitz) for rendering.
+
+The label check itself keeps rendered pages in memory (see
+``page_images.PageImageProvider``); ``render_pages`` is for callers
+that want the PNG files.
 """
 
 from __future__ import annotations
@@ -13,6 +17,8 @@ import fitz  # PyMuPDF
 from PIL import Image
 
 from label_compliance.config import get_settings
+from label_compliance.document.context import DocumentContext, use_context
+from label_compliance.document.page_images import PageImage
 from label_compliance.utils.helpers import safe_filename
 from label_compliance.utils.log import get_logger
 
@@ -20,7 +26,7 @@ logger = get_logger(__name__)
 
 
 def render_pages(
-    pdf_path: Path,
+    pdf_path: Path | DocumentContext,
     output_dir: Path | None = None,
     dpi: int | None = None,
 ) -> list[Path]:
@@ -28,7 +34,7 @@ def render_pages(
     Render all pages of a PDF as PNG images.
 
     Args:
-        pdf_path: Path to the PDF file.
+        pdf_path: Path to the PDF file, or a shared ``DocumentContext``.
         output_dir: Directory to save images. Defaults to data/images/<pdf_stem>/.
         dpi: Render resolution. Defaults to config value (300).
 
@@ -40,24 +46,22 @@ def render_pages(
     zoom = dpi / 72.0
     mat = fitz.Matrix(zoom, zoom)
 
-    if output_dir is None:
-        stem = safe_filename(pdf_path.stem)
-        output_dir = settings.paths.knowledge_base_dir.parent / "images" / stem
+    with use_context(pdf_path) as ctx:
+        if output_dir is None:
+            stem = safe_filename(ctx.path.stem)
+            output_dir = settings.paths.knowledge_base_dir.parent / "images" / stem
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        image_paths: list[Path] = []
 
-    doc = fitz.open(str(pdf_path))
-    image_paths: list[Path] = []
+        for i in ctx.page_numbers:
+            pix = ctx.page(i).get_pixmap(matrix=mat)
+            img_path = output_dir / f"page-{i:02d}.png"
+            pix.save(str(img_path))
+            image_paths.append(img_path)
+            logger.debug("  Rendered page %d → %s (%dx%d)", i, img_path.name, pix.width, pix.height)
 
-    for i, page in enumerate(doc, 1):
-        pix = page.get_pixmap(matrix=mat)
-        img_path = output_dir / f"page-{i:02d}.png"
-        pix.save(str(img_path))
-        image_paths.append(img_path)
-        logger.debug("  Rendered page %d → %s (%dx%d)", i, img_path.name, pix.width, pix.height)
-
-    doc.close()
-    logger.info("Rendered %d pages from %s at %d DPI", len(image_paths), pdf_path.name, dpi)
+        logger.info("Rendered %d pages from %s at %d DPI", len(image_paths), ctx.name, dpi)
     return image_paths
 
 
@@ -79,7 +83,7 @@ def render_single_page(
 
 
 def crop_section_image(
-    full_page_image: Path,
+    full_page_image: Path | PageImage,
     bbox: tuple[float, float, float, float],
     output_path: Path,
     dpi: int = 300,
@@ -88,7 +92,8 @@ def crop_section_image(
     """Crop a label section from a full-page image using its PDF bbox.
 
     Args:
-        full_page_image: Path to the rendered full-page PNG.
+        full_page_image: Path to the rendered full-page PNG, or the
+            in-memory ``PageImage`` (no decode).
         bbox: Section bounding box (x0, y0, x1, y1) in PDF points.
         output_path: Path to save the cropped image.
         dpi: DPI used when rendering the full page.
@@ -98,7 +103,10 @@ def crop_section_image(
         Path to the saved cropped image.
     """
     scale = dpi / 72.0
-    img = Image.open(full_page_image)
+    if isinstance(full_page_image, PageImage):
+        img = full_page_image.pil()
+    else:
+        img = Image.open(full_page_image)
     w, h = img.size
 
     x0, y0, x1, y1 = bbox
@@ -31,12 +31,16 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING
 
 import fitz  # PyMuPDF
 
+from label_compliance.document.context import DocumentContext, use_context
 from label_compliance.utils.log import get_logger
 
+if TYPE_CHECKING:
+    from label_compliance.document.span_index import SpanIndex
+
 logger = get_logger(__name__)
 
 # ── Known section header patterns ─────────────────────
@@ -176,7 +180,10 @@ class SegmentationResult:
         return [s.name for s in self.sections]
 
 
-def segment_pdf(pdf_path: Path) -> SegmentationResult:
+def segment_pdf(
+    pdf_path: Path | DocumentContext,
+    image_dir: Path | None = None,
+) -> SegmentationResult:
     """
     Segment a label PDF into individual label sections.
 
@@ -189,11 +196,18 @@ def segment_pdf(pdf_path: Path) -> SegmentationResult:
     text for section detection and analysis.
 
     Args:
-        pdf_path: Path to the label PDF.
+        pdf_path: Path to the label PDF, or a shared ``DocumentContext``.
+        image_dir: Per-label image directory (embedded images go in
+            ``<image_dir>/embedded``). Default: ``data/images/<label>``.
 
     Returns:
         SegmentationResult with list of detected LabelSections.
     """
+    with use_context(pdf_path) as ctx:
+        return _segment_document(ctx, image_dir)
+
+
+def _segment_document(ctx: DocumentContext, image_dir: Path | None) -> SegmentationResult:
     from label_compliance.document.image_extractor import (
         classify_pdf_pages,
         extract_and_ocr_embedded_images,
@@ -201,21 +215,23 @@ def segment_pdf(pdf_path: Path) -> SegmentationResult:
     from label_compliance.config import get_settings
     from label_compliance.utils.helpers import safe_filename
 
-    pdf_path = Path(pdf_path)
+    pdf_path = ctx.path
     logger.info("Segmenting PDF: %s", pdf_path.name)
 
     # ── Pre-classify pages: IMAGE_ONLY / MIXED / TEXT_ONLY ──
-    pdf_analysis = classify_pdf_pages(pdf_path)
+    pdf_analysis = classify_pdf_pages(ctx)
 
     # ── For image-only or mixed pages, extract embedded images + OCR ──
     embedded_ocr_texts: dict[int, str] = {}
     image_pages = pdf_analysis.image_only_pages + pdf_analysis.mixed_pages
     if image_pages:
-        settings = get_settings()
-        safe_name = safe_filename(pdf_path.stem)
-        embed_dir = settings.paths.knowledge_base_dir.parent / "images" / safe_name / "embedded"
+        if image_dir is None:
+            settings = get_settings()
+            images_root = settings.paths.knowledge_base_dir.parent / "images"
+            image_dir = images_root / safe_filename(pdf_path.stem)
+        embed_dir = Path(image_dir) / "embedded"
         embedded_ocr_texts = extract_and_ocr_embedded_images(
-            pdf_path, embed_dir, pages=image_pages,
+            ctx, embed_dir, pages=image_pages,
         )
         logger.info(
             "  Embedded image OCR for pages %s: %s",
@@ -223,20 +239,18 @@ def segment_pdf(pdf_path: Path) -> SegmentationResult:
             {p: f"{len(t)} chars" for p, t in embedded_ocr_texts.items()},
         )
 
-    doc = fitz.open(str(pdf_path))
-    result = SegmentationResult(pdf_path=pdf_path, total_pages=len(doc))
+    total_pages = ctx.page_count
+    result = SegmentationResult(pdf_path=pdf_path, total_pages=total_pages)
 
-    for page_idx in range(len(doc)):
-        page = doc[page_idx]
-        page_num = page_idx + 1
+    for page_num in ctx.page_numbers:
+        page = ctx.page(page_num)
 
         # Get page classification
-        page_class = pdf_analysis.page_classifications[page_idx]
+        page_class = pdf_analysis.page_classifications[page_num - 1]
 
         # Get structured text with positions
-        text_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
-        blocks = text_dict.get("blocks", [])
-        page_text = page.get_text()
+        blocks = ctx.blocks(page_num)
+        page_text = ctx.text(page_num)
 
         # For image-only pages, use OCR text instead
         if page_class.is_image_only:
@@ -265,7 +279,7 @@ def segment_pdf(pdf_path: Path) -> SegmentationResult:
         if header_hits:
             # Partition page into sections based on header positions
             sections = _partition_page_by_headers(
-                header_hits, blocks, page, page_num
+                header_hits, blocks, page, page_num, ctx.span_index,
             )
             # For image-only pages, inject OCR text into sections
             if page_class.is_image_only:
@@ -275,27 +289,27 @@ def segment_pdf(pdf_path: Path) -> SegmentationResult:
             result.sections.extend(sections)
         else:
             # No headers found — treat entire page as one section
-            section_type = _infer_page_type(effective_text, page_num, len(doc))
+            section_type = _infer_page_type(effective_text, page_num, total_pages)
             section = LabelSection(
                 name=section_type,
                 section_type=_normalize_type(section_type),
                 page_number=page_num,
                 bbox=(0, 0, page.rect.width, page.rect.height),
                 text=effective_text,
-                fonts=_extract_page_fonts(page),
+                fonts=ctx.span_index.font_dicts(ctx.span_index.page_ids(page_num)),
             )
             result.sections.append(section)
 
     # Extract shared matrix data (product tables)
-    result.matrix_data = _extract_matrix_data(doc)
+    result.matrix_data = _extract_matrix_data(ctx)
 
     # ── Extract drawing-level metadata ──
-    full_text = "\n".join(page.get_text() for page in doc)
-    result.drawing_metadata = _extract_drawing_metadata(doc)
-    result.revision_history = _extract_revision_history(doc)
+    full_text = ctx.full_text
+    result.drawing_metadata = _extract_drawing_metadata(ctx)
+    result.revision_history = _extract_revision_history(ctx)
     result.variable_definitions = _extract_variable_definitions(full_text)
     result.character_limits = _extract_character_limits(full_text)
-    result.configuration_matrix = _extract_configuration_matrix(doc)
+    result.configuration_matrix = _extract_configuration_matrix(ctx)
     result.manufacturing_notes = _extract_manufacturing_notes(full_text)
     result.barcode_content_specs = _extract_barcode_specs(full_text)
 
@@ -303,8 +317,6 @@ def segment_pdf(pdf_path: Path) -> SegmentationResult:
     for section in result.sections:
         _enrich_section(section)
 
-    doc.close()
-
     # Log summary
     logger.info(
         "  Segmented into %d sections: %s",
@@ -418,12 +430,14 @@ def _partition_page_by_headers(
     blocks: list[dict],
     page: fitz.Page,
     page_num: int,
+    spans: SpanIndex,
 ) -> list[LabelSection]:
     """
     Partition a page into sections based on header positions.
 
     Uses header x-positions to divide the page into columns/regions,
-    then assigns text blocks to the nearest section.
+    then assigns text blocks to the nearest section.  Section fonts come
+    from the document's span index, by the same block-centre test.
     """
     if not headers:
         return []
@@ -464,7 +478,6 @@ def _partition_page_by_headers(
 
         # Collect text blocks within this section's region
         section_text_parts = []
-        section_fonts = []
 
         for block in blocks:
             if block.get("type") != 0:
@@ -482,13 +495,6 @@ def _partition_page_by_headers(
                     )
                     section_text_parts.append(line_text)
 
-                    for span in line.get("spans", []):
-                        section_fonts.append({
-                            "name": span.get("font", "unknown"),
-                            "size": round(span.get("size", 0), 1),
-                            "flags": span.get("flags", 0),
-                        })
-
         # Find EART number if present
         section_text = "\n".join(section_text_parts)
         eart_match = re.search(r"\[EART\s+([\w-]+)\]", section_text)
@@ -500,7 +506,7 @@ def _partition_page_by_headers(
             page_number=page_num,
             bbox=(sx0, sy0, sx1, sy1),
             text=section_text,
-            fonts=section_fonts,
+            fonts=spans.font_dicts(spans.in_region(page_num, sx0, sy0, sx1, sy1, by_block=True)),
             eart_number=eart_number,
         )
         sections.append(section)
@@ -576,27 +582,7 @@ def _normalize_type(name: str) -> str:
     return name.lower().replace(" ", "_")
 
 
-def _extract_page_fonts(page: fitz.Page) -> list[dict]:
-    """Extract font info from a page."""
-    fonts = []
-    try:
-        blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)["blocks"]
-        for block in blocks:
-            if block.get("type") != 0:
-                continue
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    fonts.append({
-                        "name": span.get("font", "unknown"),
-                        "size": round(span.get("size", 0), 1),
-                        "flags": span.get("flags", 0),
-                    })
-    except Exception:
-        pass
-    return fonts
-
-
-def _extract_matrix_data(doc: fitz.Document) -> dict:
+def _extract_matrix_data(ctx: DocumentContext) -> dict:
     """
     Extract the product matrix / data table that lists all variants.
 
@@ -605,8 +591,8 @@ def _extract_matrix_data(doc: fitz.Document) -> dict:
     """
     matrix = {}
 
-    for page in doc:
-        text = page.get_text()
+    for page_num in ctx.page_numbers:
+        text = ctx.text(page_num)
         lines = text.split("\n")
 
         # Look for matrix header row patterns
@@ -632,7 +618,7 @@ def _extract_matrix_data(doc: fitz.Document) -> dict:
 # ══════════════════════════════════════════════════════════
 
 
-def _extract_drawing_metadata(doc: fitz.Document) -> DrawingMetadata:
+def _extract_drawing_metadata(ctx: DocumentContext) -> DrawingMetadata:
     """
     Extract the engineering title block:
     Drawing Number, Revision, Title, Scale, Tolerances, etc.
@@ -642,9 +628,7 @@ def _extract_drawing_metadata(doc: fitz.Document) -> DrawingMetadata:
     dm = DrawingMetadata()
 
     # ── Collect all page text ──
-    all_text = ""
-    for page in doc:
-        all_text += page.get_text() + "\n"
+    all_text = "".join(ctx.text(n) + "\n" for n in ctx.page_numbers)
 
     # ── Title: LABELS, ARTOURA, ... NON-CE  ──
     # Look for the characteristic multi-line title
@@ -767,17 +751,15 @@ def _extract_drawing_metadata(doc: fitz.Document) -> DrawingMetadata:
     return dm
 
 
-def _extract_revision_history(doc: fitz.Document) -> list[RevisionEntry]:
+def _extract_revision_history(ctx: DocumentContext) -> list[RevisionEntry]:
     """
     Extract revision history table (Rev A, B, C, D with C.O. numbers).
     """
     revisions = []
 
     try:
-        import pdfplumber
-        pdf = pdfplumber.open(str(doc.name))
-        for page in pdf.pages:
-            tables = page.extract_tables()
+        for page_num in ctx.page_numbers:
+            tables = ctx.tables(page_num)
             for table in tables:
                 if not table or not table[0]:
                     continue
@@ -800,13 +782,12 @@ def _extract_revision_history(doc: fitz.Document) -> list[RevisionEntry]:
                         if len(row) > 4 and row[4]:
                             entry.date = str(row[4]).strip()
                         revisions.append(entry)
-        pdf.close()
     except Exception as e:
         logger.debug("Could not extract revision history via pdfplumber: %s", e)
 
         # Fallback: regex from raw text
-        for page in doc:
-            text = page.get_text()
+        for page_num in ctx.page_numbers:
+            text = ctx.text(page_num)
             for m in re.finditer(
                 r"^([A-E])\s+(SEE PLM|\d+)\s+(.*?)(?:\s+(\w{2,5})\s+(SEE PLM|[\d/]+))?$",
                 text, re.MULTILINE,
@@ -865,7 +846,7 @@ def _extract_character_limits(text: str) -> list[dict[str, str]]:
     return limits
 
 
-def _extract_configuration_matrix(doc: fitz.Document) -> list[ConfigurationRow]:
+def _extract_configuration_matrix(ctx: DocumentContext) -> list[ConfigurationRow]:
     """
     Extract the product configuration matrix table using pdfplumber.
 
@@ -876,11 +857,8 @@ def _extract_configuration_matrix(doc: fitz.Document) -> list[ConfigurationRow]:
     rows = []
 
     try:
-        import pdfplumber
-        pdf = pdfplumber.open(str(doc.name))
-
-        for page in pdf.pages:
-            tables = page.extract_tables()
+        for page_num in ctx.page_numbers:
+            tables = ctx.tables(page_num)
             for table in tables:
                 if not table or len(table) < 3:
                     continue
@@ -979,8 +957,6 @@ def _extract_configuration_matrix(doc: fitz.Document) -> list[ConfigurationRow]:
 
                     if cr.item_number:
                         rows.append(cr)
-
-        pdf.close()
     except Exception as e:
         logger.debug("Could not extract configuration matrix via pdfplumber: %s", e)
 
@@ -14,10 +14,16 @@ from pathlib import Path
 import cv2
 import numpy as np
 
+from label_compliance.document.page_images import PageImage, as_page_image
 from label_compliance.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+# Zone detection is coarse morphology — half resolution is plenty.
+# Kernel and noise sizes below are tuned for the native 300-DPI render
+# and scaled to the level; zones are reported in native pixels.
+LAYOUT_LEVEL = "half"
+
 
 @dataclass
 class Zone:
@@ -40,7 +46,7 @@ class Zone:
         return (self.x, self.y, self.w, self.h)
 
 
-def analyze_layout(image_path: Path) -> list[Zone]:
+def analyze_layout(image_path: Path | PageImage) -> list[Zone]:
     """
     Detect functional zones in a label image.
 
@@ -49,13 +55,18 @@ def analyze_layout(image_path: Path) -> list[Zone]:
     - Symbol regions (small, high-contrast icons)
     - Barcode regions (stripe patterns)
     - Logo regions (large graphical blocks)
+
+    Runs at ``LAYOUT_LEVEL`` of the image pyramid; returned zones are in
+    native pixel coordinates.
     """
-    img = cv2.imread(str(image_path))
-    if img is None:
+    source = as_page_image(image_path)
+    level = source.at(LAYOUT_LEVEL)
+    gray = level.gray
+    if gray is None:
         return []
 
-    h, w = img.shape[:2]
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    h, w = gray.shape[:2]
+    s = level.scale
 
     # Find text-dense regions via morphological operations
     zones = []
@@ -64,7 +75,9 @@ def analyze_layout(image_path: Path) -> list[Zone]:
     _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
 
     # Dilate to merge nearby text into blocks
-    kernel_text = cv2.getStructuringElement(cv2.MORPH_RECT, (30, 5))
+    kernel_text = cv2.getStructuringElement(
+        cv2.MORPH_RECT, (max(1, round(30 * s)), max(1, round(5 * s))),
+    )
     dilated = cv2.dilate(binary, kernel_text, iterations=2)
 
     contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -74,7 +87,7 @@ def analyze_layout(image_path: Path) -> list[Zone]:
         area = cw * ch
 
         # Skip tiny noise
-        if area < 500:
+        if area < 500 * s * s:
             continue
 
         # Classify based on aspect ratio and size
@@ -90,9 +103,10 @@ def analyze_layout(image_path: Path) -> list[Zone]:
         else:
             zone_type = "text"
 
+        nx, ny, nw, nh = level.to_native(cx, cy, cw, ch)
         zones.append(Zone(
             zone_type=zone_type,
-            x=cx, y=cy, w=cw, h=ch,
+            x=nx, y=ny, w=nw, h=nh,
             confidence=0.7,
         ))
 
@@ -101,7 +115,7 @@ def analyze_layout(image_path: Path) -> list[Zone]:
 
     logger.debug(
         "Layout: %s → %d zones (%s)",
-        image_path.name,
+        source.name,
         len(zones),
         ", ".join(f"{z.zone_type}" for z in zones[:5]),
     )
@@ -7,19 +7,31 @@ Returns structured results including word-level bounding boxes.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import math
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 import cv2
+import fitz
 import numpy as np
 import pytesseract
 from PIL import Image
 
 from label_compliance.config import get_settings
+from label_compliance.document.context import DocumentContext
+from label_compliance.document.ocr_cache import get_ocr_cache
+from label_compliance.document.page_images import PageImage, as_page_image, downscale
+from label_compliance.document.word_index import WordIndex
 from label_compliance.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+# Tesseract needs full resolution for small label print
+OCR_LEVEL = "native"
+
 
 @dataclass
 class OCRWord:
@@ -45,27 +57,38 @@ class OCRResult:
     words: list[OCRWord] = field(default_factory=list)
     text_blocks: list[dict] = field(default_factory=list)
 
+    # Derived lookups, built lazily and rebuilt if full_text / words are replaced
+    _lower: tuple[str, str] | None = field(default=None, init=False, repr=False, compare=False)
+    _index: tuple[int, int, WordIndex] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
     @property
     def word_count(self) -> int:
         return len(self.words)
 
     @property
     def text_lower(self) -> str:
-        return self.full_text.lower()
+        cached = self._lower
+        if cached is None or cached[0] is not self.full_text:
+            cached = self._lower = (self.full_text, self.full_text.lower())
+        return cached[1]
+
+    @property
+    def index(self) -> WordIndex:
+        """Substring + spatial index over ``words`` (see ``word_index.py``)."""
+        cached = self._index
+        if cached is None or cached[:2] != (id(self.words), len(self.words)):
+            cached = self._index = (id(self.words), len(self.words), WordIndex(self.words))
+        return cached[2]
 
     def words_in_region(self, x: int, y: int, w: int, h: int) -> list[OCRWord]:
         """Get all words within a bounding box region."""
-        return [
-            word for word in self.words
-            if (word.x >= x and word.y >= y
-                and word.x + word.w <= x + w
-                and word.y + word.h <= y + h)
-        ]
+        return [self.words[i] for i in self.index.in_region(x, y, w, h)]
 
     def find_text(self, search: str) -> list[OCRWord]:
         """Find all word occurrences matching a search string."""
-        search_lower = search.lower()
-        return [w for w in self.words if search_lower in w.text.lower()]
+        return [self.words[i] for i in self.index.find(search)]
 
 
 def preprocess_image(
@@ -140,7 +163,7 @@ def preprocess_image(
 
 
 def run_ocr(
-    image_path: Path | str,
+    image_path: Path | str | PageImage,
     preprocess: bool = True,
     language: str | None = None,
     multi_strategy: bool = False,
@@ -149,23 +172,29 @@ def run_ocr(
     Run OCR on a label image.
 
     Args:
-        image_path: Path to the image file.
+        image_path: Path to the image file, or an in-memory ``PageImage``.
         preprocess: Whether to apply preprocessing (improves accuracy).
         language: OCR language (default from config).
         multi_strategy: If True, run OCR with multiple preprocessing
             strategies and pick the best result. Slower but more accurate
-            for complex label images. Auto-enabled for high-res images.
+            for complex label images. Auto-enabled for high-res images;
+            above ``document.ocr_tile_above`` px the image is OCR'd in
+            overlapping tiles instead (``_run_ocr_tiled``).
 
     Returns:
         OCRResult with full text and word-level bounding boxes.
+
+    Results are served from the persistent OCR cache when the same
+    pixels were OCR'd with the same settings before (``ocr_cache.py``).
     """
     settings = get_settings()
-    image_path = Path(image_path)
+    source = as_page_image(image_path)
+    image_path = source.path
     lang = language or settings.document.ocr_language
     min_conf = settings.document.ocr_min_confidence
 
-    # Load image
-    img = cv2.imread(str(image_path))
+    # Load image (no decode for rendered pages — already in memory)
+    img = source.at(OCR_LEVEL).bgr
     if img is None:
         logger.error("Failed to load image: %s", image_path)
         return OCRResult(
@@ -181,16 +210,37 @@ def run_ocr(
     if is_high_res and not multi_strategy:
         multi_strategy = True
 
-    if multi_strategy:
-        return _run_ocr_multi_strategy(img, image_path, lang, min_conf, is_high_res)
-
-    # Single strategy
-    if preprocess:
-        processed = preprocess_image(img, is_high_res=is_high_res)
+    cache = get_ocr_cache()
+    if cache is not None:
+        key = cache.make_key(
+            img,
+            preprocess=preprocess,
+            steps=settings.document.ocr_preprocess,
+            multi_strategy=multi_strategy and _strategy_policy(),
+            lang=lang,
+            min_conf=min_conf,
+        )
+        cached = cache.get(key, image_path)
+        if cached is not None:
+            logger.debug("OCR cache hit: %s", image_path.name)
+            return cached
+
+    tile_above = settings.document.ocr_tile_above
+    if multi_strategy and tile_above and max(h, w) > tile_above:
+        result = _run_ocr_tiled(img, image_path, lang, min_conf, is_high_res)
+    elif multi_strategy:
+        result = _run_ocr_multi_strategy(img, image_path, lang, min_conf, is_high_res)
     else:
-        processed = img
+        # Single strategy
+        if preprocess:
+            processed = preprocess_image(img, is_high_res=is_high_res)
+        else:
+            processed = img
+        result = _ocr_on_image(processed, image_path, lang, min_conf, w, h)
 
-    return _ocr_on_image(processed, image_path, lang, min_conf, w, h)
+    if cache is not None:
+        cache.put(key, result)
+    return result
 
 
 def _ocr_on_image(
@@ -208,11 +258,9 @@ def _ocr_on_image(
     else:
         pil_img = Image.fromarray(cv2.cvtColor(processed, cv2.COLOR_BGR2RGB))
 
-    # Full text extraction
-    full_text = pytesseract.image_to_string(pil_img, lang=lang)
-
-    # Word-level data with bounding boxes
+    # One recognition pass: word boxes + layout, full text rebuilt from them
     word_data = pytesseract.image_to_data(pil_img, lang=lang, output_type=pytesseract.Output.DICT)
+    full_text = text_from_ocr_data(word_data)
 
     words = []
     for i in range(len(word_data["text"])):
@@ -248,6 +296,159 @@ def _ocr_on_image(
     return result
 
 
+def text_from_ocr_data(word_data: dict[str, list]) -> str:
+    """Rebuild Tesseract's plain-text output from ``image_to_data``.
+
+    Mirrors ``image_to_string`` (``TessBaseAPI::GetUTF8Text`` plus the
+    text renderer). Words are joined by single spaces, and every line
+    ends in ``\n``. A paragraph or block boundary adds another ``\n``,
+    and the page ends with the ``\f`` page separator. All recognised
+    words count, whatever their confidence.
+    """
+    parts: list[str] = []
+    line: list[str] = []
+    line_key = para_key = None
+
+    def _end_line(end_para: bool) -> None:
+        if line:
+            parts.append(" ".join(line) + "\n")
+            line.clear()
+        if end_para and parts:
+            parts.append("\n")
+
+    for i, level in enumerate(word_data.get("level", [])):
+        if int(level) != 5:  # word rows only
+            continue
+        text = str(word_data["text"][i]).strip()
+        if not text:
+            continue
+        pkey = (word_data["block_num"][i], word_data["par_num"][i])
+        lkey = (*pkey, word_data["line_num"][i])
+        if lkey != line_key and line_key is not None:
+            _end_line(end_para=pkey != para_key)
+        line_key, para_key = lkey, pkey
+        line.append(text)
+
+    _end_line(end_para=True)
+    return "".join(parts) + "\f"
+
+
+# ── Multi-strategy OCR ──────────────────────────────
+
+# Strategy order doubles as the tie-break: equal scores keep the earlier one
+OCR_STRATEGIES = ("raw", "grayscale", "otsu", "standard")
+
+# The probe ranks strategies on a cheap downsampled copy first
+PROBE_LEVEL = "quarter"
+
+
+def _strategy_image(name: str, img: np.ndarray, is_high_res: bool) -> np.ndarray:
+    """Preprocess *img* for one multi-strategy pass."""
+    if name == "raw":
+        return img
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if len(img.shape) == 3 else img
+    if name == "grayscale":
+        return gray
+    if name == "otsu":
+        _, otsu = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return otsu
+    return preprocess_image(img, is_high_res=is_high_res)
+
+
+def _ocr_strategy(
+    name: str,
+    img: np.ndarray,
+    image_path: Path,
+    lang: str,
+    min_conf: int,
+    is_high_res: bool,
+) -> OCRResult:
+    """Preprocess + OCR for one strategy (runs on a pool thread)."""
+    h, w = img.shape[:2]
+    processed = _strategy_image(name, img, is_high_res)
+    return _ocr_on_image(processed, image_path, lang, min_conf, w, h)
+
+
+def _strategy_score(result: OCRResult) -> float:
+    """Confident words weighted by their mean confidence."""
+    if not result.words:
+        return 0.0
+    avg_conf = sum(wd.confidence for wd in result.words) / len(result.words)
+    return len(result.words) * (avg_conf / 100.0)
+
+
+def _meets_target(result: OCRResult, target_conf: int, target_words: int) -> bool:
+    if not result.words or len(result.words) < target_words:
+        return False
+    return sum(wd.confidence for wd in result.words) / len(result.words) >= target_conf
+
+
+def _strategy_policy() -> tuple:
+    """Settings that can change the multi-strategy result (part of the cache key)."""
+    doc = get_settings().document
+    return (
+        doc.ocr_probe, doc.ocr_probe_margin,
+        doc.ocr_target_confidence, doc.ocr_target_words,
+        doc.ocr_tile_above, doc.ocr_tile_px, doc.ocr_tile_overlap,
+    )
+
+
+def ocr_workers(limit: int | None = None) -> int:
+    """Concurrent OCR passes for one image (``document.ocr_workers``).
+
+    ``0`` splits the machine between the batch's label workers.  *limit*
+    caps the result (e.g. one pass per strategy).
+    """
+    settings = get_settings()
+    workers = settings.document.ocr_workers
+    if workers <= 0:
+        label_workers = max(1, settings.processing.max_workers)
+        workers = (os.cpu_count() or 1) // label_workers
+    if limit is not None:
+        workers = min(workers, limit)
+    return max(1, workers)
+
+
+def _probe_strategies(
+    pool: ThreadPoolExecutor,
+    img: np.ndarray,
+    image_path: Path,
+    lang: str,
+    min_conf: int,
+    is_high_res: bool,
+) -> tuple[list[str], dict[str, float]]:
+    """Score every strategy on the ``PROBE_LEVEL`` copy; best first."""
+    probe, _ = downscale(img, PROBE_LEVEL)
+    results = pool.map(
+        lambda name: _ocr_strategy(name, probe, image_path, lang, min_conf, is_high_res),
+        OCR_STRATEGIES,
+    )
+    scores = {name: _strategy_score(r) for name, r in zip(OCR_STRATEGIES, results)}
+    # Stable sort: ties keep strategy order
+    order = sorted(OCR_STRATEGIES, key=lambda name: -scores[name])
+    logger.debug(
+        "  OCR probe %s: %s",
+        image_path.name,
+        ", ".join(f"{n}={scores[n]:.1f}" for n in order),
+    )
+    return order, scores
+
+
+def text_from_words(words: list[OCRWord]) -> str:
+    """Plain text for a word list, laid out like ``text_from_ocr_data``.
+
+    Only the words themselves are known, so a block change stands in for
+    a paragraph break.
+    """
+    return text_from_ocr_data({
+        "level": [5] * len(words),
+        "text": [wd.text for wd in words],
+        "block_num": [wd.block for wd in words],
+        "par_num": [1] * len(words),
+        "line_num": [wd.line for wd in words],
+    })
+
+
 def _run_ocr_multi_strategy(
     img: np.ndarray,
     image_path: Path,
@@ -260,63 +461,370 @@ def _run_ocr_multi_strategy(
 
     Strategies:
     1. Raw image (no preprocessing) — best for clean, high-res scans
-    2. Grayscale + Otsu threshold — good for mixed backgrounds
-    3. Grayscale + denoise — good for noisy scans
+    2. Grayscale only — preserves most detail
+    3. Grayscale + Otsu threshold — good for mixed backgrounds
     4. Standard preprocessing (grayscale + adaptive threshold + denoise)
 
     Picks the strategy that produces the most confident words.
-    """
-    h, w = img.shape[:2]
-    
-    strategies: list[tuple[str, np.ndarray]] = [
-        ("raw", img.copy()),
-    ]
 
-    # Strategy 2: Grayscale only (preserves most detail)
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if len(img.shape) == 3 else img.copy()
-    strategies.append(("grayscale", gray))
-
-    # Strategy 3: Grayscale + Otsu (good for high-res)
-    _, otsu = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    strategies.append(("otsu", otsu))
-
-    # Strategy 4: Standard preprocessing
-    standard = preprocess_image(img, is_high_res=is_high_res)
-    strategies.append(("standard", standard))
+    The passes run concurrently on ``ocr_workers()`` threads —
+    pytesseract shells out to one ``tesseract`` process per call and
+    OpenCV releases the GIL, so threads get the cores without pickling
+    a 70-megapixel array into worker processes.  Two policies avoid
+    paying for all four full-resolution passes:
+
+    - **Probe** (``document.ocr_probe``): every strategy is first run on
+      the ``PROBE_LEVEL`` copy.  If the probe winner leads the runner-up
+      by ``ocr_probe_margin``, only the winner runs at full resolution.
+      Otherwise full-resolution passes are queued in probe order.
+    - **Early exit**: results are taken in queue order, and the first
+      one with ``ocr_target_words`` words at a mean confidence of
+      ``ocr_target_confidence`` or more wins; passes not yet started
+      are cancelled.
+
+    Results are consumed in queue order, never completion order, so the
+    chosen strategy does not depend on thread timing.
+    """
+    doc = get_settings().document
+    workers = ocr_workers(limit=len(OCR_STRATEGIES))
+    order = list(OCR_STRATEGIES)
+    shortlist = order
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-strategy")
+    try:
+        if doc.ocr_probe:
+            order, probe_scores = _probe_strategies(
+                pool, img, image_path, lang, min_conf, is_high_res,
+            )
+            best, runner_up = probe_scores[order[0]], probe_scores[order[1]]
+            if best > 0 and best >= runner_up * (1 + doc.ocr_probe_margin):
+                shortlist = order[:1]
+
+        best_result, best_score, best_name = _pick_strategy(
+            pool, workers, shortlist, img, image_path, lang, min_conf, is_high_res,
+        )
+        # The probe winner came back empty at full size — try the rest
+        if best_score <= 0 and len(shortlist) < len(order):
+            best_result, best_score, best_name = _pick_strategy(
+                pool, workers, order[1:], img, image_path, lang, min_conf, is_high_res,
+                best=(best_result, best_score, best_name),
+            )
+    finally:
+        # Don't wait for passes an early exit made redundant
+        pool.shutdown(wait=False, cancel_futures=True)
 
-    best_result: OCRResult | None = None
-    best_score = -1
+    logger.info(
+        "Multi-strategy OCR %s: best=%s, %d words, %d chars",
+        image_path.name,
+        best_name,
+        best_result.word_count,
+        len(best_result.full_text),
+    )
+    return best_result
 
-    for name, processed in strategies:
-        result = _ocr_on_image(processed, image_path, lang, min_conf, w, h)
 
-        # Score by: number of confident words + average confidence
-        if result.words:
-            avg_conf = sum(wd.confidence for wd in result.words) / len(result.words)
-            score = len(result.words) * (avg_conf / 100.0)
-        else:
-            score = 0
+def _pick_strategy(
+    pool: ThreadPoolExecutor,
+    workers: int,
+    names: list[str],
+    img: np.ndarray,
+    image_path: Path,
+    lang: str,
+    min_conf: int,
+    is_high_res: bool,
+    best: tuple[OCRResult | None, float, str] = (None, -1.0, ""),
+) -> tuple[OCRResult, float, str]:
+    """Full-resolution passes for *names*, best first; stops at the target.
 
+    At most *workers* passes are in flight — the next one is queued only
+    as a result is consumed, so an early exit never starts another pass.
+    """
+    doc = get_settings().document
+    best_result, best_score, best_name = best
+    pending = deque(names)
+    in_flight: deque = deque()
+
+    def _fill() -> None:
+        while pending and len(in_flight) < workers:
+            name = pending.popleft()
+            in_flight.append((name, pool.submit(
+                _ocr_strategy, name, img, image_path, lang, min_conf, is_high_res,
+            )))
+
+    _fill()
+    while in_flight:
+        name, future = in_flight.popleft()
+        result = future.result()
+        score = _strategy_score(result)
         logger.debug(
             "  OCR strategy '%s': %d words, score=%.1f",
             name, len(result.words), score,
         )
-
         if score > best_score:
-            best_score = score
-            best_result = result
+            best_result, best_score, best_name = result, score, name
+        if _meets_target(result, doc.ocr_target_confidence, doc.ocr_target_words):
+            skipped = list(pending) + [n for n, f in in_flight if f.cancel()]
+            if skipped:
+                logger.debug("  OCR early exit on '%s' — skipped %s", name, ", ".join(skipped))
+            break
+        _fill()
+    return best_result, best_score, best_name
+
+
+# ── Tiled OCR ───────────────────────────────────────
+
+# Words closer than this to an interior tile edge may be cut off
+_TILE_EDGE_PX = 2
+
+
+def tile_grid(width: int, height: int, tile: int, overlap: int) -> list[tuple[int, int, int, int]]:
+    """Overlapping ``(x, y, w, h)`` tiles covering a *width* × *height* image.
+
+    Tiles are at most *tile* px square, evenly spaced so neighbours
+    overlap by at least *overlap* px, in row-major order.
+    """
+    def _starts(length: int) -> list[int]:
+        if length <= tile:
+            return [0]
+        n = math.ceil((length - overlap) / (tile - overlap))
+        return [round(i * (length - tile) / (n - 1)) for i in range(n)]
+
+    return [
+        (x, y, min(tile, width - x), min(tile, height - y))
+        for y in _starts(height)
+        for x in _starts(width)
+    ]
 
-    # If all strategies failed, return the standard one
-    if best_result is None:
-        best_result = _ocr_on_image(standard, image_path, lang, min_conf, w, h)
 
+def _ocr_tile(
+    strategy: str,
+    img: np.ndarray,
+    tile: tuple[int, int, int, int],
+    image_path: Path,
+    lang: str,
+    min_conf: int,
+    is_high_res: bool,
+) -> list[OCRWord]:
+    """OCR one tile (a view — no full-size copy); words in tile pixels."""
+    x, y, w, h = tile
+    view = img[y:y + h, x:x + w]
+    return _ocr_strategy(strategy, view, image_path, lang, min_conf, is_high_res).words
+
+
+def merge_tile_words(
+    tiles: list[tuple[int, int, int, int]],
+    tile_words: list[list[OCRWord]],
+    width: int,
+    height: int,
+    cell: int = 256,
+) -> list[OCRWord]:
+    """Merge per-tile words into one image-level word list.
+
+    Words are shifted to image pixels and their block numbers renumbered
+    so blocks stay distinct across tiles.  A word read in two overlapping
+    tiles is kept once: candidates are ranked whole-before-clipped
+    (clipped = touching an interior tile edge), then by confidence, and a
+    word is dropped when it covers more than half of an already kept box.
+    Survivors keep tile / Tesseract reading order.
+    """
+    candidates: list[tuple[bool, int, int, OCRWord]] = []
+    blocks: dict[tuple[int, int], int] = {}
+    for t, ((tx, ty, tw, th), words) in enumerate(zip(tiles, tile_words)):
+        for wd in words:
+            clipped = (
+                (tx > 0 and wd.x <= _TILE_EDGE_PX)
+                or (ty > 0 and wd.y <= _TILE_EDGE_PX)
+                or (tx + tw < width and wd.x + wd.w >= tw - _TILE_EDGE_PX)
+                or (ty + th < height and wd.y + wd.h >= th - _TILE_EDGE_PX)
+            )
+            block = blocks.setdefault((t, wd.block), len(blocks) + 1)
+            shifted = replace(wd, x=wd.x + tx, y=wd.y + ty, block=block)
+            candidates.append((clipped, -wd.confidence, len(candidates), shifted))
+
+    # Spatial hash: only boxes sharing a grid cell can overlap
+    grid: dict[tuple[int, int], list[OCRWord]] = {}
+
+    def _cells(wd: OCRWord):
+        for cy in range(wd.y // cell, (wd.y + wd.h) // cell + 1):
+            for cx in range(wd.x // cell, (wd.x + wd.w) // cell + 1):
+                yield cx, cy
+
+    kept: list[tuple[int, OCRWord]] = []
+    for _, _, idx, wd in sorted(candidates, key=lambda c: c[:3]):
+        area = max(wd.w * wd.h, 1)
+        duplicate = False
+        for key in _cells(wd):
+            for other in grid.get(key, ()):
+                ix = min(wd.x + wd.w, other.x + other.w) - max(wd.x, other.x)
+                iy = min(wd.y + wd.h, other.y + other.h) - max(wd.y, other.y)
+                if ix > 0 and iy > 0 and ix * iy > 0.5 * min(area, max(other.w * other.h, 1)):
+                    duplicate = True
+                    break
+            if duplicate:
+                break
+        if duplicate:
+            continue
+        kept.append((idx, wd))
+        for key in _cells(wd):
+            grid.setdefault(key, []).append(wd)
+
+    return [wd for _, wd in sorted(kept, key=lambda k: k[0])]
+
+
+def _run_ocr_tiled(
+    img: np.ndarray,
+    image_path: Path,
+    lang: str,
+    min_conf: int,
+    is_high_res: bool,
+) -> OCRResult:
+    """
+    OCR a very large image in overlapping tiles.
+
+    The strategy is chosen once, by the probe on the ``PROBE_LEVEL`` copy
+    of the whole image; only that strategy then runs at full resolution,
+    tile by tile (``ocr_tile_px`` square, ``ocr_tile_overlap`` px of
+    overlap) on ``ocr_workers()`` threads.  Tiles are views into the
+    decoded image, so at most ``ocr_workers()`` tile-sized preprocessing
+    copies exist at once instead of four full-size variants.
+
+    Words are merged by ``merge_tile_words``; the overlap should exceed
+    the widest word on the label or that word comes back in pieces.
+    ``full_text`` is rebuilt from the merged words, so unlike a single
+    Tesseract pass it leaves out words below ``min_conf``.
+    """
+    doc = get_settings().document
+    h, w = img.shape[:2]
+    tiles = tile_grid(w, h, doc.ocr_tile_px, doc.ocr_tile_overlap)
+
+    pool = ThreadPoolExecutor(max_workers=ocr_workers(), thread_name_prefix="ocr-tile")
+    try:
+        order, _ = _probe_strategies(pool, img, image_path, lang, min_conf, is_high_res)
+        strategy = order[0]
+        tile_words = list(pool.map(
+            lambda tile: _ocr_tile(strategy, img, tile, image_path, lang, min_conf, is_high_res),
+            tiles,
+        ))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    words = merge_tile_words(tiles, tile_words, w, h)
+    full_text = text_from_words(words)
+    result = OCRResult(
+        image_path=str(image_path),
+        image_size=(w, h),
+        full_text=full_text,
+        words=words,
+        text_blocks=_group_text_blocks(words),
+    )
     logger.info(
-        "Multi-strategy OCR %s: best=%d words, %d chars",
-        image_path.name,
-        best_result.word_count if best_result else 0,
-        len(best_result.full_text) if best_result else 0,
+        "Tiled OCR %s: %d tiles, strategy=%s, %d words (%d before merge)",
+        image_path.name, len(tiles), strategy, len(words), sum(map(len, tile_words)),
     )
-    return best_result
+    return result
+
+
+def ocr_from_vector_text(
+    ctx: DocumentContext,
+    page_number: int,
+    dpi: int,
+    image_path: Path | str = "",
+    image_size: tuple[int, int] = (0, 0),
+) -> OCRResult:
+    """
+    Build an OCR result from a page's PDF text layer — no Tesseract.
+
+    For vector pages the embedded text is exact, so word boxes come
+    from ``page.get_text("words")``, mapped through the page rotation
+    (words are reported in unrotated page space, the render is rotated)
+    and scaled from PDF points to render pixels at ``dpi``. Every word
+    has confidence 100, and ``block`` /
+    ``line`` follow PyMuPDF's block and line numbers. Word boxes are
+    font line boxes (ascender to descender), which run slightly taller
+    than Tesseract's glyph boxes.
+
+    Args:
+        ctx: The label's shared ``DocumentContext``.
+        page_number: 1-based page number.
+        dpi: Resolution of the rendered page the coordinates refer to.
+        image_path: Rendered page path recorded on the result.
+        image_size: Rendered page size ``(w, h)`` recorded on the result.
+            Default: computed from the (rotated) page rect at ``dpi``, so
+            the page need not be rendered.
+    """
+    scale = dpi / 72.0
+    page = ctx.page(page_number)
+    to_render = page.rotation_matrix * fitz.Matrix(scale, scale)
+    if image_size == (0, 0):
+        pix_rect = (page.rect * fitz.Matrix(scale, scale)).irect  # what get_pixmap renders
+        image_size = (pix_rect.width, pix_rect.height)
+
+    words = []
+    for x0, y0, x1, y1, text, block_no, line_no, _ in ctx.words(page_number):
+        text = text.strip()
+        if not text:
+            continue
+        box = fitz.Rect(x0, y0, x1, y1) * to_render
+        words.append(OCRWord(
+            text=text,
+            confidence=100,
+            x=int(box.x0),
+            y=int(box.y0),
+            w=int(box.width),
+            h=int(box.height),
+            block=block_no,
+            line=line_no,
+        ))
+
+    result = OCRResult(
+        image_path=str(image_path),
+        image_size=image_size,
+        full_text=ctx.text(page_number),
+        words=words,
+        text_blocks=_group_text_blocks(words),
+    )
+    logger.debug(
+        "Vector text page %d → %d words, %d chars (OCR skipped)",
+        page_number, len(words), len(result.full_text),
+    )
+    return result
+
+
+def split_ocr_by_regions(
+    ocr_result: OCRResult,
+    regions: list[tuple[float, float, float, float]],
+    dpi: int,
+    rotation: fitz.Matrix | None = None,
+) -> list[OCRResult]:
+    """
+    Spatial join of a page's OCR words onto regions of the page.
+
+    *regions* are ``(x0, y0, x1, y1)`` boxes in unrotated PDF points
+    (e.g. ``LabelSection.bbox``); word boxes are in render pixels at
+    *dpi*, i.e. after the page's ``/Rotate`` — pass the page's
+    ``rotation_matrix`` as *rotation* to map the regions the same way.
+    A word belongs to every region containing its centre — the same rule
+    the segmenter uses for text blocks.  Each region gets its own
+    ``OCRResult`` with those words (in reading order) and the text
+    rebuilt from them.
+    """
+    to_pixels = fitz.Matrix(dpi / 72.0, dpi / 72.0)
+    if rotation is not None:
+        to_pixels = rotation * to_pixels
+    index = ocr_result.index
+    results = []
+    for region in regions:
+        box = (fitz.Rect(region) * to_pixels).normalize()
+        ids = index.centered_in(box.x0, box.y0, box.x1, box.y1)
+        words = [ocr_result.words[i] for i in ids]
+        results.append(OCRResult(
+            image_path=ocr_result.image_path,
+            image_size=ocr_result.image_size,
+            full_text=text_from_words(words) if words else "",
+            words=words,
+            text_blocks=_group_text_blocks(words),
+        ))
+    return results
 
 
 def _group_text_blocks(words: list[OCRWord]) -> list[dict]:
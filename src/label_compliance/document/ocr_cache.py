@@ -0,0 +1,294 @@
+"""
+OCR Cache
+==========
+Persistent, content-addressed cache of OCR results.
+
+``check``, ``run`` and ``validate`` OCR the very same page and embedded
+images on every run (``validate`` re-renders and re-OCRs the clean PDF
+that ``check`` just processed).  Results are stored in SQLite under
+``<cache_dir>/ocr.sqlite``, keyed by a hash of:
+
+    - the decoded pixels (shape, dtype, bytes) — not the file path,
+    - the OCR settings: preprocessing steps, multi-strategy flag,
+      language, ``ocr_min_confidence``,
+    - the Tesseract version.
+
+The word table is stored columnar: one little-endian int32 blob of
+``(confidence, x, y, w, h, block, line)`` rows plus the word texts
+joined by newlines.  ``text_blocks`` are re-derived on load.
+
+The cache is size-bounded (``document.ocr_cache_mb``); the least
+recently used entries are evicted first.  Hit/miss counters are kept in
+the database so they add up across worker processes — see
+``label-compliance ocr-cache``.
+
+Lookups stay read-only: counters accumulate in memory and ``last_used``
+is only refreshed when it is older than ``_TOUCH_INTERVAL``.  Both are
+written in one transaction by ``flush()`` — on every ``put``, every
+``_FLUSH_EVERY`` lookups and at process exit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+from functools import lru_cache
+from multiprocessing import util as mp_util
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from label_compliance.config import get_settings
+from label_compliance.utils.log import get_logger
+
+if TYPE_CHECKING:
+    from label_compliance.document.ocr import OCRResult
+
+logger = get_logger(__name__)
+
+OCR_CACHE_FILENAME = "ocr.sqlite"
+_SCHEMA_VERSION = 1
+# Seconds before a hit refreshes an entry's last_used (LRU granularity)
+_TOUCH_INTERVAL = 3600.0
+# Lookups between writes of the pending counters / last_used refreshes
+_FLUSH_EVERY = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ocr (
+    key        TEXT PRIMARY KEY,
+    width      INTEGER NOT NULL,
+    height     INTEGER NOT NULL,
+    full_text  TEXT NOT NULL,
+    word_boxes BLOB NOT NULL,
+    word_texts TEXT NOT NULL,
+    nbytes     INTEGER NOT NULL,
+    last_used  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stats (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+@lru_cache(maxsize=1)
+def tesseract_version() -> str:
+    """Installed Tesseract version (part of every cache key)."""
+    try:
+        import pytesseract
+        return str(pytesseract.get_tesseract_version())
+    except Exception:
+        return "unavailable"
+
+
+class OCRCache:
+    """SQLite-backed OCR result store with LRU size eviction."""
+
+    def __init__(self, path: Path | None = None, max_mb: int | None = None):
+        settings = get_settings()
+        if path is None:
+            path = settings.paths.cache_dir / OCR_CACHE_FILENAME
+        self.path = Path(path)
+        max_mb = settings.document.ocr_cache_mb if max_mb is None else max_mb
+        self.max_bytes = max_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self._pending = {"hits": 0, "misses": 0}  # counters not yet in the DB
+        self._touched: dict[str, float] = {}      # key → last_used to write
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+
+    # ── Connection ─────────────────────────────────────
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # Never share a connection across fork() — worker processes reopen
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS ocr; DROP TABLE IF EXISTS stats;")
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            if self._pid != os.getpid():
+                # Runs at exit in the main process and in pool workers alike
+                # (pool workers skip atexit)
+                self._pending = {"hits": 0, "misses": 0}
+                self._touched = {}
+                mp_util.Finalize(self, self.flush, exitpriority=10)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None and self._pid == os.getpid():
+            self.flush()
+            self._conn.close()
+        self._conn = None
+
+    # ── Keys ───────────────────────────────────────────
+
+    @staticmethod
+    def make_key(image: np.ndarray, **params) -> str:
+        """Content hash of *image* plus every OCR parameter that matters."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{image.shape}|{image.dtype}|".encode())
+        h.update(np.ascontiguousarray(image).data)
+        for name in sorted(params):
+            h.update(f"|{name}={params[name]!r}".encode())
+        h.update(f"|tesseract={tesseract_version()}".encode())
+        return h.hexdigest()
+
+    # ── Lookup / store ─────────────────────────────────
+
+    def get(self, key: str, image_path: Path | str = "") -> OCRResult | None:
+        """Cached result for *key* (recorded under *image_path*), or ``None``."""
+        from label_compliance.document.ocr import OCRResult, OCRWord, _group_text_blocks
+
+        try:
+            row = self.conn.execute(
+                "SELECT width, height, full_text, word_boxes, word_texts, last_used"
+                " FROM ocr WHERE key = ?",
+                (key,),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("OCR cache read failed (%s) — running OCR", e)
+            return None
+
+        if row is None:
+            self._count("misses")
+            return None
+        width, height, full_text, boxes_blob, texts, last_used = row
+        now = time.time()
+        if now - last_used > _TOUCH_INTERVAL:
+            self._touched[key] = now
+        self._count("hits")
+
+        boxes = np.frombuffer(boxes_blob, dtype="<i4").reshape(-1, 7)
+        words = [
+            OCRWord(
+                text=text, confidence=int(b[0]),
+                x=int(b[1]), y=int(b[2]), w=int(b[3]), h=int(b[4]),
+                block=int(b[5]), line=int(b[6]),
+            )
+            for text, b in zip(texts.split("\n") if texts else [], boxes)
+        ]
+        return OCRResult(
+            image_path=str(image_path),
+            image_size=(width, height),
+            full_text=full_text,
+            words=words,
+            text_blocks=_group_text_blocks(words),
+        )
+
+    def put(self, key: str, result: OCRResult) -> None:
+        boxes = np.array(
+            [(w.confidence, w.x, w.y, w.w, w.h, w.block, w.line) for w in result.words],
+            dtype="<i4",
+        ).reshape(-1, 7)
+        texts = "\n".join(w.text for w in result.words)
+        blob = boxes.tobytes()
+        nbytes = len(blob) + len(texts.encode("utf-8")) + len(result.full_text.encode("utf-8"))
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO ocr VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, result.image_size[0], result.image_size[1], result.full_text,
+                     blob, texts, nbytes, time.time()),
+                )
+                self._touched.pop(key, None)
+                self._write_pending()
+            self._evict()
+        except sqlite3.Error as e:
+            logger.warning("OCR cache write failed: %s", e)
+
+    def _count(self, counter: str) -> None:
+        setattr(self, counter, getattr(self, counter) + 1)
+        self._pending[counter] += 1
+        if self._pending["hits"] + self._pending["misses"] >= _FLUSH_EVERY:
+            self.flush()
+
+    def _write_pending(self) -> None:
+        """Add the pending counters / last_used refreshes (caller commits)."""
+        self.conn.executemany(
+            "INSERT INTO stats VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + ?",
+            [(name, n, n) for name, n in self._pending.items() if n],
+        )
+        self.conn.executemany(
+            "UPDATE ocr SET last_used = ? WHERE key = ?",
+            [(ts, key) for key, ts in self._touched.items()],
+        )
+        self._pending = {"hits": 0, "misses": 0}
+        self._touched = {}
+
+    def flush(self) -> None:
+        """Write the in-memory hit/miss counters and last_used refreshes."""
+        if not (self._touched or any(self._pending.values())):
+            return
+        try:
+            with self.conn:
+                self._write_pending()
+        except sqlite3.Error as e:
+            logger.warning("OCR cache stats write failed: %s", e)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its budget."""
+        total = self.conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM ocr").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)  # leave headroom so we don't evict on every put
+        freed = 0
+        victims = []
+        for key, nbytes in self.conn.execute("SELECT key, nbytes FROM ocr ORDER BY last_used"):
+            if total - freed <= target:
+                break
+            victims.append((key,))
+            freed += nbytes
+        with self.conn:
+            self.conn.executemany("DELETE FROM ocr WHERE key = ?", victims)
+        logger.debug("OCR cache: evicted %d entries (%.1f MB)", len(victims), freed / 1e6)
+
+    # ── Maintenance ────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Entry count, stored size and lifetime hit/miss counters."""
+        self.flush()
+        entries, nbytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM ocr",
+        ).fetchone()
+        counters = dict(self.conn.execute("SELECT name, value FROM stats").fetchall())
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "entries": entries,
+            "bytes": nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._pending = {"hits": 0, "misses": 0}
+        self._touched = {}
+        with self.conn:
+            self.conn.execute("DELETE FROM ocr")
+            self.conn.execute("DELETE FROM stats")
+
+
+_cache: OCRCache | None = None
+
+
+def get_ocr_cache() -> OCRCache | None:
+    """Process-wide cache, or ``None`` when ``document.ocr_cache`` is off."""
+    global _cache
+    if not get_settings().document.ocr_cache:
+        return None
+    if _cache is None:
+        _cache = OCRCache()
+    return _cache
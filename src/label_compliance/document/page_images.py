@@ -0,0 +1,373 @@
+"""
+Page Images
+============
+In-memory page rasters shared by every image stage of a label check.
+
+``render_pages`` writes a 300-DPI PNG per page, and OCR, layout
+analysis, barcode reading, section cropping, symbol matching and the
+annotator used to ``cv2.imread`` / ``Image.open`` that same file again —
+several full-page PNG encodes and decodes per page per label.
+
+``PageImageProvider`` renders each page once with PyMuPDF and exposes
+the pixmap samples directly as a NumPy array (no copy). The derived
+variants are cached per page under a memory budget
+(``document.page_cache_mb``) and evicted least-recently-used:
+
+    rgb   → zero-copy view of the pixmap samples (H×W×3)
+    bgr   → OpenCV colour order, as ``cv2.imread`` returns it
+    gray  → ``cv2.cvtColor(bgr, COLOR_BGR2GRAY)``
+
+Each variant also exists at coarser pyramid levels (``PYRAMID``):
+``half`` and ``quarter`` resolution (150 / 75 DPI at the default render)
+and ``match`` (longer side ≤ 1000 px).  Every stage declares the level
+it consumes — OCR and barcodes need ``native``, layout runs at ``half``,
+template matching at ``match`` — and maps what it finds back to native
+pixel coordinates with ``PageImage.to_native``.
+
+PNG files are only written when something needs a real file: debug
+output (``document.save_page_images``) or an AI vision request.
+
+Image consumers accept a ``PageImage`` or a plain path; ``as_page_image``
+wraps a path into a file-backed ``PageImage`` so both go through the
+same code.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import fitz  # PyMuPDF
+import numpy as np
+from PIL import Image
+
+from label_compliance.config import get_settings
+from label_compliance.document.context import DocumentContext
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+# ── Resolution pyramid ─────────────────────────────
+
+
+@dataclass(frozen=True)
+class PyramidLevel:
+    """One level of the per-page resolution pyramid."""
+
+    name: str
+    scale: float = 1.0  # fraction of the native render
+    max_side: int | None = None  # instead: fit the longer side into this many px
+    interpolation: int = cv2.INTER_AREA
+
+    def factor(self, width: int, height: int) -> float:
+        if self.max_side is None:
+            return self.scale
+        longest = max(width, height)
+        return min(1.0, self.max_side / longest) if longest else 1.0
+
+
+# At the default 300-DPI render: 300 / 150 / 75 DPI, plus a ≤1000 px level
+# for template matching (bilinear, as matching has always used).
+PYRAMID: dict[str, PyramidLevel] = {
+    lvl.name: lvl
+    for lvl in (
+        PyramidLevel("native"),
+        PyramidLevel("half", scale=0.5),
+        PyramidLevel("quarter", scale=0.25),
+        PyramidLevel("match", max_side=1000, interpolation=cv2.INTER_LINEAR),
+    )
+}
+
+
+def downscale(image: np.ndarray, level: str) -> tuple[np.ndarray, float]:
+    """Resize a native-level array to *level*; returns ``(array, factor)``."""
+    spec = PYRAMID[level]
+    h, w = image.shape[:2]
+    f = spec.factor(w, h)
+    if f >= 1.0:
+        return image, 1.0
+    size = (max(1, int(w * f)), max(1, int(h * f)))
+    return cv2.resize(image, size, interpolation=spec.interpolation), f
+
+
+class _PixmapBuffer:
+    """Array interface over a pixmap's samples that keeps the pixmap alive.
+
+    ``np.asarray`` on this object yields a read-only, zero-copy view
+    whose ``.base`` is the buffer — so the pixmap memory lives exactly as
+    long as any array (or PIL view) still refers to it.
+    """
+
+    def __init__(self, pix: fitz.Pixmap):
+        self.pix = pix
+        self.__array_interface__ = {
+            "shape": (pix.height, pix.width, pix.n),
+            "typestr": "|u1",
+            "data": (pix.samples_ptr, True),
+            "version": 3,
+        }
+
+
+class PageImage:
+    """A decoded image with lazily derived colour variants.
+
+    Provider-backed images (one rendered PDF page) fetch their variants
+    from the shared, budgeted cache; file-backed images (embedded
+    rasters, crops) decode their file once and keep the arrays locally.
+
+    Every image sits at one pyramid ``level``; :meth:`at` returns the
+    same image at another level and :meth:`to_native` maps a box found
+    there back to native pixels.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        provider: PageImageProvider | None = None,
+        page_number: int = 0,
+        level: str = "native",
+        native: PageImage | None = None,
+    ):
+        self.path = Path(path)  # on-disk location (may not be written yet)
+        self.page_number = page_number
+        self.level = level
+        self._provider = provider
+        self._native = native  # file-backed levels derive from this image
+        self._local: dict[str, np.ndarray | None] = {}
+        self._levels: dict[str, PageImage] = {}
+
+    def __repr__(self) -> str:
+        return f"PageImage({self.path.name!r}, page={self.page_number}, level={self.level!r})"
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    def _variant(self, kind: str) -> np.ndarray | None:
+        if self._provider is not None:
+            return self._provider.variant(self.page_number, kind, self.level)
+        if kind not in self._local:
+            if self._native is not None:
+                base = self._native._variant(kind)
+                self._local[kind] = None if base is None else downscale(base, self.level)[0]
+            elif kind == "bgr":
+                self._local[kind] = cv2.imread(str(self.path))
+            else:
+                bgr = self._variant("bgr")
+                if bgr is None:
+                    self._local[kind] = None
+                elif kind == "gray":
+                    self._local[kind] = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+                else:
+                    self._local[kind] = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        return self._local[kind]
+
+    @property
+    def rgb(self) -> np.ndarray | None:
+        return self._variant("rgb")
+
+    @property
+    def bgr(self) -> np.ndarray | None:
+        """BGR array (``None`` if a file-backed image can't be read)."""
+        return self._variant("bgr")
+
+    @property
+    def gray(self) -> np.ndarray | None:
+        return self._variant("gray")
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """``(width, height)`` in pixels, ``(0, 0)`` if unreadable."""
+        arr = self.rgb if self._provider is not None else self.bgr
+        if arr is None:
+            return (0, 0)
+        return (arr.shape[1], arr.shape[0])
+
+    # ── Pyramid ────────────────────────────────────────
+
+    def native(self) -> PageImage:
+        if self.level == "native":
+            return self
+        if self._provider is not None:
+            return self._provider.page(self.page_number)
+        return self._native
+
+    def at(self, level: str) -> PageImage:
+        """This image at another pyramid level (see ``PYRAMID``)."""
+        if level not in PYRAMID:
+            raise ValueError(f"Unknown pyramid level: {level}")
+        native = self.native()
+        if level == "native":
+            return native
+        if self._provider is not None:
+            return self._provider.page(self.page_number, level)
+        if level not in native._levels:
+            native._levels[level] = PageImage(
+                native.path, page_number=native.page_number, level=level, native=native,
+            )
+        return native._levels[level]
+
+    @property
+    def scale(self) -> float:
+        """Pixels at this level per native pixel (1.0 at ``native``)."""
+        if self.level == "native":
+            return 1.0
+        w, h = self.native().size
+        return PYRAMID[self.level].factor(w, h)
+
+    def to_native(self, x: float, y: float, w: float, h: float) -> tuple[int, int, int, int]:
+        """Map an ``(x, y, w, h)`` box at this level to native pixels."""
+        s = self.scale
+        return (int(x / s), int(y / s), int(w / s), int(h / s))
+
+    # ── Output ─────────────────────────────────────────
+
+    def pil(self) -> Image.Image:
+        """Read-only PIL view of the RGB pixels (``.copy()`` before drawing)."""
+        rgb = self.rgb
+        if rgb is None:
+            raise OSError(f"Cannot read image: {self.path}")
+        h, w = rgb.shape[:2]
+        return Image.frombuffer("RGB", (w, h), np.ascontiguousarray(rgb), "raw", "RGB", 0, 1)
+
+    def save(self) -> Path:
+        """Make sure the (native) image exists on disk and return its path."""
+        if self._provider is not None:
+            return self._provider.save(self.page_number)
+        return self.path
+
+
+def as_page_image(image: Path | str | PageImage) -> PageImage:
+    """Wrap a path in a file-backed ``PageImage`` (pass-through otherwise)."""
+    if isinstance(image, PageImage):
+        return image
+    return PageImage(image)
+
+
+class PageImageProvider:
+    """Renders a label's pages once and serves them as cached arrays.
+
+    Args:
+        ctx: The label's shared ``DocumentContext``.
+        output_dir: Where page PNGs go when they are written.
+        dpi: Render resolution. Default: ``document.render_dpi``.
+        budget_mb: Cache budget. Default: ``document.page_cache_mb``.
+    """
+
+    def __init__(
+        self,
+        ctx: DocumentContext,
+        output_dir: Path,
+        dpi: int | None = None,
+        budget_mb: int | None = None,
+    ):
+        settings = get_settings()
+        self.ctx = ctx
+        self.output_dir = Path(output_dir)
+        self.dpi = dpi or settings.document.render_dpi
+        budget_mb = settings.document.page_cache_mb if budget_mb is None else budget_mb
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self._matrix = fitz.Matrix(self.dpi / 72.0, self.dpi / 72.0)
+        # (page, kind, level) → read-only array, least recently used first
+        self._cache: OrderedDict[tuple[int, str, str], np.ndarray] = OrderedDict()
+        self._cached_bytes = 0
+        self._pages: dict[tuple[int, str], PageImage] = {}
+        self._written: set[int] = set()  # pages whose PNG this run wrote
+        self.renders = 0  # number of rasterisations (re-renders after eviction included)
+
+    # ── Pages ──────────────────────────────────────────
+
+    @property
+    def page_numbers(self) -> range:
+        return self.ctx.page_numbers
+
+    def page(self, page_number: int, level: str = "native") -> PageImage:
+        key = (page_number, level)
+        if key not in self._pages:
+            self._pages[key] = PageImage(
+                self.path(page_number), provider=self, page_number=page_number, level=level,
+            )
+        return self._pages[key]
+
+    def pages(self) -> list[PageImage]:
+        return [self.page(n) for n in self.page_numbers]
+
+    def path(self, page_number: int) -> Path:
+        """Where the page PNG lives (same name ``render_pages`` uses)."""
+        return self.output_dir / f"page-{page_number:02d}.png"
+
+    def saved_path(self, page_number: int) -> Path | None:
+        """The page PNG if this provider has written it, else ``None``."""
+        return self.path(page_number) if page_number in self._written else None
+
+    def save(self, page_number: int) -> Path:
+        """Write the page PNG (once) and return its path."""
+        path = self.path(page_number)
+        # Always overwrite once per run — a PNG left over from an earlier
+        # revision of the PDF must not be reused
+        if page_number not in self._written:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self.page(page_number).pil().save(str(path))
+            self._written.add(page_number)
+            logger.debug("  Wrote page image %s", path.name)
+        return path
+
+    def save_all(self) -> list[Path]:
+        return [self.save(n) for n in self.page_numbers]
+
+    # ── Cached variants ───────────────────────────────
+
+    def variant(self, page_number: int, kind: str, level: str = "native") -> np.ndarray:
+        key = (page_number, kind, level)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        if level != "native":
+            arr, factor = downscale(self.variant(page_number, kind), level)
+            if factor >= 1.0:
+                return arr  # already small enough — the native array itself
+        elif kind == "rgb":
+            pix = self.ctx.page(page_number).get_pixmap(matrix=self._matrix)
+            self.renders += 1
+            arr = np.asarray(_PixmapBuffer(pix))
+        elif kind == "bgr":
+            arr = cv2.cvtColor(self.variant(page_number, "rgb"), cv2.COLOR_RGB2BGR)
+        elif kind == "gray":
+            arr = cv2.cvtColor(self.variant(page_number, "bgr"), cv2.COLOR_BGR2GRAY)
+        else:
+            raise ValueError(f"Unknown page image variant: {kind}")
+
+        # Shared between stages — nobody may draw on the cached pixels
+        arr.flags.writeable = False
+        self._cache[key] = arr
+        self._cached_bytes += arr.nbytes
+        self._evict(keep=key)
+        return arr
+
+    def _evict(self, keep: tuple[int, str, str]) -> None:
+        """Drop least-recently-used variants until back under budget."""
+        for key in list(self._cache):
+            if self._cached_bytes <= self.budget_bytes:
+                break
+            if key == keep:
+                continue
+            arr = self._cache.pop(key)
+            self._cached_bytes -= arr.nbytes
+            logger.debug("  Evicted page %d %s@%s (%.1f MB)", *key, arr.nbytes / 1e6)
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._cached_bytes
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._cached_bytes = 0
+
+    def close(self) -> None:
+        """Free the cached arrays and the underlying document handles."""
+        self.clear()
+        self.ctx.close()
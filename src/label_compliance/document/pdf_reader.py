@@ -2,7 +2,8 @@
 PDF Reader
 ===========
 Extracts text, tables, and metadata from label PDFs.
-Uses pdfplumber for text/tables and PyMuPDF for metadata.
+Uses pdfplumber for text/tables and PyMuPDF for metadata, both via
+the shared ``DocumentContext``.
 """
 
 from __future__ import annotations
@@ -10,9 +11,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import fitz  # PyMuPDF
-import pdfplumber
-
+from label_compliance.document.context import DocumentContext, use_context
 from label_compliance.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -55,13 +54,19 @@ class PDFData:
         return fonts
 
 
-def read_pdf(pdf_path: Path) -> PDFData:
+def read_pdf(pdf_path: Path | DocumentContext) -> PDFData:
     """
     Extract all text, tables, fonts, and metadata from a PDF.
 
     This is the primary entry point for processing label PDFs.
+    Accepts a path or a shared ``DocumentContext``.
     """
-    pdf_path = Path(pdf_path)
+    with use_context(pdf_path) as ctx:
+        return _read_pdf(ctx)
+
+
+def _read_pdf(ctx: DocumentContext) -> PDFData:
+    pdf_path = ctx.path
     logger.info("Reading PDF: %s", pdf_path.name)
 
     result = PDFData(path=pdf_path, filename=pdf_path.name)
@@ -69,48 +74,45 @@ def read_pdf(pdf_path: Path) -> PDFData:
 
     # ── pdfplumber pass: text + tables ────────────────
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            result.num_pages = len(pdf.pages)
-
-            for i, page in enumerate(pdf.pages, 1):
-                text = page.extract_text() or ""
-                tables = page.extract_tables() or []
-
-                # Clean tables
-                clean_tables = []
-                for table in tables:
-                    clean_table = []
-                    for row in table:
-                        if row:
-                            clean_row = [str(c).strip() if c else "" for c in row]
-                            clean_table.append(clean_row)
-                    if clean_table:
-                        clean_tables.append(clean_table)
-
-                page_data = PageData(
-                    page_number=i,
-                    text=text,
-                    tables=clean_tables,
-                    width=float(page.width),
-                    height=float(page.height),
-                )
-                result.pages.append(page_data)
-                all_text_parts.append(text)
+        pdf = ctx.plumber
+        result.num_pages = len(pdf.pages)
+
+        for i, page in enumerate(pdf.pages, 1):
+            text = ctx.plumber_text(i)
+            tables = ctx.tables(i)
+
+            # Clean tables
+            clean_tables = []
+            for table in tables:
+                clean_table = []
+                for row in table:
+                    if row:
+                        clean_row = [str(c).strip() if c else "" for c in row]
+                        clean_table.append(clean_row)
+                if clean_table:
+                    clean_tables.append(clean_table)
+
+            page_data = PageData(
+                page_number=i,
+                text=text,
+                tables=clean_tables,
+                width=float(page.width),
+                height=float(page.height),
+            )
+            result.pages.append(page_data)
+            all_text_parts.append(text)
 
     except Exception:
         logger.exception("pdfplumber failed for %s", pdf_path.name)
 
     # ── PyMuPDF pass: fonts + metadata ───────────────
     try:
-        doc = fitz.open(str(pdf_path))
-        result.metadata = dict(doc.metadata) if doc.metadata else {}
-
-        for i, page in enumerate(doc):
-            if i < len(result.pages):
-                fonts = _extract_fonts(page)
-                result.pages[i].fonts = fonts
+        result.metadata = ctx.metadata
 
-        doc.close()
+        spans = ctx.span_index
+        for i in ctx.page_numbers:
+            if i <= len(result.pages):
+                result.pages[i - 1].fonts = spans.unique_fonts(spans.page_ids(i))
     except Exception:
         logger.exception("PyMuPDF font extraction failed for %s", pdf_path.name)
 
@@ -121,29 +123,3 @@ def read_pdf(pdf_path: Path) -> PDFData:
     )
     return result
 
-
-def _extract_fonts(page: fitz.Page) -> list[dict]:
-    """Extract font information from a PyMuPDF page."""
-    fonts = []
-    try:
-        blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)["blocks"]
-        seen = set()
-        for block in blocks:
-            if block.get("type") != 0:  # text blocks only
-                continue
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    font_name = span.get("font", "unknown")
-                    font_size = round(span.get("size", 0), 1)
-                    key = (font_name, font_size)
-                    if key not in seen:
-                        seen.add(key)
-                        fonts.append({
-                            "name": font_name,
-                            "size": font_size,
-                            "flags": span.get("flags", 0),
-                            "color": span.get("color", 0),
-                        })
-    except Exception:
-        logger.debug("Font extraction failed for page")
-    return fonts
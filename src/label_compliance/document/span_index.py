@@ -0,0 +1,184 @@
+"""
+Span Index
+===========
+One columnar index of a label's PDF text spans.
+
+Font data used to be pulled out of the text dicts three times per
+label — ``read_pdf`` (unique font/size pairs per page), ``extract_fonts``
+(one ``FontInfo`` per span) and the segmenter (fonts per section) —
+each walking blocks → lines → spans and building its own dicts, and the
+spec checks then filtered the flat ``FontInfo`` list again per rule.
+``SpanIndex`` walks the spans once per document
+(``DocumentContext.span_index``) and keeps:
+
+    - per-span columns: page, font id, size, flags, color, bbox and the
+      centre of the enclosing text block,
+    - page offsets (spans come in page order), so a page is a slice,
+    - the ``FontInfo`` list of non-blank spans, built once,
+    - a memoised text lookup over those ``FontInfo`` texts.
+
+Queries return span ids (``page_ids``, ``in_region``) or positions in
+``fonts`` (``find``).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from label_compliance.document.font_analyzer import FontInfo
+
+if TYPE_CHECKING:
+    from label_compliance.document.context import DocumentContext
+
+_BOLD = 2 ** 4    # span flag bit 4
+_ITALIC = 2 ** 1  # span flag bit 1
+
+
+class SpanIndex:
+    """Columnar view over text spans, with page, region and text lookups."""
+
+    def __init__(self, rows: list[tuple], page_count: int = 0, fonts: list[FontInfo] | None = None):
+        """
+        *rows* are ``(page, font, size, flags, color, bbox, block_bbox, text)``
+        tuples in page order.  *fonts* reuses an existing ``FontInfo`` list
+        (one per non-blank row, in order) instead of building one.
+        """
+        n = len(rows)
+        self.size = n
+        self.font_names: list[str] = []
+        font_ids: dict[str, int] = {}
+
+        self.page = np.fromiter((r[0] for r in rows), dtype=np.int32, count=n)
+        self.font_id = np.fromiter(
+            (font_ids.setdefault(r[1], len(font_ids)) for r in rows), dtype=np.int32, count=n,
+        )
+        self.font_names = list(font_ids)
+        self.font_size = np.fromiter((r[2] for r in rows), dtype=np.float64, count=n)
+        self.flags = np.fromiter((r[3] for r in rows), dtype=np.int64, count=n)
+        self.color = np.fromiter((r[4] for r in rows), dtype=np.int64, count=n)
+        self.bbox = np.array([r[5] for r in rows], dtype=np.float64).reshape(-1, 4)
+        blocks = np.array([r[6] for r in rows], dtype=np.float64).reshape(-1, 4)
+        self.block_cx = (blocks[:, 0] + blocks[:, 2]) / 2
+        self.block_cy = (blocks[:, 1] + blocks[:, 3]) / 2
+        self.texts: list[str] = [r[7] for r in rows]
+
+        last_page = max(page_count, int(self.page.max()) if n else 0)
+        self._page_sorted = bool(np.all(self.page[1:] >= self.page[:-1]))
+        self._page_starts = np.searchsorted(self.page, np.arange(1, last_page + 2))
+
+        # Non-blank spans, as FontInfo
+        stripped = [t.strip() for t in self.texts]
+        self.text_ids = np.array([i for i, t in enumerate(stripped) if t], dtype=np.int64)
+        if fonts is None:
+            fonts = [
+                FontInfo(
+                    name=self.font_names[self.font_id[i]],
+                    size=float(self.font_size[i]),
+                    is_bold=bool(self.flags[i] & _BOLD),
+                    is_italic=bool(self.flags[i] & _ITALIC),
+                    color=int(self.color[i]),
+                    text=stripped[i][:200],
+                    page=int(self.page[i]),
+                    bbox=tuple(float(v) for v in self.bbox[i]),
+                )
+                for i in self.text_ids
+            ]
+        self.fonts = fonts
+        self._lower = [f.text.lower() for f in fonts]
+        self._found: dict[str, list[int]] = {}
+
+    # ── Builders ───────────────────────────────────────
+
+    @classmethod
+    def from_context(cls, ctx: DocumentContext) -> SpanIndex:
+        """Walk every page's text dict once."""
+        rows = []
+        for page_num in ctx.page_numbers:
+            for block in ctx.blocks(page_num):
+                if block.get("type") != 0:
+                    continue
+                block_bbox = tuple(block.get("bbox", (0, 0, 0, 0)))
+                for line in block.get("lines", []):
+                    for span in line.get("spans", []):
+                        rows.append((
+                            page_num,
+                            span.get("font", "unknown"),
+                            round(span.get("size", 0), 1),
+                            span.get("flags", 0),
+                            span.get("color", 0),
+                            tuple(span.get("bbox", (0, 0, 0, 0))),
+                            block_bbox,
+                            span.get("text", ""),
+                        ))
+        return cls(rows, page_count=ctx.page_count)
+
+    @classmethod
+    def from_fonts(cls, fonts: list[FontInfo] | None) -> SpanIndex:
+        """Index over an existing ``FontInfo`` list (kept as ``fonts``)."""
+        fonts = fonts or []
+        rows = [
+            (f.page, f.name, f.size, (_BOLD if f.is_bold else 0) | (_ITALIC if f.is_italic else 0),
+             f.color, f.bbox, f.bbox, f.text)
+            for f in fonts
+        ]
+        return cls(rows, fonts=fonts)
+
+    # ── Queries ────────────────────────────────────────
+
+    def page_ids(self, page_number: int) -> np.ndarray:
+        """Span ids on a page, in reading order."""
+        if not self._page_sorted:
+            return np.flatnonzero(self.page == page_number)
+        if page_number < 1 or page_number >= len(self._page_starts):
+            return np.empty(0, dtype=np.int64)
+        start, end = self._page_starts[page_number - 1], self._page_starts[page_number]
+        return np.arange(start, end, dtype=np.int64)
+
+    def in_region(
+        self, page_number: int, x0: float, y0: float, x1: float, y1: float, by_block: bool = False,
+    ) -> np.ndarray:
+        """Span ids on a page whose centre lies in the box, in reading order.
+
+        ``by_block`` tests the centre of the span's text block instead,
+        so whole blocks fall on one side of a boundary.
+        """
+        ids = self.page_ids(page_number)
+        if by_block:
+            cx, cy = self.block_cx[ids], self.block_cy[ids]
+        else:
+            box = self.bbox[ids]
+            cx, cy = (box[:, 0] + box[:, 2]) / 2, (box[:, 1] + box[:, 3]) / 2
+        return ids[(cx >= x0) & (cx <= x1) & (cy >= y0) & (cy <= y1)]
+
+    def find(self, text: str) -> list[int]:
+        """Positions in ``fonts`` of spans containing *text* (case-insensitive)."""
+        needle = text.lower()
+        found = self._found.get(needle)
+        if found is None:
+            found = self._found[needle] = [i for i, t in enumerate(self._lower) if needle in t]
+        return found
+
+    # ── Views ──────────────────────────────────────────
+
+    def font_dicts(self, ids: np.ndarray, color: bool = False) -> list[dict]:
+        """``{"name", "size", "flags"}`` (plus ``"color"``) per span id."""
+        names = self.font_names
+        dicts = [
+            {"name": names[f], "size": s, "flags": fl}
+            for f, s, fl in zip(self.font_id[ids].tolist(), self.font_size[ids].tolist(),
+                                self.flags[ids].tolist())
+        ]
+        if color:
+            for d, c in zip(dicts, self.color[ids].tolist()):
+                d["color"] = c
+        return dicts
+
+    def unique_fonts(self, ids: np.ndarray) -> list[dict]:
+        """Distinct (font, size) pairs among *ids*, first occurrence first."""
+        if not len(ids):
+            return []
+        pairs = np.column_stack((self.font_id[ids].astype(np.float64), self.font_size[ids]))
+        _, first = np.unique(pairs, axis=0, return_index=True)
+        return self.font_dicts(ids[np.sort(first)], color=True)
@@ -30,6 +30,7 @@ import cv2
 import numpy as np
 
 from label_compliance.document.ocr import OCRResult
+from label_compliance.document.page_images import PageImage, downscale
 from label_compliance.document.symbol_library_db import (
     SymbolEntry,
     SymbolLibrary,
@@ -42,6 +43,10 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Template matching doesn't need high resolution — the pyramid's
+# ≤1000 px level is sufficient.
+MATCH_LEVEL = "match"
+
 
 @dataclass
 class SymbolComparisonResult:
@@ -176,7 +181,7 @@ def compare_symbols_text(
 
 
 def compare_symbols_visual(
-    image_path: Path,
+    image_path: Path | PageImage,
     required_symbols: list[SymbolEntry] | None = None,
     library: SymbolLibrary | None = None,
     confidence_threshold: float = 0.6,
@@ -185,7 +190,8 @@ def compare_symbols_visual(
     Compare label image against reference symbol thumbnails via template matching.
 
     Args:
-        image_path: Path to the rendered label page image.
+        image_path: Path to the rendered label page image, or the
+            in-memory ``PageImage`` (its cached grayscale is reused).
         required_symbols: Symbols to look for. Defaults to all standard symbols.
         library: Symbol library instance.
         confidence_threshold: Minimum match score (0.0-1.0) to count as found.
@@ -200,30 +206,30 @@ def compare_symbols_visual(
     if required_symbols is None:
         required_symbols = _get_required_symbols(library)
 
-    # Load label image
-    label_img = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
-    if label_img is None:
+    # Load label image at the matching level (cached per page for
+    # rendered pages; files are decoded and downscaled here)
+    if isinstance(image_path, PageImage):
+        level = image_path.at(MATCH_LEVEL)
+        label_img_search = level.gray
+        lw, lh = image_path.native().size
+        downscale_factor = level.scale
+    else:
+        label_img = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if label_img is not None:
+            lh, lw = label_img.shape[:2]
+            label_img_search, downscale_factor = downscale(label_img, MATCH_LEVEL)
+        else:
+            label_img_search = None
+    if label_img_search is None:
         logger.error("Cannot read label image: %s", image_path)
         return SymbolComparisonReport(total_required=len(required_symbols), total_missing=len(required_symbols))
 
-    # Pre-process: downscale large images aggressively for template matching.
-    # Template matching doesn't need high resolution — 1000px is sufficient.
-    lh, lw = label_img.shape[:2]
-    downscale_factor = 1.0
-    _MAX_DIM_FOR_MATCHING = 1000
-    if max(lw, lh) > _MAX_DIM_FOR_MATCHING:
-        downscale_factor = float(_MAX_DIM_FOR_MATCHING) / max(lw, lh)
-        label_img_search = cv2.resize(
-            label_img,
-            (int(lw * downscale_factor), int(lh * downscale_factor)),
-        )
+    if downscale_factor < 1.0:
         logger.info(
             "Downscaled %dx%d label → %dx%d for template matching (factor %.2f)",
             lw, lh, label_img_search.shape[1], label_img_search.shape[0],
             downscale_factor,
         )
-    else:
-        label_img_search = label_img
 
     report = SymbolComparisonReport(total_required=len(required_symbols))
     results: list[SymbolComparisonResult] = []
@@ -329,7 +335,7 @@ Respond with JSON only:
 
 
 def compare_symbols_ai_vision(
-    image_path: Path,
+    image_path: Path | PageImage,
     ai_provider: "AIProvider",
     required_symbols: list[SymbolEntry] | None = None,
     library: SymbolLibrary | None = None,
@@ -358,6 +364,9 @@ def compare_symbols_ai_vision(
     if required_symbols is None:
         required_symbols = _get_required_symbols(library)
 
+    if isinstance(image_path, PageImage):
+        image_path = image_path.save()  # the provider API takes a file
+
     # Build the checklist for the prompt
     checklist_lines = []
     for sym in required_symbols:
@@ -568,7 +577,7 @@ def _match_symbol_to_ai_detections(
 
 def compare_symbols_combined(
     ocr_result: OCRResult,
-    image_path: Path | None = None,
+    image_path: Path | PageImage | None = None,
     required_symbols: list[SymbolEntry] | None = None,
     library: SymbolLibrary | None = None,
     ai_provider: "AIProvider | None" = None,
@@ -7,7 +7,6 @@ OCR text matching and visual template matching.
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -44,6 +43,9 @@ def detect_symbols_from_ocr(
     """
     Check which required symbols/elements are present based on OCR text.
 
+    All rules are evaluated in one pass over the text by the rule list's
+    ``CompiledRuleSet``.
+
     Args:
         ocr_result: OCR output from a label image.
         rules: List of rule dicts from config/rules/*.yaml.
@@ -51,36 +53,28 @@ def detect_symbols_from_ocr(
     Returns:
         List of SymbolMatch results, one per rule.
     """
-    text_lower = ocr_result.text_lower
+    from label_compliance.compliance.ruleset import compile_rules
+
     findings: list[SymbolMatch] = []
+    all_hits = compile_rules(rules).scan(ocr_result.full_text, ocr_result.text_lower)
 
-    for rule in rules:
+    for rule, hits in zip(rules, all_hits):
         rule_id = rule.get("id", "unknown")
-        markers = rule.get("markers", [])
-        pattern = rule.get("pattern")
-        check_type = rule.get("check_type", "text_match")
-
         matched_markers: list[str] = []
         locations: list[dict] = []
-        pattern_value: str | None = None
-
-        # Text marker matching
-        for marker in markers:
-            if marker.lower() in text_lower:
-                matched_markers.append(marker)
-                # Find bounding box locations
-                for word in ocr_result.find_text(marker):
-                    locations.append({
-                        "text": word.text,
-                        "x": word.x, "y": word.y,
-                        "w": word.w, "h": word.h,
-                    })
+
+        # Text markers, with bounding box locations
+        for marker in hits.markers:
+            matched_markers.append(marker)
+            for word in ocr_result.find_text(marker):
+                locations.append({
+                    "text": word.text,
+                    "x": word.x, "y": word.y,
+                    "w": word.w, "h": word.h,
+                })
 
         # Pattern matching (dates, measurements)
-        if pattern:
-            m = re.search(pattern, ocr_result.full_text, re.IGNORECASE)
-            if m:
-                pattern_value = m.group(0)
+        pattern_value = hits.pattern_value
 
         is_found = len(matched_markers) > 0 or pattern_value is not None
 
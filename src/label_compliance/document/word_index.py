@@ -0,0 +1,121 @@
+"""
+Word Index
+===========
+Columnar, query-optimised view over an OCR word list.
+
+Rule evaluation asks the same ``OCRResult`` for marker words and
+regions over and over (per marker, per rule, per section).  A linear
+scan of ``OCRWord`` objects per query makes dense drawings with
+thousands of words quadratic.  ``WordIndex`` is built once per result:
+
+    - boxes and confidences as int32 NumPy columns,
+    - a substring index: all lowered word texts joined by ``\\n`` with
+      their start offsets, so a search is ``str.find`` in C and each hit
+      maps back to its word with one ``searchsorted``,
+    - a uniform-grid spatial index: word ids sorted by the grid cell of
+      their top-left corner (CSR layout), so a region query only looks
+      at the cells the region covers,
+    - word centres, for assigning words to page regions (sections).
+
+Queries return word indices in reading order; ``OCRResult`` maps them
+back to its ``OCRWord`` list.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from label_compliance.document.ocr import OCRWord
+
+# Grid cell side in pixels — a few text lines at 300 DPI
+GRID_CELL_PX = 256
+
+
+class WordIndex:
+    """Substring and spatial index over a fixed list of words."""
+
+    def __init__(self, words: list[OCRWord], cell: int = GRID_CELL_PX):
+        n = len(words)
+        self.size = n
+        self.cell = cell
+
+        cols = np.array(
+            [(w.x, w.y, w.w, w.h, w.confidence) for w in words], dtype=np.int32,
+        ).reshape(-1, 5)
+        self.x0, self.y0 = cols[:, 0], cols[:, 1]
+        self.x1 = self.x0 + cols[:, 2]
+        self.y1 = self.y0 + cols[:, 3]
+        self.confidence = cols[:, 4]
+        self.cx = (self.x0 + self.x1) / 2
+        self.cy = (self.y0 + self.y1) / 2
+
+        # ── Substring index ──
+        lowered = [w.text.lower() for w in words]
+        self._haystack = "\n".join(lowered)
+        lengths = np.fromiter(map(len, lowered), dtype=np.int64, count=n)
+        self._starts = np.zeros(n, dtype=np.int64)
+        if n:
+            np.cumsum(lengths[:-1] + 1, out=self._starts[1:])
+        self._found: dict[str, np.ndarray] = {}
+
+        # ── Spatial grid (CSR over top-left cells) ──
+        cx = np.maximum(self.x0, 0) // cell
+        cy = np.maximum(self.y0, 0) // cell
+        self._cols = int(cx.max()) + 1 if n else 1
+        cell_ids = cy.astype(np.int64) * self._cols + cx
+        self._order = np.argsort(cell_ids, kind="stable")
+        self._sorted_cells = cell_ids[self._order]
+
+    def find(self, search: str) -> np.ndarray:
+        """Indices of words containing *search* (case-insensitive)."""
+        needle = search.lower()
+        hit = self._found.get(needle)
+        if hit is not None:
+            return hit
+        if not needle:
+            hit = np.arange(self.size)
+        elif "\n" in needle:
+            hit = np.empty(0, dtype=np.int64)
+        else:
+            found = []
+            haystack, starts = self._haystack, self._starts
+            pos = haystack.find(needle)
+            while pos != -1:
+                i = int(np.searchsorted(starts, pos, side="right")) - 1
+                found.append(i)
+                if i + 1 >= self.size:
+                    break
+                pos = haystack.find(needle, int(starts[i + 1]))  # next word on
+            hit = np.array(found, dtype=np.int64)
+        self._found[needle] = hit
+        return hit
+
+    def in_region(self, x: int, y: int, w: int, h: int) -> np.ndarray:
+        """Indices of words lying entirely inside the box, in reading order."""
+        if not self.size or w < 0 or h < 0:
+            return np.empty(0, dtype=np.int64)
+        cell = self.cell
+        cx0, cx1 = max(x, 0) // cell, min((x + w) // cell, self._cols - 1)
+        cy0, cy1 = max(y, 0) // cell, (y + h) // cell
+        if cx1 < cx0:
+            return np.empty(0, dtype=np.int64)
+
+        # One contiguous slice of the sorted ids per grid row
+        rows = np.arange(cy0, cy1 + 1, dtype=np.int64) * self._cols
+        starts = np.searchsorted(self._sorted_cells, rows + cx0, side="left")
+        ends = np.searchsorted(self._sorted_cells, rows + cx1, side="right")
+        slices = [self._order[s:e] for s, e in zip(starts, ends) if e > s]
+        candidates = np.concatenate(slices or [np.empty(0, dtype=np.int64)])
+        inside = (
+            (self.x0[candidates] >= x) & (self.y0[candidates] >= y)
+            & (self.x1[candidates] <= x + w) & (self.y1[candidates] <= y + h)
+        )
+        return np.sort(candidates[inside])
+
+    def centered_in(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """Indices of words whose centre lies in ``[x0, x1] × [y0, y1]``."""
+        inside = (self.cx >= x0) & (self.cx <= x1) & (self.cy >= y0) & (self.cy <= y1)
+        return np.flatnonzero(inside)
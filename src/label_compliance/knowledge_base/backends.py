@@ -0,0 +1,246 @@
+"""
+Vector Backends
+================
+Storage behind ``KnowledgeStore``, selected by
+``knowledge_base.vector_backend``:
+
+    chromadb — ChromaDB persistent client with an HNSW cosine index
+               (``<knowledge_base_dir>/chromadb``).
+    numpy    — ``NumpyBackend``: an exact in-process index for small
+               knowledge bases (``<knowledge_base_dir>/vectors``).
+
+The KB is a few thousand chunks, where opening a ChromaDB client and
+its HNSW index costs more than brute force.  ``NumpyBackend`` keeps
+unit-normalised vectors as a float16 matrix in ``vectors.f16``, opened
+as a read-only memory map (worker processes share the pages), and ids,
+documents and metadata in ``index.json``.  Queries are one batched
+matrix multiply (float32 accumulation, in row blocks) with an exact
+top-k per query and an optional ``iso_id`` filter.  Writes rewrite
+both files atomically — they only happen during ingest.
+
+Both backends return hits as ``{"id", "document", "metadata",
+"distance"}`` with cosine distance (``1 - similarity``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+VECTOR_BACKENDS = ("chromadb", "numpy")
+
+# Rows converted to float32 per matmul block
+_QUERY_BLOCK_ROWS = 16384
+
+
+class ChromaBackend:
+    """ChromaDB collection with cosine HNSW (the original store)."""
+
+    name = "chromadb"
+
+    def __init__(self, path: Path, collection_name: str):
+        import chromadb
+
+        path.mkdir(parents=True, exist_ok=True)
+        self.collection_name = collection_name
+        self._client = chromadb.PersistentClient(path=str(path))
+        self._collection = self._client.get_or_create_collection(
+            name=collection_name,
+            metadata={"hnsw:space": "cosine"},
+        )
+
+    def count(self) -> int:
+        return self._collection.count()
+
+    def get(self, iso_id: str) -> tuple[list[str], list[str], list[dict]]:
+        """Ids, documents and metadata of every document of one standard."""
+        res = self._collection.get(where={"iso_id": iso_id}, include=["documents", "metadatas"])
+        return res["ids"], res["documents"], res["metadatas"]
+
+    def upsert(self, ids: list[str], documents: list[str], metadatas: list[dict],
+               embeddings: list[list[float]]) -> None:
+        self._collection.upsert(
+            ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings,
+        )
+
+    def delete(self, ids: list[str]) -> None:
+        self._collection.delete(ids=ids)
+
+    def query(self, embeddings: list[list[float]], n_results: int,
+              iso_filter: str | None = None) -> list[list[dict]]:
+        results = self._collection.query(
+            query_embeddings=embeddings,
+            n_results=n_results,
+            where={"iso_id": iso_filter} if iso_filter else None,
+            include=["documents", "metadatas", "distances"],
+        )
+        return [
+            [
+                {
+                    "id": results["ids"][q][i],
+                    "document": results["documents"][q][i],
+                    "metadata": results["metadatas"][q][i],
+                    "distance": results["distances"][q][i],
+                }
+                for i in range(len(results["ids"][q]))
+            ]
+            for q in range(len(embeddings))
+        ]
+
+    def reset(self) -> None:
+        self._client.delete_collection(self.collection_name)
+        self._collection = self._client.create_collection(
+            name=self.collection_name,
+            metadata={"hnsw:space": "cosine"},
+        )
+
+
+class NumpyBackend:
+    """Exact cosine top-k over a memory-mapped float16 matrix (see module doc)."""
+
+    name = "numpy"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._load()
+
+    # ── Files ──────────────────────────────────────────
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.path / "vectors.f16"
+
+    @property
+    def _index_path(self) -> Path:
+        return self.path / "index.json"
+
+    def _load(self) -> None:
+        self.ids: list[str] = []
+        self.documents: list[str] = []
+        self.metadatas: list[dict] = []
+        self.dim = 0
+        self._matrix: np.ndarray = np.empty((0, 0), dtype=np.float16)
+        if self._index_path.exists():
+            index = json.loads(self._index_path.read_text(encoding="utf-8"))
+            self.ids, self.documents = index["ids"], index["documents"]
+            self.metadatas = index["metadatas"]
+            self.dim = index["dim"]
+            if self.ids:
+                self._matrix = np.memmap(
+                    self._vectors_path, dtype=np.float16, mode="r", shape=(len(self.ids), self.dim),
+                )
+        self._row = {doc_id: i for i, doc_id in enumerate(self.ids)}
+        self._iso = np.array([m.get("iso_id", "") for m in self.metadatas], dtype=object)
+
+    def _save(self, ids: list[str], documents: list[str], metadatas: list[dict],
+              matrix: np.ndarray) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_vectors = self._vectors_path.with_suffix(".tmp")
+        tmp_index = self._index_path.with_suffix(".tmp")
+        np.ascontiguousarray(matrix, dtype=np.float16).tofile(tmp_vectors)
+        tmp_index.write_text(json.dumps({
+            "dim": int(matrix.shape[1]) if matrix.size else self.dim,
+            "ids": ids, "documents": documents, "metadatas": metadatas,
+        }, ensure_ascii=False), encoding="utf-8")
+        self._matrix = np.empty((0, 0), dtype=np.float16)  # release the old map first
+        os.replace(tmp_vectors, self._vectors_path)
+        os.replace(tmp_index, self._index_path)
+        self._load()
+
+    # ── Backend API ────────────────────────────────────
+
+    def count(self) -> int:
+        return len(self.ids)
+
+    def get(self, iso_id: str) -> tuple[list[str], list[str], list[dict]]:
+        rows = [i for i, m in enumerate(self.metadatas) if m.get("iso_id") == iso_id]
+        return ([self.ids[i] for i in rows], [self.documents[i] for i in rows],
+                [self.metadatas[i] for i in rows])
+
+    def upsert(self, ids: list[str], documents: list[str], metadatas: list[dict],
+               embeddings: list[list[float]]) -> None:
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+
+        all_ids, all_docs, all_meta = list(self.ids), list(self.documents), list(self.metadatas)
+        if self.ids:
+            matrix = np.array(self._matrix, dtype=np.float16)
+        else:
+            matrix = np.empty((0, vectors.shape[1]), np.float16)
+        new_rows = []
+        for doc_id, doc, meta, vec in zip(ids, documents, metadatas, vectors):
+            row = self._row.get(doc_id)
+            if row is None:
+                all_ids.append(doc_id)
+                all_docs.append(doc)
+                all_meta.append(meta)
+                new_rows.append(vec)
+            else:
+                all_docs[row], all_meta[row] = doc, meta
+                matrix[row] = vec
+        if new_rows:
+            matrix = np.vstack([matrix, np.asarray(new_rows, dtype=np.float16)])
+        self._save(all_ids, all_docs, all_meta, matrix)
+
+    def delete(self, ids: list[str]) -> None:
+        drop = {self._row[i] for i in ids if i in self._row}
+        if not drop:
+            return
+        keep = [i for i in range(len(self.ids)) if i not in drop]
+        self._save(
+            [self.ids[i] for i in keep], [self.documents[i] for i in keep],
+            [self.metadatas[i] for i in keep], np.asarray(self._matrix)[keep],
+        )
+
+    def query(self, embeddings: list[list[float]], n_results: int,
+              iso_filter: str | None = None) -> list[list[dict]]:
+        queries = np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1)
+        if not self.ids or not len(queries):
+            return [[] for _ in range(len(queries))]
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms == 0, 1, norms)
+
+        scores = np.empty((len(queries), len(self.ids)), dtype=np.float32)
+        for start in range(0, len(self.ids), _QUERY_BLOCK_ROWS):
+            block = np.asarray(self._matrix[start:start + _QUERY_BLOCK_ROWS], dtype=np.float32)
+            scores[:, start:start + len(block)] = queries @ block.T
+        if iso_filter:
+            scores[:, self._iso != iso_filter] = -np.inf
+
+        k = min(n_results, len(self.ids))
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        hits = []
+        for q, rows in enumerate(top):
+            rows = rows[np.argsort(-scores[q, rows], kind="stable")]
+            hits.append([
+                {
+                    "id": self.ids[r],
+                    "document": self.documents[r],
+                    "metadata": self.metadatas[r],
+                    "distance": float(1 - scores[q, r]),
+                }
+                for r in rows if np.isfinite(scores[q, r])
+            ])
+        return hits
+
+    def reset(self) -> None:
+        self._save([], [], [], np.empty((0, self.dim), dtype=np.float16))
+
+
+def open_backend(name: str, kb_dir: Path, collection_name: str) -> ChromaBackend | NumpyBackend:
+    """The configured vector backend for *kb_dir*."""
+    if name == "numpy":
+        return NumpyBackend(kb_dir / "vectors")
+    if name == "chromadb":
+        return ChromaBackend(kb_dir / "chromadb", collection_name)
+    raise ValueError(
+        f"Unknown knowledge_base.vector_backend {name!r} (expected one of {VECTOR_BACKENDS})"
+    )
@@ -0,0 +1,170 @@
+"""
+Embedding Cache
+================
+Persistent cache of text embeddings.
+
+Every ``run`` used to re-embed every requirement and section chunk of
+every standard with sentence-transformers, although the texts rarely
+change.  Vectors are stored in SQLite under
+``<cache_dir>/embeddings.sqlite``, keyed by a hash of the embedding
+model name and the exact text, as little-endian float32 blobs.
+
+``embed_texts`` looks texts up here first and only runs the model on the
+misses — when everything hits, the model is never loaded.  The cache is
+size-bounded (``knowledge_base.embedding_cache_mb``, least recently used
+evicted first).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+
+from label_compliance.config import get_settings
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+EMBEDDING_CACHE_FILENAME = "embeddings.sqlite"
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key       TEXT PRIMARY KEY,
+    vector    BLOB NOT NULL,
+    last_used REAL NOT NULL
+);
+"""
+
+# SQLite's default limit on host parameters per statement is 999
+_LOOKUP_BATCH = 500
+
+
+class EmbeddingCache:
+    """SQLite-backed (model, text) → vector store with LRU size eviction."""
+
+    def __init__(self, path: Path | None = None, max_mb: int | None = None):
+        settings = get_settings()
+        if path is None:
+            path = settings.paths.cache_dir / EMBEDDING_CACHE_FILENAME
+        self.path = Path(path)
+        max_mb = settings.kb.embedding_cache_mb if max_mb is None else max_mb
+        self.max_bytes = max_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # Never share a connection across fork() — worker processes reopen
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS embeddings")
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        h = hashlib.blake2b(digest_size=20)
+        h.update(model.encode("utf-8"))
+        h.update(b"\x00")
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Cached vectors for whichever of *keys* are present."""
+        found: dict[str, list[float]] = {}
+        unique = list(dict.fromkeys(keys))
+        try:
+            for start in range(0, len(unique), _LOOKUP_BATCH):
+                batch = unique[start:start + _LOOKUP_BATCH]
+                marks = ",".join("?" * len(batch))
+                for key, blob in self.conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({marks})", batch,
+                ):
+                    found[key] = np.frombuffer(blob, dtype="<f4").tolist()
+            if found:
+                with self.conn:
+                    self.conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(time.time(), k) for k in found],
+                    )
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache read failed (%s) — embedding everything", e)
+            return {}
+        self.hits += len(found)
+        self.misses += len(unique) - len(found)
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        now = time.time()
+        rows = [(k, np.asarray(v, dtype="<f4").tobytes(), now) for k, v in items.items()]
+        try:
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)", rows)
+            self._evict()
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache write failed: %s", e)
+
+    def _evict(self) -> None:
+        """Drop least recently used vectors until the cache fits its budget."""
+        total = self.conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings",
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)  # leave headroom so we don't evict on every put
+        freed = 0
+        victims = []
+        for key, nbytes in self.conn.execute(
+            "SELECT key, LENGTH(vector) FROM embeddings ORDER BY last_used",
+        ):
+            if total - freed <= target:
+                break
+            victims.append((key,))
+            freed += nbytes
+        with self.conn:
+            self.conn.executemany("DELETE FROM embeddings WHERE key = ?", victims)
+        logger.debug("Embedding cache: evicted %d vectors (%.1f MB)", len(victims), freed / 1e6)
+
+    def stats(self) -> dict:
+        entries, nbytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings",
+        ).fetchone()
+        return {"entries": entries, "bytes": nbytes, "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM embeddings")
+
+
+_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Process-wide cache, or ``None`` when ``knowledge_base.embedding_cache`` is off."""
+    global _cache
+    if not get_settings().kb.embedding_cache:
+        return None
+    if _cache is None:
+        _cache = EmbeddingCache()
+    return _cache
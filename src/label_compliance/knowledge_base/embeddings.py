@@ -3,6 +3,10 @@ Embedding Engine
 =================
 Generates vector embeddings using sentence-transformers (free, local).
 Supports swapping to OpenAI embeddings via config.
+
+Vectors go through the persistent embedding cache (see
+``embedding_cache``): only texts not embedded before with the same model
+are sent to the model.
 """
 
 from __future__ import annotations
@@ -30,11 +34,30 @@ def _get_model():
 
 
 def embed_texts(texts: list[str]) -> list[list[float]]:
-    """Embed a list of texts into vectors."""
-    model = _get_model()
+    """Embed a list of texts into vectors (cached texts are not re-embedded)."""
+    from label_compliance.knowledge_base.embedding_cache import get_embedding_cache
+
     # Sanitize: replace None/non-string values with empty string
     clean_texts = [t if isinstance(t, str) else "" for t in texts]
-    embeddings = model.encode(clean_texts, show_progress_bar=len(clean_texts) > 100)
+    cache = get_embedding_cache()
+    if cache is None:
+        return _encode(clean_texts)
+
+    model_name = get_settings().kb.embedding_model
+    keys = [cache.make_key(model_name, t) for t in clean_texts]
+    vectors = cache.get_many(keys)
+    missing = {k: t for k, t in zip(keys, clean_texts) if k not in vectors}
+    if missing:
+        fresh = dict(zip(missing, _encode(list(missing.values()))))
+        cache.put_many(fresh)
+        vectors.update(fresh)
+    logger.debug("Embedded %d texts (%d cached)", len(missing), len(clean_texts) - len(missing))
+    return [vectors[k] for k in keys]
+
+
+def _encode(texts: list[str]) -> list[list[float]]:
+    model = _get_model()
+    embeddings = model.encode(texts, show_progress_bar=len(texts) > 100)
     return [e.tolist() for e in embeddings]
 
 
@@ -6,6 +6,10 @@ parses "shall" requirements, tables, measurement specs, and symbol
 references into a structured format for the knowledge base.
 
 Handles multiple standards (ISO 14607, ISO 15223, ISO 14630, EU MDR, etc.).
+
+An ingest manifest (``<knowledge_base_dir>/ingest_manifest.json``)
+records the SHA-256 of each ingested PDF; an unchanged standard is
+loaded from its saved JSON instead of being parsed again.
 """
 
 from __future__ import annotations
@@ -17,11 +21,15 @@ from pathlib import Path
 import pdfplumber
 
 from label_compliance.config import get_settings
-from label_compliance.utils.helpers import safe_filename
+from label_compliance.utils.helpers import file_hash, safe_filename
 from label_compliance.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+MANIFEST_FILENAME = "ingest_manifest.json"
+# Bump when parsing changes, so every standard is re-ingested once
+PARSER_VERSION = 1
+
 # ── Regex patterns ────────────────────────────────────
 SECTION_RE = re.compile(
     r"^(?P<number>(?:\d+|[A-Z])(?:\.\d+){0,5})\s+(?P<title>[A-Z][A-Za-z].{2,120})$"
@@ -188,15 +196,53 @@ def _extract_keywords(body: str) -> list[str]:
     return sorted(found)
 
 
-def ingest_standard(pdf_path: Path) -> dict:
+# ── Ingest manifest ───────────────────────────────────
+
+
+def _manifest_path() -> Path:
+    return get_settings().paths.knowledge_base_dir / MANIFEST_FILENAME
+
+
+def load_manifest() -> dict[str, dict]:
+    """PDF name → ``{"sha256", "iso_id", "parser"}`` of the last ingest."""
+    path = _manifest_path()
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.warning("Unreadable ingest manifest %s — re-ingesting", path)
+        return {}
+
+
+def _record_ingest(pdf_name: str, entry: dict) -> None:
+    manifest = load_manifest()
+    manifest[pdf_name] = entry
+    _manifest_path().write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def ingest_standard(pdf_path: Path, force: bool = False) -> dict:
     """
     Full ingestion pipeline for one ISO standard PDF.
 
     Returns the structured knowledge base dict and saves
-    it to data/knowledge_base/<standard_id>.json.
+    it to data/knowledge_base/<standard_id>.json.  If the PDF is
+    unchanged since the last ingest (same hash, same parser version)
+    the saved JSON is returned instead, unless *force* is set.
     """
     settings = get_settings()
     iso_id = safe_filename(pdf_path.stem)
+    kb_path = settings.paths.knowledge_base_dir / f"{iso_id}.json"
+    entry = {"sha256": file_hash(pdf_path), "iso_id": iso_id, "parser": PARSER_VERSION}
+
+    if not force and load_manifest().get(pdf_path.name) == entry and kb_path.exists():
+        try:
+            kb = json.loads(kb_path.read_text(encoding="utf-8"))
+            logger.info("Standard unchanged: %s — using %s", pdf_path.name, kb_path.name)
+            return kb
+        except (OSError, ValueError):
+            logger.warning("Unreadable %s — re-ingesting", kb_path.name)
+
     logger.info("Ingesting standard: %s from %s", iso_id, pdf_path.name)
 
     # 1. Extract text
@@ -244,8 +290,8 @@ def ingest_standard(pdf_path: Path) -> dict:
     }
 
     # 5. Save JSON
-    kb_path = settings.paths.knowledge_base_dir / f"{iso_id}.json"
     kb_path.write_text(json.dumps(kb, indent=2, ensure_ascii=False), encoding="utf-8")
+    _record_ingest(pdf_path.name, entry)
     logger.info(
         "  Saved KB: %d sections, %d requirements, %d keywords → %s",
         len(sections), len(all_requirements), len(all_keywords), kb_path.name,
@@ -254,8 +300,8 @@ def ingest_standard(pdf_path: Path) -> dict:
     return kb
 
 
-def ingest_all_standards() -> list[dict]:
-    """Ingest all PDFs in the standards directory."""
+def ingest_all_standards(force: bool = False) -> list[dict]:
+    """Ingest all PDFs in the standards directory (unchanged ones are reused)."""
     settings = get_settings()
     pdf_files = sorted(settings.paths.standards_dir.glob("*.pdf"))
 
@@ -266,7 +312,7 @@ def ingest_all_standards() -> list[dict]:
     results = []
     for pdf_path in pdf_files:
         try:
-            kb = ingest_standard(pdf_path)
+            kb = ingest_standard(pdf_path, force=force)
             results.append(kb)
         except Exception:
             logger.exception("Failed to ingest %s", pdf_path.name)
@@ -7,7 +7,7 @@ matching label text against the KB, and computing coverage.
 
 from __future__ import annotations
 
-from label_compliance.knowledge_base.store import KnowledgeStore
+from label_compliance.knowledge_base.store import KnowledgeStore, get_knowledge_store
 from label_compliance.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -26,13 +26,13 @@ def query_requirements(
         query_text: The label text or element description to search for.
         n_results: Number of results to return.
         iso_filter: Restrict to a specific ISO standard.
-        store: Existing KnowledgeStore instance (creates one if None).
+        store: Existing KnowledgeStore instance (the shared one if None).
 
     Returns:
         List of matching requirement dicts with similarity scores.
     """
     if store is None:
-        store = KnowledgeStore()
+        store = get_knowledge_store()
 
     hits = store.search(query_text, n_results=n_results, iso_filter=iso_filter)
     logger.debug("Query '%s...' → %d hits", query_text[:50], len(hits))
@@ -48,14 +48,13 @@ def find_applicable_requirements(
     For each label element, find applicable ISO requirements.
 
     Returns mapping: element → list of matching requirements.
+    All elements are embedded and searched in one batched query.
     """
     if store is None:
-        store = KnowledgeStore()
+        store = get_knowledge_store()
 
     results = {}
-    for element in label_elements:
-        hits = store.search(element, n_results=5)
-        matching = [h for h in hits if h["similarity"] >= threshold]
-        results[element] = matching
+    for element, hits in zip(label_elements, store.search_many(label_elements, n_results=5)):
+        results[element] = [h for h in hits if h["similarity"] >= threshold]
 
     return results
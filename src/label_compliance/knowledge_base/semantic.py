@@ -0,0 +1,98 @@
+"""
+Semantic Engine
+================
+Section-level semantic matching against the knowledge base.
+
+``match_rule_semantic`` used to open a new ``KnowledgeStore`` (a fresh
+ChromaDB client plus a ``count()``) per rule and embed the first 500
+characters of the label text again for every rule, although the query
+text is the same for all of them.  The engine instead:
+
+    - shares one store per process (``get_knowledge_store``) and the
+      already process-wide embedding model,
+    - chunks the *whole* section text (``kb.chunk_size`` /
+      ``kb.chunk_overlap``) and embeds all chunks in one batch,
+    - runs one batched ChromaDB query for all chunks,
+    - keeps the best similarity per ISO section over all chunk hits, so
+      every rule is resolved from that table without another query.
+
+Section results are memoised by text, so rules checked against the same
+section again (batch runs, re-checks) cost nothing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+from label_compliance.config import get_settings
+from label_compliance.utils.helpers import chunk_text
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Nearest KB documents fetched per chunk
+HITS_PER_CHUNK = 5
+
+
+class SemanticEngine:
+    """Embeds section texts once and resolves rule similarities from the hits."""
+
+    def __init__(self, store=None, max_sections: int = 256):
+        if store is None:
+            from label_compliance.knowledge_base.store import get_knowledge_store
+            store = get_knowledge_store()
+        self.store = store
+        self.max_sections = max_sections
+        self._sections: OrderedDict[str, dict[str, float]] = OrderedDict()
+
+    def section_similarities(self, text: str) -> dict[str, float]:
+        """Best similarity per KB section (``metadata["section"]``) for *text*."""
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        best = self._sections.get(key)
+        if best is not None:
+            self._sections.move_to_end(key)
+            return best
+
+        from label_compliance.knowledge_base.embeddings import embed_texts
+
+        kb = get_settings().kb
+        chunks = chunk_text(text, kb.chunk_size, kb.chunk_overlap) or [text]
+        best = {}
+        for hits in self.store.query_embeddings(embed_texts(chunks), n_results=HITS_PER_CHUNK):
+            for hit in hits:
+                section = hit.get("metadata", {}).get("section", "")
+                sim = hit.get("similarity", 0)
+                if sim > best.get(section, float("-inf")):
+                    best[section] = sim
+        logger.debug("Semantic: %d chunks → %d KB sections", len(chunks), len(best))
+
+        self._sections[key] = best
+        if len(self._sections) > self.max_sections:
+            self._sections.popitem(last=False)
+        return best
+
+    def rule_similarities(self, rules: list[dict], text: str) -> list[float]:
+        """Best similarity of *text* to each rule's ISO section, in rule order."""
+        best = self.section_similarities(text)
+        sims = []
+        for rule in rules:
+            rule_section = rule.get("iso_ref", "")
+            best_sim = 0.0
+            if rule_section:
+                for section, sim in best.items():
+                    if section in rule_section:
+                        best_sim = max(best_sim, sim)
+            sims.append(best_sim)
+        return sims
+
+
+_engine: SemanticEngine | None = None
+
+
+def get_semantic_engine() -> SemanticEngine:
+    """Process-wide engine (shares the process-wide store)."""
+    global _engine
+    if _engine is None:
+        _engine = SemanticEngine()
+    return _engine
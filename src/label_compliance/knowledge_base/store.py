@@ -1,8 +1,9 @@
 """
-Knowledge Store (ChromaDB)
-===========================
-Stores ISO requirements as embeddings in a local ChromaDB
-vector database for fast semantic search.
+Knowledge Store
+================
+Stores ISO requirements as embeddings in a local vector
+database for fast semantic search — ChromaDB or the in-process
+NumPy index, per ``knowledge_base.vector_backend`` (see ``backends``).
 """
 
 from __future__ import annotations
@@ -10,9 +11,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-import chromadb
-
 from label_compliance.config import get_settings
+from label_compliance.knowledge_base.backends import open_backend
 from label_compliance.knowledge_base.embeddings import embed_texts
 from label_compliance.utils.helpers import chunk_text
 from label_compliance.utils.log import get_logger
@@ -21,36 +21,41 @@ logger = get_logger(__name__)
 
 
 class KnowledgeStore:
-    """Wraps ChromaDB for ISO requirement storage and retrieval."""
+    """Wraps the vector backend for ISO requirement storage and retrieval."""
 
     def __init__(self) -> None:
         settings = get_settings()
-        db_path = settings.paths.knowledge_base_dir / "chromadb"
-        db_path.mkdir(parents=True, exist_ok=True)
-
-        self._client = chromadb.PersistentClient(path=str(db_path))
-        self._collection = self._client.get_or_create_collection(
-            name=settings.kb.collection_name,
-            metadata={"hnsw:space": "cosine"},
+        self._backend = open_backend(
+            settings.kb.vector_backend,
+            settings.paths.knowledge_base_dir,
+            settings.kb.collection_name,
         )
         logger.info(
-            "ChromaDB collection '%s' — %d documents",
+            "Knowledge store (%s) '%s' — %d documents",
+            self._backend.name,
             settings.kb.collection_name,
-            self._collection.count(),
+            self._backend.count(),
         )
 
     @property
     def count(self) -> int:
-        return self._collection.count()
+        return self._backend.count()
 
     def index_knowledge_base(self, kb_path: Path) -> int:
         """
         Index a knowledge base JSON file into ChromaDB.
         Each requirement and section body is chunked, embedded, and stored.
+
+        Incremental: only new or changed documents are embedded and
+        upserted, documents no longer in the file are deleted.  The
+        embedding model is part of each document's metadata, so switching
+        ``kb.embedding_model`` re-embeds everything.  Returns the number
+        of documents (re)indexed.
         """
         settings = get_settings()
         kb = json.loads(kb_path.read_text(encoding="utf-8"))
         iso_id = kb["iso_id"]
+        model_name = settings.kb.embedding_model
 
         documents: list[str] = []
         metadatas: list[dict] = []
@@ -67,6 +72,7 @@ class KnowledgeStore:
                 "section_title": req["section_title"],
                 "type": req["type"],
                 "source": "requirement",
+                "embedding_model": model_name,
             })
             ids.append(doc_id)
 
@@ -86,33 +92,46 @@ class KnowledgeStore:
                     "section_title": sec["title"],
                     "type": "section_body",
                     "source": "section",
+                    "embedding_model": model_name,
                 })
                 ids.append(doc_id)
 
+        # Compare with what is already indexed for this standard:
+        # unchanged documents are skipped, stale ones deleted
+        indexed = {
+            doc_id: (doc, meta)
+            for doc_id, doc, meta in zip(*self._backend.get(iso_id))
+        }
+        wanted = set(ids)
+        stale = [doc_id for doc_id in indexed if doc_id not in wanted]
+        if stale:
+            self._backend.delete(stale)
+
+        changed = [
+            k for k, doc_id in enumerate(ids)
+            if indexed.get(doc_id) != (documents[k], metadatas[k])
+        ]
         if not documents:
             logger.warning("No documents to index from %s", kb_path.name)
             return 0
 
-        # Embed and upsert in batches
-        batch_size = 100
-        total = 0
-        for start in range(0, len(documents), batch_size):
-            end = start + batch_size
-            batch_docs = documents[start:end]
-            batch_meta = metadatas[start:end]
-            batch_ids = ids[start:end]
-
-            embeddings = embed_texts(batch_docs)
-            self._collection.upsert(
-                ids=batch_ids,
+        # Embed (cached by text) and upsert the changed documents in batches
+        batch_size = 100 if self._backend.name == "chromadb" else max(len(changed), 1)
+        for start in range(0, len(changed), batch_size):
+            batch = changed[start:start + batch_size]
+            batch_docs = [documents[k] for k in batch]
+            self._backend.upsert(
+                ids=[ids[k] for k in batch],
                 documents=batch_docs,
-                metadatas=batch_meta,
-                embeddings=embeddings,
+                metadatas=[metadatas[k] for k in batch],
+                embeddings=embed_texts(batch_docs),
             )
-            total += len(batch_ids)
 
-        logger.info("Indexed %d documents from %s", total, iso_id)
-        return total
+        logger.info(
+            "Indexed %s: %d new/changed, %d unchanged, %d stale removed",
+            iso_id, len(changed), len(ids) - len(changed), len(stale),
+        )
+        return len(changed)
 
     def search(
         self,
@@ -125,37 +144,48 @@ class KnowledgeStore:
 
         Returns list of {document, metadata, distance}.
         """
-        from label_compliance.knowledge_base.embeddings import embed_single
+        return self.search_many([query], n_results=n_results, iso_filter=iso_filter)[0]
 
-        query_embedding = embed_single(query)
-
-        where = {"iso_id": iso_filter} if iso_filter else None
-
-        results = self._collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_results,
-            where=where,
-            include=["documents", "metadatas", "distances"],
+    def search_many(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        iso_filter: str | None = None,
+    ) -> list[list[dict]]:
+        """``search`` for several queries: one embedding batch, one query."""
+        if not queries:
+            return []
+        return self.query_embeddings(
+            embed_texts(queries), n_results=n_results, iso_filter=iso_filter,
         )
 
-        hits = []
-        for i in range(len(results["ids"][0])):
-            hits.append({
-                "id": results["ids"][0][i],
-                "document": results["documents"][0][i],
-                "metadata": results["metadatas"][0][i],
-                "distance": results["distances"][0][i],
-                "similarity": 1 - results["distances"][0][i],  # cosine distance → similarity
-            })
-
-        return hits
+    def query_embeddings(
+        self,
+        embeddings: list[list[float]],
+        n_results: int = 10,
+        iso_filter: str | None = None,
+    ) -> list[list[dict]]:
+        """Nearest documents for each query embedding, in one backend query."""
+        if not embeddings:
+            return []
+        results = self._backend.query(embeddings, n_results, iso_filter)
+        for hits in results:
+            for hit in hits:
+                hit["similarity"] = 1 - hit["distance"]  # cosine distance → similarity
+        return results
 
     def reset(self) -> None:
         """Delete all documents from the collection."""
-        settings = get_settings()
-        self._client.delete_collection(settings.kb.collection_name)
-        self._collection = self._client.create_collection(
-            name=settings.kb.collection_name,
-            metadata={"hnsw:space": "cosine"},
-        )
+        self._backend.reset()
         logger.info("Knowledge store reset.")
+
+
+_store: KnowledgeStore | None = None
+
+
+def get_knowledge_store() -> KnowledgeStore:
+    """Process-wide store — one ChromaDB client per process."""
+    global _store
+    if _store is None:
+        _store = KnowledgeStore()
+    return _store
@@ -16,10 +16,12 @@ This eliminates the "random box placement" problem.
 from __future__ import annotations
 
 import base64
+import io
 import json
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -28,7 +30,7 @@ import yaml
 
 from label_compliance.config import get_settings
 from label_compliance.document.symbol_library_db import get_symbol_library, SymbolEntry
-from label_compliance.knowledge_base.ai_ingester import get_ai_iso_knowledge, get_labelling_requirements_text
+from label_compliance.redline.context_bundle import RedlineContext, get_redline_context
 from label_compliance.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -47,6 +49,7 @@ class PDFElement:
     elem_type: str       # "text" or "image"
     bbox: tuple[float, float, float, float]  # (x0, y0, x1, y1) in PDF coords
     content: str         # text content or image description
+    page_idx: int = 0    # 0-based page the element is on (IDs are per page)
 
 
 @dataclass
@@ -73,6 +76,7 @@ class RedlineIssue:
     y_pct: float = 0.5
     width_pct: float = 0.1
     height_pct: float = 0.05
+    page_idx: int = 0          # 0-based page the issue is marked on
 
 
 @dataclass
@@ -85,6 +89,7 @@ class RedlineResult:
     analysis_time: float = 0.0
     product_type: str = ""
     applicable_standards: list[str] = field(default_factory=list)
+    pages: list[int] = field(default_factory=list)    # 0-based pages analysed
 
 
 @dataclass
@@ -101,6 +106,7 @@ class PanelInfo:
     panel_name: str = ""                               # AI-identified name (Pass 0)
     panel_type: str = ""                               # e.g., "outer_lid", "combo_label", "thermoform"
     issues: list[dict] = field(default_factory=list)   # Issues from Pass 1 per-panel analysis
+    page_idx: int = 0                                  # 0-based page the panel was cropped from
 
 
 # ── PDF Element Extraction ─────────────────────────
@@ -128,6 +134,7 @@ def _extract_pdf_elements(page: fitz.Page) -> list[PDFElement]:
                 elem_type="text",
                 bbox=(round(x0, 1), round(y0, 1), round(x1, 1), round(y1, 1)),
                 content=text[:120],
+                page_idx=page.number,
             ))
             text_idx += 1
 
@@ -147,6 +154,7 @@ def _extract_pdf_elements(page: fitz.Page) -> list[PDFElement]:
                     elem_type="image",
                     bbox=(round(r.x0, 1), round(r.y0, 1), round(r.x1, 1), round(r.y1, 1)),
                     content=f"Label artwork image {img[2]}x{img[3]}px — {section}",
+                    page_idx=page.number,
                 ))
 
     return elements
@@ -378,7 +386,7 @@ def _crop_label_panels(
         if pix.width < 200 or pix.height < 100:
             continue
 
-        panel_path = Path(f"/tmp/panel_{label_name}_{elem.elem_id}.png")
+        panel_path = Path(f"/tmp/panel_{label_name}_p{page.number + 1}_{elem.elem_id}.png")
         pix.save(str(panel_path))
 
         # NO hardcoded panel naming — AI will identify panels in Pass 0
@@ -387,6 +395,7 @@ def _crop_label_panels(
             image_path=panel_path,
             bbox=(x0, y0, x1, y1),
             pixel_size=(pix.width, pix.height),
+            page_idx=page.number,
         ))
         logger.debug("Cropped panel %s: %dx%d pixels (%.0fx scale)",
                      elem.elem_id, pix.width, pix.height, scale)
@@ -394,10 +403,13 @@ def _crop_label_panels(
     return panels
 
 
-def _build_symbol_reference_sheet(thumb_paths: list[Path]) -> Path | None:
-    """Composite key symbol thumbnails into a single reference image."""
+def _build_symbol_reference_sheet(thumb_paths: list[Path]) -> str:
+    """Composite key symbol thumbnails into one reference image (base64 PNG).
+
+    Returns "" when there are no thumbnails.
+    """
     if not thumb_paths:
-        return None
+        return ""
 
     from PIL import Image
 
@@ -425,10 +437,10 @@ def _build_symbol_reference_sheet(thumb_paths: list[Path]) -> Path | None:
         except Exception as e:
             logger.debug("Could not load thumbnail %s: %s", path.name, e)
 
-    out_path = Path("/tmp/symbol_reference_sheet.png")
-    sheet.save(str(out_path))
+    buf = io.BytesIO()
+    sheet.save(buf, format="PNG")
     logger.info("Symbol reference sheet: %dx%d, %d symbols", sheet_w, sheet_h, len(thumb_paths))
-    return out_path
+    return base64.b64encode(buf.getvalue()).decode("utf-8")
 
 
 # ── YAML Rules Loader ─────────────────────────────
@@ -558,7 +570,19 @@ Be specific — look at the actual drawing to identify which element is which.""
 
     b64, mime = _encode_image(overview_image)
 
+    content_parts: list[dict] = [
+        {"type": "text", "text": prompt},
+        {
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:{mime};base64,{b64}",
+                "detail": "high",
+            },
+        },
+    ]
+
     try:
+        _acquire_rate_limit(prompt, content_parts, ai_cfg.redline_pass0_max_completion_tokens)
         t0 = time.time()
         response = client.chat.completions.create(
             model=_get_redline_model(),
@@ -573,16 +597,7 @@ Be specific — look at the actual drawing to identify which element is which.""
                 },
                 {
                     "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:{mime};base64,{b64}",
-                                "detail": "high",
-                            },
-                        },
-                    ],
+                    "content": content_parts,
                 },
             ],
             reasoning_effort=ai_cfg.redline_pass0_reasoning_effort,
@@ -604,7 +619,8 @@ Be specific — look at the actual drawing to identify which element is which.""
         # Save Pass 0 response for debugging
         debug_dir = Path("outputs/debug_sections")
         debug_dir.mkdir(parents=True, exist_ok=True)
-        (debug_dir / "pass0_panel_identification.json").write_text(raw_content)
+        debug_file = debug_dir / f"pass0_panel_identification_p{panels[0].page_idx + 1}.json"
+        debug_file.write_text(raw_content)
 
         for panel in panels:
             if panel.element_id in ai_panels:
@@ -882,6 +898,15 @@ def _get_openai_client():
     return get_ai_client()
 
 
+def _acquire_rate_limit(prompt: str, content_parts: list[dict], completion_tokens: int) -> None:
+    """Take a redline call's share of the shared AI rate limit (``ai/executor.py``)."""
+    from label_compliance.ai.executor import IMAGE_TOKENS, estimate_tokens, get_ai_executor
+
+    images = sum(1 for part in content_parts if part["type"] == "image_url")
+    tokens = estimate_tokens(prompt, completion_tokens=completion_tokens) + images * IMAGE_TOKENS
+    get_ai_executor().limiter.acquire(tokens)
+
+
 def _encode_image(path: Path) -> tuple[str, str]:
     """Base64-encode an image file and return (b64_string, mime_type)."""
     data = path.read_bytes()
@@ -894,7 +919,7 @@ def _encode_image(path: Path) -> tuple[str, str]:
 def _pass1_analyze_panel(
     panel: PanelInfo,
     prompt: str,
-    symbol_sheet_path: Path | None = None,
+    symbol_sheet_b64: str = "",
 ) -> list[dict]:
     """Pass 1: Analyse a single panel with focused AI attention.
 
@@ -925,8 +950,7 @@ def _pass1_analyze_panel(
     ]
 
     # Attach symbol reference sheet for visual comparison
-    if symbol_sheet_path and symbol_sheet_path.exists():
-        sym_b64, _ = _encode_image(symbol_sheet_path)
+    if symbol_sheet_b64:
         content_parts.append({
             "type": "text",
             "text": "SYMBOL LIBRARY REFERENCE — compare symbols against these current versions:",
@@ -934,15 +958,18 @@ def _pass1_analyze_panel(
         content_parts.append({
             "type": "image_url",
             "image_url": {
-                "url": f"data:image/png;base64,{sym_b64}",
+                "url": f"data:image/png;base64,{symbol_sheet_b64}",
                 "detail": "high",
             },
         })
 
     logger.info("Pass 1: Analysing %s (%s) ...", panel.panel_name, panel.element_id)
-    t0 = time.time()
 
     try:
+        _acquire_rate_limit(
+            prompt, content_parts, ai_cfg.redline_pass1_max_completion_tokens,
+        )
+        t0 = time.time()
         response = client.chat.completions.create(
             model=_get_redline_model(),
             response_format={"type": "json_object"},
@@ -985,7 +1012,9 @@ def _pass1_analyze_panel(
         # Save raw AI response for debugging
         debug_dir = Path("outputs/debug_sections")
         debug_dir.mkdir(parents=True, exist_ok=True)
-        debug_file = debug_dir / f"pass1_{panel.element_id}_{panel.panel_type}.json"
+        debug_file = (
+            debug_dir / f"pass1_p{panel.page_idx + 1}_{panel.element_id}_{panel.panel_type}.json"
+        )
         debug_file.write_text(content)
         logger.info("Saved Pass 1 raw response: %s", debug_file.name)
 
@@ -996,6 +1025,7 @@ def _pass1_analyze_panel(
         for iss in issues:
             iss["area"] = panel.panel_name
             iss["element_ids"] = [panel.element_id]
+            iss["page_idx"] = panel.page_idx
 
         # Log audit summary
         symbol_audit = data.get("symbol_audit", {})
@@ -1027,8 +1057,8 @@ def _pass1_analyze_panel(
 def _pass2_cross_panel_review(
     panels: list[PanelInfo],
     all_issues: list[dict],
-    overview_image: Path,
-    symbol_sheet_path: Path | None = None,
+    overview_images: dict[int, Path],
+    symbol_sheet_b64: str = "",
 ) -> list[dict]:
     """Pass 2: Cross-panel consistency review.
 
@@ -1036,18 +1066,27 @@ def _pass2_cross_panel_review(
     1. Issues found on one panel but missing on others
     2. Cross-panel consistency problems
     3. Anything the per-panel analyses may have missed
+
+    Runs once per document: *overview_images* maps each analysed page
+    (0-based) to its overview render, so panels on different sheets are
+    compared too.  Returned issues carry a 0-based ``page_idx``.
     """
     if not panels or not all_issues:
         return []
 
     client = _get_openai_client()
     ai_cfg = _get_redline_ai_settings()
+    multi_page = len(overview_images) > 1
 
     # Build summary of per-panel findings
     panel_summaries = []
     for panel in panels:
-        panel_issues = [i for i in all_issues if i.get("area") == panel.panel_name]
+        panel_issues = [
+            i for i in all_issues
+            if i.get("area") == panel.panel_name and i.get("page_idx", 0) == panel.page_idx
+        ]
         summary = {
+            **({"page": panel.page_idx + 1} if multi_page else {}),
             "panel_name": panel.panel_name,
             "panel_type": panel.panel_type,
             "element_id": panel.element_id,
@@ -1063,6 +1102,15 @@ def _pass2_cross_panel_review(
         }
         panel_summaries.append(summary)
 
+    page_note = page_field = ""
+    if multi_page:
+        page_note = (
+            f"\nThe drawing has {len(overview_images)} sheets — one overview per sheet, "
+            "in page order.  Panels on different sheets must be consistent too; give "
+            "the 1-based \"page\" of every issue you report."
+        )
+        page_field = '\n      "page": 1,'
+
     prompt = f"""You have already reviewed each label panel individually.
 Now perform a CROSS-PANEL consistency check.
 
@@ -1070,7 +1118,7 @@ Now perform a CROSS-PANEL consistency check.
 {json.dumps(panel_summaries, indent=2)}
 
 === OVERVIEW IMAGE ATTACHED ===
-The full engineering drawing is attached for reference.
+The full engineering drawing is attached for reference.{page_note}
 
 CROSS-PANEL CHECKS:
 
@@ -1099,7 +1147,7 @@ Respond with JSON:
 {{{{
   "cross_panel_issues": [
     {{{{
-      "issue_id": 1,
+      "issue_id": 1,{page_field}
       "description": "...",
       "area": "Panel name where this issue occurs",
       "severity": "non-conformance",
@@ -1121,36 +1169,39 @@ Respond with JSON:
 If no additional cross-panel issues are found, return an empty list.
 """
 
-    b64, mime = _encode_image(overview_image)
-
-    content_parts: list[dict] = [
-        {"type": "text", "text": prompt},
-        {"type": "text", "text": "FULL DRAWING OVERVIEW:"},
-        {
+    content_parts: list[dict] = [{"type": "text", "text": prompt}]
+    for page_idx, overview_image in sorted(overview_images.items()):
+        b64, mime = _encode_image(overview_image)
+        label = "FULL DRAWING OVERVIEW:"
+        if multi_page:
+            label = f"FULL DRAWING OVERVIEW — PAGE {page_idx + 1}:"
+        content_parts.append({"type": "text", "text": label})
+        content_parts.append({
             "type": "image_url",
             "image_url": {
                 "url": f"data:{mime};base64,{b64}",
                 "detail": "high",
             },
-        },
-    ]
+        })
 
     # Attach symbol sheet for reference
-    if symbol_sheet_path and symbol_sheet_path.exists():
-        sym_b64, _ = _encode_image(symbol_sheet_path)
+    if symbol_sheet_b64:
         content_parts.append({"type": "text", "text": "SYMBOL LIBRARY REFERENCE:"})
         content_parts.append({
             "type": "image_url",
             "image_url": {
-                "url": f"data:image/png;base64,{sym_b64}",
+                "url": f"data:image/png;base64,{symbol_sheet_b64}",
                 "detail": "high",
             },
         })
 
     logger.info("Pass 2: Cross-panel consistency review ...")
-    t0 = time.time()
 
     try:
+        _acquire_rate_limit(
+            prompt, content_parts, ai_cfg.redline_pass2_max_completion_tokens,
+        )
+        t0 = time.time()
         response = client.chat.completions.create(
             model=_get_redline_model(),
             response_format={"type": "json_object"},
@@ -1193,6 +1244,16 @@ If no additional cross-panel issues are found, return an empty list.
         data = json.loads(content)
         cross_issues = data.get("cross_panel_issues", [])
 
+        # Attribute each issue to a page: the AI's "page", else its panel's page
+        panel_pages = {p.panel_name: p.page_idx for p in panels}
+        default_page = min(overview_images)
+        for iss in cross_issues:
+            try:
+                page_idx = int(iss.pop("page")) - 1
+            except (KeyError, TypeError, ValueError):
+                page_idx = panel_pages.get(iss.get("area", ""), default_page)
+            iss["page_idx"] = page_idx if page_idx in overview_images else default_page
+
         if data.get("notes"):
             logger.info("Pass 2 notes: %s", data["notes"])
 
@@ -1266,6 +1327,7 @@ def _parse_ai_response(response_text: str, label_name: str) -> RedlineResult:
             y_pct=float(item.get("y_pct", 0.5)),
             width_pct=float(item.get("width_pct", 0.1)),
             height_pct=float(item.get("height_pct", 0.05)),
+            page_idx=int(item.get("page_idx", 0)),
         )
         result.issues.append(issue)
 
@@ -1288,145 +1350,278 @@ def _is_non_label_panel(panel: PanelInfo) -> bool:
 
 
 # ── Analysis Pipeline ──────────────────────────────
-def analyze_label_with_ai(
+@dataclass
+class PageAnalysis:
+    """One drawing page: rendered inputs (prepared up front) and Pass 0/1 output."""
+    page_idx: int                                      # 0-based
+    elements: list[PDFElement]
+    elements_text: str
+    label_text: str
+    overview_path: Path
+    panels: list[PanelInfo]
+    pw: float
+    ph: float
+    panels_to_analyse: list[PanelInfo] = field(default_factory=list)
+    issues: list[dict] = field(default_factory=list)   # Pass 1, panel order, not yet numbered
+
+
+def parse_page_selection(spec: str | None, page_count: int) -> list[int]:
+    """0-based page indices for a 1-based selection like ``"1-3,5"``.
+
+    ``None``, ``""`` and ``"all"`` select every page.  Pages beyond the
+    document are dropped with a warning.
+    """
+    if spec is None or spec.strip().lower() in ("", "all"):
+        return list(range(page_count))
+
+    selected: set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                lo, hi = (int(x) for x in part.split("-", 1))
+            else:
+                lo = hi = int(part)
+        except ValueError:
+            raise ValueError(
+                f"Invalid page selection {spec!r} (expected e.g. '1-3,5' or 'all')"
+            ) from None
+        if lo < 1 or hi < lo:
+            raise ValueError(f"Invalid page range {part!r} in {spec!r}")
+        selected.update(range(lo - 1, hi))
+
+    pages = sorted(p for p in selected if p < page_count)
+    if len(pages) < len(selected):
+        logger.warning("Page selection %r: document has only %d pages", spec, page_count)
+    if not pages:
+        raise ValueError(f"Page selection {spec!r} matches no page of a {page_count}-page document")
+    return pages
+
+
+def _prepare_page(page: fitz.Page, label_name: str) -> PageAnalysis:
+    """Extract elements, render the overview and crop panels for one page."""
+    pw, ph = page.rect.width, page.rect.height
+
+    # Step 1: Extract all elements with exact coordinates
+    elements = _extract_pdf_elements(page)
+
+    # Step 2: Build element map text
+    elements_text = _elements_to_text(elements, pw, ph)
+
+    # Step 3: Render full page overview image
+    mat = fitz.Matrix(3.0, 3.0)
+    pix = page.get_pixmap(matrix=mat, alpha=False)
+    overview_path = Path(f"/tmp/label_overview_{label_name}_p{page.number + 1}.png")
+    pix.save(str(overview_path))
+
+    # Step 4: Crop individual panels (NO naming yet — dynamic)
+    panels = _crop_label_panels(page, elements, label_name)
+    logger.info(
+        "Page %d: %d elements, overview %dx%d, %d label panels",
+        page.number + 1, len(elements), pix.width, pix.height, len(panels),
+    )
+
+    return PageAnalysis(
+        page_idx=page.number,
+        elements=elements,
+        elements_text=elements_text,
+        label_text=page.get_text(),
+        overview_path=overview_path,
+        panels=panels,
+        pw=pw,
+        ph=ph,
+    )
+
+
+def _analyze_page(
+    page: PageAnalysis,
+    context: RedlineContext,
+    tag: str = "",
+) -> PageAnalysis:
+    """Pass 0 and Pass 1 for one page (AI calls only — no PyMuPDF access).
+
+    Every AI call goes through the shared AI executor, so concurrent
+    pages stay within ``ai.max_concurrency``.  Pass 1 panels run
+    concurrently; issues are collected in panel order whatever order
+    the panels finish in.
+    """
+    from label_compliance.ai.executor import get_ai_executor
+
+    executor = get_ai_executor()
+
+    # ══════════════════════════════════════════════════════
+    # PASS 0 — Dynamic panel identification
+    # ══════════════════════════════════════════════════════
+    print(f"    {tag}Pass 0: Identifying {len(page.panels)} panels...")
+    page.panels = executor.submit(
+        _pass0_identify_panels,
+        page.overview_path, page.panels, page.elements, page.pw, page.ph,
+    ).result()
+
+    # Filter: only analyse actual label panels, skip title/revision tables/notes blocks.
+    label_panels = [p for p in page.panels if not _is_non_label_panel(p)]
+    skipped_panels = [p for p in page.panels if _is_non_label_panel(p)]
+    skipped = len(skipped_panels)
+    if skipped:
+        skipped_names = ", ".join(
+            f"{p.panel_name} ({p.panel_type or 'unknown'})" for p in skipped_panels
+        )
+        logger.info("Skipping %d non-label panels: %s", skipped, skipped_names)
+        print(f"    {tag}Skipping {skipped} non-label panels")
+    page.panels_to_analyse = label_panels if label_panels else page.panels
+
+    panel_names = ", ".join(p.panel_name for p in page.panels_to_analyse)
+    print(f"    {tag}Panels: {panel_names}")
+
+    # ══════════════════════════════════════════════════════
+    # PASS 1 — Per-panel exhaustive analysis
+    # ══════════════════════════════════════════════════════
+    # Panels are independent until Pass 2: run them concurrently on the
+    # shared AI executor (ai.max_concurrency workers, shared rate limit)
+    n_panels = len(page.panels_to_analyse)
+    print(f"    {tag}Pass 1: Analysing {n_panels} panels "
+          f"({min(executor.max_concurrency, n_panels)} at a time)...")
+
+    futures = {}
+    for panel in page.panels_to_analyse:
+        prompt = _build_panel_prompt(
+            panel,
+            page.elements_text,
+            page.label_text,
+            context.symbol_ref_text,
+            context.iso_req_text,
+            context.yaml_rules_text,
+        )
+        future = executor.submit(_pass1_analyze_panel, panel, prompt, context.symbol_sheet_b64)
+        futures[future] = panel
+
+    # Stream progress as panels finish
+    for done, future in enumerate(as_completed(futures), 1):
+        found = len(future.result()) if future.exception() is None else 0
+        print(f"      {tag}[{done}/{n_panels}] {futures[future].panel_name} → {found} issues found")
+
+    for future, panel in futures.items():
+        try:
+            panel.issues = future.result()
+        except Exception as e:
+            logger.error("Pass 1 failed for %s: %s", panel.element_id, e)
+            panel.issues = []
+        page.issues.extend(panel.issues)
+
+    logger.info(
+        "%sPass 1 total: %d issues across %d panels",
+        tag, len(page.issues), n_panels,
+    )
+    return page
+
+
+def analyze_document_with_ai(
     pdf_path: Path,
-    page_idx: int = 0,
+    pages: list[int] | None = None,
 ) -> tuple[RedlineResult, list[PDFElement]]:
     """
-    Multi-pass per-panel AI analysis pipeline:
+    Multi-pass per-panel AI analysis pipeline over the pages of a drawing:
 
       Pass 0  (o3 low)   : Dynamic panel identification — AI names each panel
-      Pass 1  (o3 medium): Per-panel exhaustive analysis — one call per panel
-      Pass 2  (o3 medium): Cross-panel consistency review
+      Pass 1  (o3 medium): Per-panel exhaustive analysis — one call per panel,
+                           run concurrently (``ai.max_concurrency``)
+      Pass 2  (o3 medium): Cross-panel consistency review over ALL pages
 
-    Typical runtime: ~3-5 minutes (vs ~10-15 min with high reasoning).
+    *pages* are 0-based page indices (default: every page).  Pages are
+    rendered up front, then their Pass 0/Pass 1 pipelines run
+    concurrently (``ai.redline_page_concurrency``) and a single Pass 2
+    sees the issues of every page.  Issues are numbered in page, then
+    panel order, then cross-panel issues.
+
+    Typical runtime: roughly the slowest page's Pass 0 + slowest panel,
+    plus Pass 2 (~3-5 minutes for a 6-panel sheet with
+    ``ai.max_concurrency: 1``).
 
     The pipeline is FULLY DYNAMIC — panels are discovered from the PDF
     structure and identified by AI, not hardcoded for any specific product.
 
     Returns:
-        (RedlineResult, list of PDFElements for coordinate lookup)
+        (RedlineResult, PDFElements of every analysed page for coordinate lookup)
     """
+    from label_compliance.ai.executor import get_ai_executor
+
     label_name = pdf_path.stem
     result = RedlineResult(label_name=label_name)
     elements: list[PDFElement] = []
+    page_analyses: list[PageAnalysis] = []
 
     t0 = time.time()
 
     try:
-        doc = fitz.open(str(pdf_path))
-        page = doc[page_idx]
-        pw, ph = page.rect.width, page.rect.height
-
         # ── Preparation ─────────────────────────────────
-        # Step 1: Extract all elements with exact coordinates
-        elements = _extract_pdf_elements(page)
-        logger.info("Extracted %d elements from %s", len(elements), pdf_path.name)
-
-        # Step 2: Build element map text
-        elements_text = _elements_to_text(elements, pw, ph)
-
-        # Step 3: Render full page overview image
-        mat = fitz.Matrix(3.0, 3.0)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        overview_path = Path(f"/tmp/label_overview_{label_name}.png")
-        pix.save(str(overview_path))
-        logger.info("Rendered overview: %dx%d", pix.width, pix.height)
-
-        # Step 4: Crop individual panels (NO naming yet — dynamic)
-        panels = _crop_label_panels(page, elements, label_name)
-        logger.info("Cropped %d label panels", len(panels))
-
-        # Step 5: Get full page text for context
-        label_text = page.get_text()
-
+        # Rendering stays on this thread: PyMuPDF is not thread-safe
+        doc = fitz.open(str(pdf_path))
+        if pages is None:
+            pages = list(range(doc.page_count))
+        page_analyses = [_prepare_page(doc[i], label_name) for i in pages]
         doc.close()
+        for pa in page_analyses:
+            elements.extend(pa.elements)
+        result.pages = [pa.page_idx for pa in page_analyses]
 
-        # Step 6: Load AI-extracted ISO knowledge base
-        iso_req_text = ""
-        iso_kb = get_ai_iso_knowledge()
-        if iso_kb:
-            iso_req_text = get_labelling_requirements_text(iso_kb)
-            logger.info(
-                "Loaded AI-extracted ISO knowledge: %d sections",
-                iso_kb.get("total_sections", 0),
-            )
-        else:
-            logger.info(
-                "No AI-extracted ISO KB — run 'label-compliance ingest-ai' to create"
-            )
-
-        # Step 7: Load symbol library reference
-        symbol_ref_text, thumb_paths = _get_symbol_reference_data()
-        logger.info("Symbol library: %d reference symbols", len(thumb_paths))
-
-        # Step 8: Build symbol reference sheet
-        symbol_sheet_path = _build_symbol_reference_sheet(thumb_paths)
-
-        # Step 9: Load YAML rules (called once, reused for every panel)
-        yaml_rules_text = _load_yaml_rules_text()
+        # ISO KB requirements, symbol library reference + sheet and YAML
+        # rules: label-independent, compiled once and cached on disk
+        context = get_redline_context()
 
         # ══════════════════════════════════════════════════════
-        # PASS 0 — Dynamic panel identification
+        # PASS 0 + PASS 1 — per page, pages concurrently
         # ══════════════════════════════════════════════════════
-        print(f"    Pass 0: Identifying {len(panels)} panels...")
-        panels = _pass0_identify_panels(
-            overview_path, panels, elements, pw, ph,
+        multi_page = len(page_analyses) > 1
+        if multi_page:
+            print(f"    Analysing {len(page_analyses)} pages...")
+        page_workers = min(
+            max(1, _get_redline_ai_settings().redline_page_concurrency),
+            len(page_analyses),
         )
-
-        # Filter: only analyse actual label panels, skip title/revision tables/notes blocks.
-        label_panels = [p for p in panels if not _is_non_label_panel(p)]
-        skipped_panels = [p for p in panels if _is_non_label_panel(p)]
-        skipped = len(skipped_panels)
-        if skipped:
-            skipped_names = ", ".join(
-                f"{p.panel_name} ({p.panel_type or 'unknown'})" for p in skipped_panels
-            )
-            logger.info("Skipping %d non-label panels: %s", skipped, skipped_names)
-            print(f"    Skipping {skipped} non-label panels")
-        panels_to_analyse = label_panels if label_panels else panels
-
-        panel_names = ", ".join(p.panel_name for p in panels_to_analyse)
-        print(f"    Panels: {panel_names}")
-
-        # ══════════════════════════════════════════════════════
-        # PASS 1 — Per-panel exhaustive analysis
-        # ══════════════════════════════════════════════════════
+        if get_ai_executor().max_concurrency == 1:
+            page_workers = 1  # ai.max_concurrency 1 = fully sequential
+        # Page threads submit their Pass 0/1 calls to the AI executor and
+        # wait on them, never run on it — that keeps every AI call within
+        # ai.max_concurrency, and a page holding an AI worker while waiting
+        # for its panels could deadlock
+        with ThreadPoolExecutor(
+            max_workers=max(1, page_workers), thread_name_prefix="redline-page",
+        ) as pool:
+            page_futures = [
+                pool.submit(
+                    _analyze_page, pa, context,
+                    tag=f"[page {pa.page_idx + 1}] " if multi_page else "",
+                )
+                for pa in page_analyses
+            ]
+            for pa, future in zip(page_analyses, page_futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("Page %d analysis failed: %s", pa.page_idx + 1, e, exc_info=True)
+
+        # Re-number issues globally in page, then panel order
+        # (independent of completion order)
         all_issues: list[dict] = []
         issue_counter = 1
-
-        for idx, panel in enumerate(panels_to_analyse, 1):
-            print(f"    Pass 1: [{idx}/{len(panels_to_analyse)}] Analysing {panel.panel_name}...")
-            prompt = _build_panel_prompt(
-                panel,
-                elements_text,
-                label_text,
-                symbol_ref_text,
-                iso_req_text,
-                yaml_rules_text,
-            )
-            panel_issues = _pass1_analyze_panel(panel, prompt, symbol_sheet_path)
-
-            # Re-number issues globally
-            for iss in panel_issues:
+        for pa in page_analyses:
+            for iss in pa.issues:
                 iss["issue_id"] = issue_counter
                 issue_counter += 1
-
-            panel.issues = panel_issues
-            all_issues.extend(panel_issues)
-            print(f"      → {len(panel_issues)} issues found")
-
-        logger.info(
-            "Pass 1 total: %d issues across %d panels",
-            len(all_issues), len(panels_to_analyse),
-        )
+            all_issues.extend(pa.issues)
+        panels_analysed = [p for pa in page_analyses for p in pa.panels_to_analyse]
+        all_panels = [p for pa in page_analyses for p in pa.panels]
 
         # ══════════════════════════════════════════════════════
-        # PASS 2 — Cross-panel consistency review
+        # PASS 2 — Cross-panel consistency review (whole document)
         # ══════════════════════════════════════════════════════
         print(f"    Pass 2: Cross-panel consistency check...")
         cross_issues = _pass2_cross_panel_review(
-            panels_to_analyse, all_issues, overview_path, symbol_sheet_path,
+            panels_analysed, all_issues,
+            {pa.page_idx: pa.overview_path for pa in page_analyses},
+            context.symbol_sheet_b64,
         )
 
         # Re-number cross-panel issues
@@ -1443,6 +1638,7 @@ def analyze_label_with_ai(
         print(f"      → {len(cross_issues)} cross-panel issues")
 
         # ── Build final result ──────────────────────────
+        on_pages = f" on {len(page_analyses)} pages" if multi_page else ""
         final_data = {
             "product_type": "",
             "applicable_standards": [],
@@ -1450,33 +1646,43 @@ def analyze_label_with_ai(
             "issues": all_issues,
             "summary": (
                 f"Found {len(all_issues)} non-conformances across "
-                f"{len(panels)} panels "
+                f"{len(all_panels)} panels{on_pages} "
                 f"({len(all_issues) - len(cross_issues)} per-panel + "
                 f"{len(cross_issues)} cross-panel)"
             ),
         }
+        pages_analysed = result.pages
         result = _parse_ai_response(json.dumps(final_data), label_name)
+        result.pages = pages_analysed
         result.analysis_time = time.time() - t0
 
         logger.info(
-            "AI redline complete: %d issues in %.1fs (3-pass per-panel with %s)",
-            len(result.issues), result.analysis_time, _get_redline_model(),
+            "AI redline complete: %d issues on %d page(s) in %.1fs (3-pass per-panel with %s)",
+            len(result.issues), len(result.pages), result.analysis_time, _get_redline_model(),
         )
 
-        # ── Cleanup temp files ──────────────────────────
-        overview_path.unlink(missing_ok=True)
-        if symbol_sheet_path:
-            symbol_sheet_path.unlink(missing_ok=True)
-        for panel in panels:
-            panel.image_path.unlink(missing_ok=True)
-
     except Exception as e:
         logger.error("AI redline analysis failed: %s", e, exc_info=True)
         result.summary = f"Analysis failed: {e}"
 
+    finally:
+        # ── Cleanup temp files ──────────────────────────
+        for pa in page_analyses:
+            pa.overview_path.unlink(missing_ok=True)
+            for panel in pa.panels:
+                panel.image_path.unlink(missing_ok=True)
+
     return result, elements
 
 
+def analyze_label_with_ai(
+    pdf_path: Path,
+    page_idx: int = 0,
+) -> tuple[RedlineResult, list[PDFElement]]:
+    """Single-page ``analyze_document_with_ai`` (page *page_idx*, 0-based)."""
+    return analyze_document_with_ai(pdf_path, [page_idx])
+
+
 # ── PDF Annotation ─────────────────────────────────
 def generate_ai_redline_pdf(
     pdf_path: Path,
@@ -1486,8 +1692,9 @@ def generate_ai_redline_pdf(
 ) -> Path | None:
     """Generate a redlined PDF with compact numbered markers + legend page.
 
-    Page 1: Original drawing with small numbered red circles + highlight boxes
-    Page 2: Legend table listing every issue with full details
+    Drawing pages: the original pages, each analysed page with small
+    numbered red circles + highlight boxes for its issues
+    Last page(s):  one legend table listing every issue with full details
     """
     settings = get_settings()
     if output_dir is None:
@@ -1503,26 +1710,35 @@ def generate_ai_redline_pdf(
         logger.exception("Cannot open PDF: %s", pdf_path)
         return None
 
-    page = doc[0]
-    pw, ph = page.rect.width, page.rect.height
+    # Build element lookup (element IDs are per page)
+    elem_maps: dict[int, dict[str, PDFElement]] = {}
+    for e in elements:
+        elem_maps.setdefault(e.page_idx, {})[e.elem_id] = e
 
-    # Build element lookup
-    elem_map: dict[str, PDFElement] = {e.elem_id: e for e in elements}
+    for page_idx in redline_result.pages or [0]:
+        page = doc[page_idx]
+        pw, ph = page.rect.width, page.rect.height
+        elem_map = elem_maps.get(page_idx, {})
 
-    used_marker_rects: list[fitz.Rect] = []
+        used_marker_rects: list[fitz.Rect] = []
 
-    for issue in redline_result.issues:
-        _place_compact_marker(page, issue, elem_map, pw, ph, used_marker_rects)
+        for issue in redline_result.issues:
+            if issue.page_idx == page_idx:
+                _place_compact_marker(page, issue, elem_map, pw, ph, used_marker_rects)
 
-    # Footer note on drawing page
-    _add_revision_note(page, redline_result, pw, ph)
+        # Footer note on drawing page
+        _add_revision_note(page, redline_result, pw, ph)
 
-    # Add legend page with full issue details
+    # Add legend page with full issue details (all pages combined)
     _add_legend_page(doc, redline_result)
 
+    n_pages = doc.page_count
     doc.save(str(out_path))
     doc.close()
-    logger.info("AI Redlined PDF saved: %s (%d issues, 2 pages)", out_path.name, len(redline_result.issues))
+    logger.info(
+        "AI Redlined PDF saved: %s (%d issues, %d pages)",
+        out_path.name, len(redline_result.issues), n_pages,
+    )
     return out_path
 
 
@@ -1699,6 +1915,8 @@ def _add_legend_page(
         f"Issues: {len(result.issues)}  |  "
         f"Time: {result.analysis_time:.1f}s"
     )
+    if len(result.pages) > 1:
+        subtitle += f"  |  Pages: {', '.join(str(p + 1) for p in result.pages)}"
     page.insert_textbox(
         fitz.Rect(margin, y, legend_w - margin, y + 14),
         subtitle, fontsize=8, fontname="helv", color=(0.4, 0.4, 0.4),
@@ -1746,6 +1964,7 @@ def _add_legend_page(
 
     # Issue rows — all non-conformances in red
     nc_color = RED
+    multi_page = len(result.pages) > 1
 
     for issue in result.issues:
         sev_color = nc_color
@@ -1780,7 +1999,11 @@ def _add_legend_page(
         # Row content
         page.insert_textbox(fitz.Rect(col_no, y, col_sev, y + row_h), str(issue.issue_id), fontsize=8, fontname="helv", color=sev_color)
         page.insert_textbox(fitz.Rect(col_sev, y, col_area, y + 12), "NC", fontsize=6.5, fontname="helv", color=sev_color)
-        page.insert_textbox(fitz.Rect(col_area, y, col_desc, y + row_h), issue.area[:20], fontsize=7, fontname="helv", color=(0, 0, 0))
+        area_text = f"p{issue.page_idx + 1} {issue.area}" if multi_page else issue.area
+        page.insert_textbox(
+            fitz.Rect(col_area, y, col_desc, y + row_h), area_text[:20],
+            fontsize=7, fontname="helv", color=(0, 0, 0),
+        )
         page.insert_textbox(fitz.Rect(col_desc, y, col_ref - 5, y + row_h), desc_text, fontsize=7, fontname="helv", color=(0, 0, 0))
         page.insert_textbox(fitz.Rect(col_ref, y, col_action - 5, y + row_h), issue.iso_reference, fontsize=6.5, fontname="helv", color=(0.3, 0.3, 0.3))
         page.insert_textbox(fitz.Rect(col_action, y, legend_w - margin, y + row_h), issue.action, fontsize=7, fontname="helv", color=(0, 0, 0))
@@ -2078,17 +2301,26 @@ def _add_revision_note(
 def run_ai_redline(
     pdf_path: Path,
     output_dir: Path | None = None,
+    pages: str | None = None,
 ) -> tuple[RedlineResult, Path | None]:
     """
     Complete AI redline pipeline:
     1. Extract real element positions from PDF
     2. Analyze label with GPT-4o vision + element map
     3. Generate annotated PDF with anchored annotations
+
+    *pages* is a 1-based selection such as ``"1-3,5"`` or ``"all"``
+    (default: ``ai.redline_pages``).
     """
     logger.info("Starting AI redline analysis: %s", pdf_path.name)
 
+    if pages is None:
+        pages = _get_redline_ai_settings().redline_pages
+    with fitz.open(str(pdf_path)) as doc:
+        page_indices = parse_page_selection(pages, doc.page_count)
+
     # Step 1+2: AI analysis with element coordinates
-    result, elements = analyze_label_with_ai(pdf_path)
+    result, elements = analyze_document_with_ai(pdf_path, page_indices)
 
     if not result.issues:
         logger.warning("No issues found by AI analysis")
@@ -2124,6 +2356,8 @@ def _generate_redline_report(
         f"**Total Non-Conformances**: {len(result.issues)}",
     ]
 
+    if len(result.pages) > 1:
+        lines.append(f"**Pages**: {', '.join(str(p + 1) for p in result.pages)}")
     if result.product_type:
         lines.append(f"**Product Type**: {result.product_type}")
     if result.applicable_standards:
@@ -2141,6 +2375,8 @@ def _generate_redline_report(
 
     for issue in result.issues:
         lines.append(f"**NC-{issue.issue_id}. {issue.description}**")
+        if len(result.pages) > 1:
+            lines.append(f"- Page: {issue.page_idx + 1}")
         lines.append(f"- Area: {issue.area}")
         lines.append(f"- Action: {issue.action}")
         lines.append(f"- ISO Reference: {issue.iso_reference}")
@@ -39,6 +39,15 @@ def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     return ImageFont.load_default()
 
 
+def _page_image(label_result: LabelResult, page: PageResult) -> Image.Image | None:
+    """A drawable RGB copy of the page — from memory when the check kept it."""
+    if label_result.page_images is not None:
+        return label_result.page_images.page(page.page_number).pil().convert("RGB")
+    if page.image_path is None:
+        return None
+    return Image.open(page.image_path).convert("RGB")
+
+
 def annotate_label(
     label_result: LabelResult,
     output_dir: Path | None = None,
@@ -67,11 +76,12 @@ def annotate_label(
     score = label_result.score
 
     for page in label_result.pages:
-        if page.image_path is None or page.ocr is None:
+        img = _page_image(label_result, page)
+        if img is None or page.ocr is None:
             continue
 
         out_path = output_dir / f"redline-{safe_name}-page-{page.page_number:02d}.png"
-        _annotate_page(page, all_matches, score, out_path, settings)
+        _annotate_page(page, all_matches, score, out_path, settings, image=img)
         generated.append(out_path)
         logger.info("  Annotated: %s", out_path.name)
 
@@ -84,9 +94,10 @@ def _annotate_page(
     score,
     output_path: Path,
     settings,
+    image: Image.Image | None = None,
 ) -> None:
     """Annotate a single page image."""
-    img = Image.open(page.image_path).convert("RGB")
+    img = image if image is not None else Image.open(page.image_path).convert("RGB")
     draw = ImageDraw.Draw(img)
 
     font = _load_font(settings.redline.font_size)
@@ -214,26 +225,26 @@ def annotate_comparison(
     redline_pages = redline_result.pages
 
     for cp, rp in zip(clean_pages, redline_pages):
-        if cp.image_path is None or rp.image_path is None:
+        clean_img = _page_image(clean_result, cp)
+        redline_img = _page_image(redline_result, rp)
+        if clean_img is None or redline_img is None:
             continue
 
         out_path = output_dir / f"comparison-{safe_name}-page-{cp.page_number:02d}.png"
-        _draw_comparison(cp, rp, clean_result, redline_result, out_path)
+        _draw_comparison(clean_img, redline_img, clean_result, redline_result, out_path)
         generated.append(out_path)
 
     return generated
 
 
 def _draw_comparison(
-    clean_page: PageResult,
-    redline_page: PageResult,
+    clean_img: Image.Image,
+    redline_img: Image.Image,
     clean_result: LabelResult,
     redline_result: LabelResult,
     output_path: Path,
 ) -> None:
     """Draw side-by-side clean vs redline comparison."""
-    clean_img = Image.open(clean_page.image_path).convert("RGB")
-    redline_img = Image.open(redline_page.image_path).convert("RGB")
 
     # Scale to same height
     target_h = min(clean_img.height, redline_img.height, 1200)
@@ -0,0 +1,193 @@
+"""
+Redline Context Bundle
+=======================
+Precompiled, label-independent prompt context for the AI redliner.
+
+Every redline used to rebuild the same inputs before its first AI call:
+the AI ISO knowledge base JSON and its labelling-requirements text, the
+symbol library scan with fuzzy keyword matching, the PIL symbol
+reference sheet, and the rendered YAML rules.  They only change when
+the KB, the symbol library or the rules change, so ``RedlineContext``
+compiles them once and stores them under
+``<cache_dir>/redline_context/<key>.json``, with the reference sheet
+pre-encoded as base64 PNG.
+
+The key is a hash of every input:
+
+    - the AI ISO KB JSON,
+    - the symbol library and AI-enriched symbol library JSON, and the
+      names, sizes and mtimes of the thumbnail images,
+    - every rule YAML,
+    - the sources of the modules that render the text.
+
+Anything else reuses the bundle — from memory within a process, from
+disk across runs.  ``ai.redline_context_cache: false`` always rebuilds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from label_compliance.config import CONFIG_DIR, get_settings
+from label_compliance.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+BUNDLE_DIRNAME = "redline_context"
+BUNDLE_VERSION = 1
+# Bundles kept on disk (most recent first); older ones are pruned on write
+_KEEP_BUNDLES = 4
+
+# ISO standard whose AI-ingested KB feeds the redline prompts
+_ISO_KB_ID = "ISO-14607-2024"
+
+
+@dataclass
+class RedlineContext:
+    """Prompt inputs shared by every panel of every label."""
+    iso_req_text: str
+    symbol_ref_text: str
+    yaml_rules_text: str
+    symbol_sheet_b64: str = ""     # base64 PNG ("" = no reference thumbnails)
+    symbol_count: int = 0          # thumbnails on the sheet
+    key: str = ""
+
+
+def _update_file(h, path: Path) -> None:
+    h.update(str(path.name).encode("utf-8"))
+    h.update(path.read_bytes() if path.is_file() else b"<missing>")
+
+
+def redline_context_key() -> str:
+    """Hash of every input of the bundle (see module doc)."""
+    from label_compliance.document import symbol_library_db
+    from label_compliance.knowledge_base import ai_ingester, ai_symbol_ingester
+    from label_compliance.redline import ai_redliner
+
+    settings = get_settings()
+    h = hashlib.sha256()
+    h.update(f"v{BUNDLE_VERSION}".encode())
+
+    _update_file(h, settings.paths.knowledge_base_dir / f"{_ISO_KB_ID}-ai.json")
+
+    library_dir = settings.paths.symbol_library_dir
+    _update_file(h, library_dir / symbol_library_db.DB_FILENAME)
+    _update_file(h, library_dir / ai_symbol_ingester._AI_SYMBOL_DB_FILENAME)
+    images_dir = library_dir / symbol_library_db.IMAGES_SUBDIR
+    if images_dir.is_dir():
+        for entry in sorted(os.scandir(images_dir), key=lambda e: e.name):
+            stat = entry.stat()
+            h.update(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    rules_dir = CONFIG_DIR / "rules"
+    for rule_file in sorted(rules_dir.glob("*.yaml")):
+        _update_file(h, rule_file)
+
+    for module in (ai_redliner, ai_ingester, ai_symbol_ingester, symbol_library_db):
+        _update_file(h, Path(module.__file__))
+
+    return h.hexdigest()[:32]
+
+
+def compile_redline_context(key: str = "") -> RedlineContext:
+    """Build the bundle from the KB, symbol library and rules (the slow path)."""
+    from label_compliance.knowledge_base.ai_ingester import (
+        get_ai_iso_knowledge,
+        get_labelling_requirements_text,
+    )
+    from label_compliance.redline import ai_redliner
+
+    # AI-extracted ISO knowledge base
+    iso_req_text = ""
+    iso_kb = get_ai_iso_knowledge(_ISO_KB_ID)
+    if iso_kb:
+        iso_req_text = get_labelling_requirements_text(iso_kb)
+        logger.info(
+            "Loaded AI-extracted ISO knowledge: %d sections",
+            iso_kb.get("total_sections", 0),
+        )
+    else:
+        logger.info(
+            "No AI-extracted ISO KB — run 'label-compliance ingest-ai' to create"
+        )
+
+    # Symbol library reference text + reference sheet
+    symbol_ref_text, thumb_paths = ai_redliner._get_symbol_reference_data()
+    logger.info("Symbol library: %d reference symbols", len(thumb_paths))
+    symbol_sheet_b64 = ai_redliner._build_symbol_reference_sheet(thumb_paths)
+
+    return RedlineContext(
+        iso_req_text=iso_req_text,
+        symbol_ref_text=symbol_ref_text,
+        yaml_rules_text=ai_redliner._load_yaml_rules_text(),
+        symbol_sheet_b64=symbol_sheet_b64,
+        symbol_count=len(thumb_paths),
+        key=key,
+    )
+
+
+def _bundle_dir() -> Path:
+    return get_settings().paths.cache_dir / BUNDLE_DIRNAME
+
+
+def _read_bundle(path: Path, key: str) -> RedlineContext | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != BUNDLE_VERSION or data.get("key") != key:
+            return None
+        data.pop("version")
+        return RedlineContext(**data)
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("Ignoring unreadable redline context bundle %s: %s", path.name, e)
+        return None
+
+
+def _write_bundle(path: Path, context: RedlineContext) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({"version": BUNDLE_VERSION, **asdict(context)}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+        bundles = sorted(path.parent.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in bundles[_KEEP_BUNDLES:]:
+            old.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Could not save redline context bundle: %s", e)
+
+
+_memo: dict[str, RedlineContext] = {}
+
+
+def get_redline_context() -> RedlineContext:
+    """The current bundle: from memory, else disk, else compiled (and saved)."""
+    t0 = time.time()
+    if not get_settings().ai.redline_context_cache:
+        return compile_redline_context()
+
+    key = redline_context_key()
+    context = _memo.get(key)
+    if context is not None:
+        return context
+
+    path = _bundle_dir() / f"{key}.json"
+    context = _read_bundle(path, key) if path.exists() else None
+    if context is not None:
+        logger.info(
+            "Redline context: loaded bundle %s (%.0f ms)", key[:12], (time.time() - t0) * 1000,
+        )
+    else:
+        context = compile_redline_context(key)
+        _write_bundle(path, context)
+        logger.info("Redline context: compiled bundle %s (%.1fs)", key[:12], time.time() - t0)
+
+    _memo.clear()  # inputs changed — only the current bundle is worth keeping
+    _memo[key] = context
+    return context
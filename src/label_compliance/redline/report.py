@@ -187,6 +187,11 @@ def _render_markdown(result: LabelResult) -> str:
         lines.append(f"| New 2024 gaps | {len(score.new_2024_gaps)} |")
         lines.append(f"| 📏 Spec violations | {score.spec_violation_count} |")
         lines.append(f"| Rules with spec failures | {score.rules_with_spec_failures} |")
+        if result.ai_unavailable:
+            lines.append(
+                f"| 🤖 AI verification | Unavailable — rule-based results "
+                f"({result.ai_unavailable}) |"
+            )
         lines.append("")
 
     # ── Per-Section Results ──────────────────────────
@@ -472,6 +477,7 @@ def _render_json(result: LabelResult) -> dict:
             "new_2024_gaps": len(score.new_2024_gaps) if score else 0,
             "spec_violation_count": score.spec_violation_count if score else 0,
             "rules_with_spec_failures": score.rules_with_spec_failures if score else 0,
+            **({"ai_unavailable": result.ai_unavailable} if result.ai_unavailable else {}),
         },
         "results": [
             {
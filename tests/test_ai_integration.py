@@ -309,3 +309,238 @@ class TestAIVerifyRulesVisionBatch:
         assert results[0].status == "PASS"
         assert results[0].method == "ai_vision"
         assert provider.image_calls == 1
+
+
+# ═══════════════════════════════════════════════════════
+#  AI Executor Tests
+# ═══════════════════════════════════════════════════════
+
+class TestAIExecutor:
+    """Concurrent batches and the shared rate limiter."""
+
+    def test_concurrent_batches_keep_rule_order(self):
+        import threading
+        import time
+
+        from label_compliance.ai.executor import AIExecutor
+        from label_compliance.compliance.matcher import ai_verify_rules_text_batch
+
+        class SlowProvider(MockAIProvider):
+            """Answers every rule of the prompt; earlier batches answer last."""
+
+            def __init__(self):
+                super().__init__()
+                self.in_flight = 0
+                self.peak = 0
+                self._lock = threading.Lock()
+
+            def analyze(self, prompt: str, force_json: bool = True) -> str:
+                ids = [
+                    line[2:].split(":")[0] for line in prompt.splitlines() if line.startswith("- R")
+                ]
+                with self._lock:
+                    self.text_calls += 1
+                    self.in_flight += 1
+                    self.peak = max(self.peak, self.in_flight)
+                time.sleep(0.05 * (10 - int(ids[0][1:])) / 10)
+                with self._lock:
+                    self.in_flight -= 1
+                return json.dumps({"results": [
+                    {"rule_id": rid, "status": "PASS", "confidence": int(rid[1:]) / 10}
+                    for rid in ids
+                ]})
+
+        provider = SlowProvider()
+        rules = [{"id": f"R{i}", "description": f"Rule {i}", "markers": []} for i in range(1, 9)]
+        results = ai_verify_rules_text_batch(
+            rules, "text", provider, batch_size=2, executor=AIExecutor(max_concurrency=4),
+        )
+
+        assert [r.rule_id for r in results] == [f"R{i}" for i in range(1, 9)]
+        assert [r.confidence for r in results] == [i / 10 for i in range(1, 9)]
+        assert provider.text_calls == 4
+        assert provider.peak > 1
+
+    def test_rate_limiter_waits_for_tokens(self):
+        from label_compliance.ai.executor import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=6000)  # 100 tokens/s
+        assert limiter.acquire(6000) == 0.0   # a full bucket covers the burst
+        waited = limiter.acquire(10)          # then refills at 100 tokens/s
+        assert 0.05 <= waited <= 0.5
+        assert RateLimiter().acquire(10**6) == 0.0  # 0 = unlimited
+
+
+# ═══════════════════════════════════════════════════════
+#  AI Response Cache Tests
+# ═══════════════════════════════════════════════════════
+
+class TestAIResponseCache:
+    """Cached provider: keys, modes and what gets stored."""
+
+    def test_readwrite_then_read_serves_hits(self, tmp_path):
+        from label_compliance.ai.cache import AIResponseCache, CachedProvider
+
+        cache = AIResponseCache(path=tmp_path / "ai.sqlite", max_mb=1, ttl_days=30)
+        answer = json.dumps({"status": "PASS"})
+        inner = MockAIProvider(text_response=answer, image_response=answer)
+        image = tmp_path / "label.png"
+        image.write_bytes(b"first image")
+
+        provider = CachedProvider(inner, mode="readwrite", cache=cache)
+        assert provider.analyze("prompt") == answer
+        assert provider.analyze("prompt") == answer
+        assert provider.analyze_with_image("prompt", str(image)) == answer
+        assert provider.analyze_with_image("prompt", str(image)) == answer
+        assert (inner.text_calls, inner.image_calls) == (1, 1)
+
+        # Same path, new pixels → new key
+        image.write_bytes(b"second image")
+        provider.analyze_with_image("prompt", str(image))
+        assert inner.image_calls == 2
+
+        # read: hits served, misses not stored
+        reader = CachedProvider(inner, mode="read", cache=cache)
+        assert reader.analyze("prompt") == answer
+        reader.analyze("other prompt")
+        reader.analyze("other prompt")
+        assert inner.text_calls == 3
+
+    def test_errors_are_not_cached_and_ttl_expires(self, tmp_path):
+        from label_compliance.ai.cache import AIResponseCache, CachedProvider
+
+        inner = MockAIProvider(text_response='{"error": "rate limited"}')
+        cache = AIResponseCache(path=tmp_path / "ai.sqlite", max_mb=1)
+        provider = CachedProvider(inner, cache=cache)
+        provider.analyze("prompt")
+        provider.analyze("prompt")
+        assert inner.text_calls == 2
+
+        expired = AIResponseCache(path=tmp_path / "ttl.sqlite", max_mb=1, ttl_days=1)
+        expired.put("k", "{}")
+        expired.conn.execute("UPDATE responses SET created = created - 2 * 86400")
+        assert expired.get("k") is None
+
+    def test_read_mode_never_writes(self, tmp_path):
+        import hashlib
+        import sqlite3
+        import stat
+
+        from label_compliance.ai.cache import AIResponseCache, CachedProvider
+
+        path = tmp_path / "ai.sqlite"
+        writer = AIResponseCache(path=path, max_mb=1, ttl_days=1)
+        writer.put(writer.make_key(MockAIProvider(), "text", "prompt"), '{"status": "PASS"}')
+        writer.put("old", "{}")
+        writer.conn.execute("UPDATE responses SET created = 0, last_used = 0 WHERE key = 'old'")
+        writer.conn.commit()
+        writer.close()
+        path.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+
+        shared = AIResponseCache(path=path, max_mb=1, ttl_days=1, read_only=True)
+        inner = MockAIProvider(text_response='{"status": "FAIL"}')
+        reader = CachedProvider(inner, mode="read", cache=shared)
+        assert reader.analyze("prompt") == '{"status": "PASS"}'  # hit
+        assert reader.analyze("other") == '{"status": "FAIL"}'   # miss, not stored
+        assert shared.get("old") is None                          # expired, not deleted
+        assert (shared.hits, shared.misses, inner.text_calls) == (1, 2, 1)
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            shared.conn.execute("DELETE FROM responses")
+        shared.close()
+        assert hashlib.sha256(path.read_bytes()).hexdigest() == digest
+
+        # A missing shared cache is just empty
+        missing = AIResponseCache(path=tmp_path / "none.sqlite", read_only=True)
+        assert missing.get("k") is None and not (tmp_path / "none.sqlite").exists()
+
+
+# ═══════════════════════════════════════════════════════
+#  AI Resilience Tests
+# ═══════════════════════════════════════════════════════
+
+class _HTTPError(Exception):
+    """Stand-in for an SDK status error (``status_code`` + ``response.headers``)."""
+
+    def __init__(self, status_code: int, headers: dict | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+class _FlakyProvider(MockAIProvider):
+    """Raises the queued errors first, then answers."""
+
+    def __init__(self, errors: list[Exception], text_response: str = '{"results": []}'):
+        super().__init__(text_response=text_response)
+        self.errors = list(errors)
+
+    def analyze(self, prompt: str, force_json: bool = True) -> str:
+        self.text_calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self._text_response
+
+
+class TestAIResilience:
+    """Retries, Retry-After, the circuit breaker and 'AI unavailable'."""
+
+    def _wrap(self, provider, breaker=None, max_retries=3, backoff_max=0.01):
+        from label_compliance.ai.executor import RateLimiter
+        from label_compliance.ai.resilience import CircuitBreaker, ResilientProvider
+
+        return ResilientProvider(
+            provider, breaker=breaker or CircuitBreaker(threshold=2, cooldown=60),
+            limiter=RateLimiter(), max_retries=max_retries, backoff_base=0.001,
+            backoff_max=backoff_max,
+        )
+
+    def test_transient_errors_are_retried_honouring_retry_after(self):
+        import time
+
+        inner = _FlakyProvider([_HTTPError(429, {"retry-after-ms": "50"}), TimeoutError("slow")])
+        t0 = time.monotonic()
+        assert self._wrap(inner, backoff_max=0.1).analyze("prompt") == '{"results": []}'
+        assert inner.text_calls == 3
+        assert time.monotonic() - t0 >= 0.05
+
+    def test_retry_after_beyond_backoff_max_gives_up(self):
+        import time
+
+        from label_compliance.ai.base import AIUnavailableError
+        from label_compliance.ai.resilience import CircuitBreaker
+
+        breaker = CircuitBreaker(threshold=2, cooldown=60)
+        inner = _FlakyProvider([_HTTPError(429, {"retry-after": "3600"})])
+        t0 = time.monotonic()
+        with pytest.raises(AIUnavailableError, match="retry after 3600s"):
+            self._wrap(inner, breaker=breaker).analyze("prompt")
+        assert time.monotonic() - t0 < 1
+        assert inner.text_calls == 1
+        assert breaker.failures == 1
+
+    def test_breaker_opens_and_fails_fast(self):
+        from label_compliance.ai.base import AIUnavailableError
+        from label_compliance.ai.resilience import CircuitBreaker
+
+        breaker = CircuitBreaker(threshold=2, cooldown=60)
+        inner = _FlakyProvider([_HTTPError(401)] * 2 + [_HTTPError(500)] * 10)
+        provider = self._wrap(inner, breaker=breaker)
+        for _ in range(2):
+            with pytest.raises(AIUnavailableError):
+                provider.analyze("prompt")
+        assert inner.text_calls == 2  # 401 is not retried
+        assert breaker.is_open
+
+        with pytest.raises(AIUnavailableError, match="circuit open"):
+            provider.analyze("prompt")
+        assert inner.text_calls == 2  # failed fast
+
+    def test_unavailable_is_not_a_compliance_fail(self):
+        from label_compliance.ai.base import AIUnavailableError
+        from label_compliance.compliance.matcher import ai_verify_rules_text_batch
+
+        provider = self._wrap(_FlakyProvider([ConnectionError("down")] * 5), max_retries=1)
+        rules = [{"id": "R1", "description": "Rule 1", "markers": []}]
+        with pytest.raises(AIUnavailableError):
+            ai_verify_rules_text_batch(rules, "text", provider)
@@ -99,3 +99,411 @@ def test_compute_score_all_fail():
     score = compute_score("test-label", matches)
     assert score.status == "NON-COMPLIANT"
     assert score.score_pct < 50
+
+
+def test_label_image_dirs_isolates_duplicate_stems(tmp_path):
+    """Labels sharing a stem get distinct image directories."""
+    from label_compliance.compliance.batch import label_image_dirs
+
+    a = tmp_path / "a" / "LABEL 1.pdf"
+    b = tmp_path / "b" / "LABEL 1.pdf"
+    c = tmp_path / "OTHER.pdf"
+    dirs = label_image_dirs([a, b, c])
+    assert dirs[a] != dirs[b]
+    assert dirs[a].name.startswith("LABEL_1-")
+    assert dirs[c].name == "OTHER"
+
+
+def test_run_batch_preserves_input_order(tmp_path):
+    """Failures are reported as summaries, in input order."""
+    from label_compliance.compliance.batch import BatchOptions, run_batch
+
+    pdfs = [tmp_path / f"missing-{i}.pdf" for i in range(3)]
+    seen = []
+    summaries = run_batch(
+        pdfs, BatchOptions(use_ai=False, redline=False), max_workers=1,
+        on_result=lambda s: seen.append(s.pdf_path),
+    )
+    assert [s.pdf_path for s in summaries] == pdfs
+    assert seen == pdfs
+    assert all(not s.ok for s in summaries)
+
+
+def test_run_ledger_roundtrip(tmp_path):
+    """Ledger hits require matching hash, fingerprint and existing outputs."""
+    from label_compliance.compliance.ledger import RunLedger
+    from label_compliance.compliance.scorer import ComplianceScore
+
+    report = tmp_path / "report-L1.json"
+    report.write_text("{}")
+    pdf = tmp_path / "L1.pdf"
+    score = ComplianceScore(label_name="L1", total_rules=4, passed=3, failed=1,
+                            score_pct=75.0, status="PARTIAL")
+
+    ledger = RunLedger(tmp_path / "ledger.json")
+    ledger.record(pdf, "abc", "fp1", "L1", "default", score, [report])
+    ledger.save()
+
+    reloaded = RunLedger(tmp_path / "ledger.json")
+    entry = reloaded.lookup(pdf, "abc", "fp1")
+    assert entry is not None
+    assert entry.to_score().passed == 3
+    assert reloaded.lookup(pdf, "abc", "fp2") is None
+    assert reloaded.lookup(pdf, "def", "fp1") is None
+
+    report.unlink()
+    assert reloaded.lookup(pdf, "abc", "fp1") is None
+
+
+def test_run_fingerprint_tracks_options():
+    """Changing pipeline options changes the run fingerprint."""
+    from label_compliance.compliance.batch import BatchOptions
+    from label_compliance.compliance.ledger import run_fingerprint
+
+    assert run_fingerprint(BatchOptions()) == run_fingerprint(BatchOptions())
+    assert run_fingerprint(BatchOptions()) != run_fingerprint(BatchOptions(use_ai=False))
+
+
+def test_compiled_ruleset_matches_per_rule_scan():
+    """A compiled set finds the same markers/patterns as per-rule scans."""
+    from label_compliance.compliance import ruleset as ruleset_mod
+    from label_compliance.compliance.rules import load_rules
+    from label_compliance.compliance.ruleset import CompiledRuleSet, compile_rules, scan_rule
+
+    rules = load_rules()
+    assert compile_rules(rules) is compile_rules(rules)
+
+    text = (
+        "STERILE EO  Single use only. Silicone gel-filled breast implant, 350 cc.\n"
+        "Width 12.5 cm, projection 4 cm. See Instructions for Use (IFU). ISO 15223-1 LOT 1234"
+    )
+    for rule, hits in zip(rules, compile_rules(rules).scan(text)):
+        assert hits == scan_rule(rule, text), rule["id"]
+
+    # Overlapping and nested markers
+    hits = scan_rule({"markers": ["he", "she", "hers", "e", "ss"]}, "ushers sss")
+    assert hits.offsets == {"he": [2], "she": [1], "hers": [2], "e": [3], "ss": [7, 8]}
+
+    ruleset = CompiledRuleSet([
+        {"id": "A", "markers": ["lot", "LOT", "exp"], "pattern": r"\d{4}"},
+        {"id": "B", "markers": ["lo"]},
+    ])
+    a, b = ruleset.scan("Lot 2024 / lot")
+    assert a.markers == ["lot", "LOT"] and a.offsets["lot"] == [0, 11]
+    assert (a.pattern_value, a.pattern_span) == ("2024", (4, 8))
+    assert b.offsets == {"lo": [0, 11]} and b.pattern_value is None
+
+    with pytest.raises(ValueError, match="BAD"):
+        CompiledRuleSet([{"id": "BAD", "pattern": "(unclosed"}])
+
+    # The cache of compiled sets stays bounded
+    lists = [[{"id": str(i), "markers": ["x"]}] for i in range(ruleset_mod._MAX_COMPILED + 3)]
+    for rule_list in lists:
+        compile_rules(rule_list)
+    assert len(ruleset_mod._compiled) == ruleset_mod._MAX_COMPILED
+    assert compile_rules(lists[-1]).rules is lists[-1]
+
+
+def test_sections_get_only_their_own_ocr_words():
+    """OCR words are joined to section bboxes; neighbours don't leak in."""
+    from label_compliance.compliance.checker import _assign_ocr_to_sections
+    from label_compliance.document.label_segmenter import LabelSection
+    from label_compliance.document.ocr import OCRResult, OCRWord
+
+    # 144 DPI → 2 px per PDF point; left panel x < 100 pt, right panel beyond
+    words = [
+        OCRWord("STERILE", 95, 20, 20, 80, 20, 1, 1),
+        OCRWord("EO", 95, 110, 20, 30, 20, 1, 1),
+        OCRWord("LOT", 95, 260, 20, 40, 20, 2, 1),
+        OCRWord("1234", 95, 310, 20, 50, 20, 2, 1),
+        OCRWord("REF", 95, 20, 300, 40, 20, 3, 1),
+    ]
+    page = OCRResult("p1.png", (400, 400), "STERILE EO\n\nLOT 1234\n\nREF\n\n\f", words)
+    left = LabelSection("COMBO LABEL", "combo", 1, bbox=(0, 0, 100, 200))
+    right = LabelSection("OUTER LID LABEL", "outer_lid", 1, bbox=(110, 0, 200, 200))
+    single = LabelSection("IFU", "ifu", 2, bbox=(0, 0, 50, 50))
+
+    parts = _assign_ocr_to_sections([left, right, single], {1: page, 2: page}, set(), dpi=144)
+    assert [w.text for w in parts[0].words] == ["STERILE", "EO", "REF"]
+    assert parts[0].full_text == "STERILE EO\n\nREF\n\n\f"
+    assert [w.text for w in parts[1].words] == ["LOT", "1234"]
+    assert "STERILE" not in parts[1].text_lower
+    assert 2 not in parts  # single-section page keeps the page OCR
+
+    # Embedded-image OCR merged into the page: no geometry to join on
+    assert _assign_ocr_to_sections([left, right], {1: page}, {1}, dpi=144) == {}
+
+
+def test_sections_follow_page_rotation():
+    """On a /Rotate page, section bboxes are rotated into the word pixels too."""
+    import fitz
+
+    from label_compliance.compliance.checker import _assign_ocr_to_sections
+    from label_compliance.document.label_segmenter import LabelSection
+    from label_compliance.document.ocr import OCRResult, OCRWord
+
+    doc = fitz.open()
+    pdf_page = doc.new_page(width=600, height=400)
+    pdf_page.set_rotation(90)
+
+    # Rendered 400 x 600 at 72 DPI: unrotated x runs down the image
+    words = [
+        OCRWord("STERILE", 95, 150, 100, 80, 20, 1, 1),
+        OCRWord("LOT", 95, 150, 450, 40, 20, 2, 1),
+    ]
+    page = OCRResult("p1.png", (400, 600), "STERILE\n\nLOT\n\n\f", words)
+    left = LabelSection("COMBO LABEL", "combo", 1, bbox=(0, 0, 300, 400))
+    right = LabelSection("OUTER LID LABEL", "outer_lid", 1, bbox=(300, 0, 600, 400))
+
+    parts = _assign_ocr_to_sections(
+        [left, right], {1: page}, set(), dpi=72, rotations={1: pdf_page.rotation_matrix},
+    )
+    assert [w.text for w in parts[0].words] == ["STERILE"]
+    assert [w.text for w in parts[1].words] == ["LOT"]
+    doc.close()
+
+
+def test_label_result_close_releases_pdf(tmp_path):
+    """Page images reopen the PDF lazily; LabelResult.close() releases it."""
+    import fitz
+
+    from label_compliance.compliance.checker import check_label
+
+    pdf = tmp_path / "LABEL.pdf"
+    doc = fitz.open()
+    # Over 50 characters of text: the vector fast path, no Tesseract
+    doc.new_page().insert_text(
+        (72, 72), "REF 12345  LOT A1B2  STERILE R  Single use only, do not resterilize",
+    )
+    doc.save(str(pdf))
+    doc.close()
+
+    result = check_label(pdf, use_ai=False, image_dir=tmp_path / "images")
+    provider = result.page_images
+    assert provider is not None
+    provider.clear()
+    assert provider.page(1).rgb is not None  # re-render reopens the document
+    assert provider.ctx._doc is not None
+
+    result.close()
+    assert provider.ctx._doc is None and result.page_images is None
+    result.close()  # idempotent
+
+
+def test_redline_context_bundle_reused_until_inputs_change(tmp_path, monkeypatch):
+    """The redline context is compiled once, reloaded from disk, rebuilt when the KB changes."""
+    from label_compliance.config import get_settings
+    from label_compliance.redline import context_bundle
+
+    monkeypatch.setattr(get_settings().paths, "cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(get_settings().paths, "knowledge_base_dir", tmp_path / "kb")
+    monkeypatch.setattr(context_bundle, "_memo", {})
+    compiled = []
+    real_compile = context_bundle.compile_redline_context
+    monkeypatch.setattr(
+        context_bundle, "compile_redline_context",
+        lambda key="": compiled.append(key) or real_compile(key),
+    )
+
+    first = context_bundle.get_redline_context()
+    assert "ISO STANDARD COMPLIANCE RULES" in first.yaml_rules_text
+    context_bundle._memo.clear()  # a new process: served from disk
+    assert context_bundle.get_redline_context() == first
+    assert len(compiled) == 1
+
+    (tmp_path / "kb").mkdir()
+    (tmp_path / "kb" / "ISO-14607-2024-ai.json").write_text('{"sections": []}')
+    assert context_bundle.get_redline_context().key != first.key
+    assert len(compiled) == 2
+
+
+def _stub_redline_pipeline(monkeypatch, tmp_path, page_panels, pass1, pass2=None):
+    """Stub the redliner's rendering and AI passes; returns the PDF to analyse.
+
+    *page_panels* maps each 0-based page to the names Pass 0 gives its panels.
+    """
+    import fitz
+
+    from label_compliance.ai import executor
+    from label_compliance.redline import ai_redliner as ar
+    from label_compliance.redline.context_bundle import RedlineContext
+
+    pdf = tmp_path / "drawing.pdf"
+    doc = fitz.open()
+    for _ in range(max(page_panels) + 1):
+        doc.new_page()
+    doc.save(str(pdf))
+    doc.close()
+
+    def prepare(page, label_name):
+        idx = page.number
+        panels = [
+            ar.PanelInfo(f"I{k}", tmp_path / f"panel_{idx}_{k}.png", (0, 0, 10, 10), page_idx=idx)
+            for k in range(len(page_panels[idx]))
+        ]
+        return ar.PageAnalysis(idx, [], "", "", tmp_path / f"overview_{idx}.png", panels, 100, 100)
+
+    def pass0(overview_image, panels, elements, pw, ph):
+        for panel in panels:
+            panel.panel_name = page_panels[panel.page_idx][int(panel.element_id[1:])]
+        return panels
+
+    monkeypatch.setattr(executor, "get_ai_executor", lambda: executor.AIExecutor(max_concurrency=4))
+    monkeypatch.setattr(ar, "_prepare_page", prepare)
+    monkeypatch.setattr(ar, "get_redline_context", lambda: RedlineContext("", "", ""))
+    monkeypatch.setattr(ar, "_pass0_identify_panels", pass0)
+    monkeypatch.setattr(ar, "_build_panel_prompt", lambda panel, *args: panel.panel_name)
+    monkeypatch.setattr(ar, "_pass1_analyze_panel", pass1)
+    monkeypatch.setattr(ar, "_pass2_cross_panel_review", pass2 or (lambda *args: []))
+    return pdf
+
+
+def test_redline_issues_numbered_in_panel_order(tmp_path, monkeypatch):
+    """Panels finishing out of order keep panel-order issue IDs; a failed panel adds none."""
+    import threading
+
+    from label_compliance.redline import ai_redliner as ar
+
+    # D finishes first, then C (fails), B, A
+    issues = {"A": ["a1", "a2"], "B": ["b1"], "C": [], "D": ["d1"]}
+    after = {"A": "B", "B": "C", "C": "D"}
+    finished = {name: threading.Event() for name in issues}
+    order = []
+
+    def pass1(panel, prompt, symbol_sheet_b64=""):
+        name = panel.panel_name
+        try:
+            if name in after:
+                assert finished[after[name]].wait(5)
+            if name == "C":
+                raise RuntimeError("model error")
+            return [{"description": d, "page_idx": 0} for d in issues[name]]
+        finally:
+            order.append(name)
+            finished[name].set()
+
+    pdf = _stub_redline_pipeline(monkeypatch, tmp_path, {0: list("ABCD")}, pass1)
+    result, _ = ar.analyze_document_with_ai(pdf)
+
+    assert order == ["D", "C", "B", "A"]
+    assert [(i.issue_id, i.description) for i in result.issues] == [
+        (1, "a1"), (2, "a2"), (3, "b1"), (4, "d1"),
+    ]
+
+
+def test_parse_page_selection():
+    """1-based ranges → sorted 0-based pages; pages past the end are dropped."""
+    from label_compliance.redline.ai_redliner import parse_page_selection
+
+    assert parse_page_selection("1-3,5", 6) == [0, 1, 2, 4]
+    assert parse_page_selection("all", 3) == parse_page_selection(None, 3) == [0, 1, 2]
+    assert parse_page_selection(" 2 , 2-3 ", 3) == [1, 2]
+    assert parse_page_selection("2-9", 3) == [1, 2]
+    with pytest.raises(ValueError, match="no page"):
+        parse_page_selection("5", 3)
+    with pytest.raises(ValueError, match="range"):
+        parse_page_selection("3-1", 6)
+    with pytest.raises(ValueError, match="range"):
+        parse_page_selection("0", 6)
+    with pytest.raises(ValueError, match="Invalid page selection"):
+        parse_page_selection("first", 6)
+
+
+def test_redline_pages_numbered_and_cross_issues_attributed(tmp_path, monkeypatch):
+    """Issues are numbered page, then panel order; Pass 2 issues fall back to a known page."""
+    import json
+    import threading
+    from types import SimpleNamespace
+
+    from label_compliance.redline import ai_redliner as ar
+
+    def pass1(panel, prompt, symbol_sheet_b64=""):
+        return [{"description": panel.panel_name, "area": panel.panel_name,
+                 "page_idx": panel.page_idx}]
+
+    cross = [
+        {"description": "x-page", "page": 2},     # the AI's page
+        {"description": "x-panel", "area": "Lid"},  # page of the named panel
+        {"description": "x-none"},                 # first analysed page
+        {"description": "x-bad", "page": 7},      # not analysed → first page
+    ]
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(
+            message=SimpleNamespace(content=json.dumps({"cross_panel_issues": cross})),
+            finish_reason="stop",
+        )],
+        usage=None,
+    )
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: response,
+    )))
+
+    pdf = _stub_redline_pipeline(
+        monkeypatch, tmp_path, {0: ["Tray"], 1: ["Lid", "Box"]}, pass1,
+        pass2=ar._pass2_cross_panel_review,
+    )
+    monkeypatch.chdir(tmp_path)  # Pass 2 writes its debug response under outputs/
+    monkeypatch.setattr(ar, "_get_openai_client", lambda: client)
+    monkeypatch.setattr(ar, "_acquire_rate_limit", lambda *args: None)
+    monkeypatch.setattr(ar, "_encode_image", lambda path: ("", "image/png"))
+    pass0, pass0_threads = ar._pass0_identify_panels, []
+    monkeypatch.setattr(ar, "_pass0_identify_panels", lambda *args: (
+        pass0_threads.append(threading.current_thread().name) or pass0(*args)
+    ))
+
+    result, _ = ar.analyze_document_with_ai(pdf)
+    # Pass 0 runs on the AI executor, within ai.max_concurrency
+    assert len(pass0_threads) == 2 and all(n.startswith("ai") for n in pass0_threads)
+    assert result.pages == [0, 1]
+    assert [(i.issue_id, i.description, i.page_idx) for i in result.issues] == [
+        (1, "Tray", 0), (2, "Lid", 1), (3, "Box", 1),
+        (4, "x-page", 1), (5, "x-panel", 1), (6, "x-none", 0), (7, "x-bad", 0),
+    ]
+
+
+def test_redline_markers_land_on_their_page(tmp_path):
+    """Each issue is marked on its own page, located through that page's elements."""
+    import fitz
+
+    from label_compliance.redline.ai_redliner import (
+        PDFElement,
+        RedlineIssue,
+        RedlineResult,
+        generate_ai_redline_pdf,
+    )
+
+    pdf = tmp_path / "drawing.pdf"
+    doc = fitz.open()
+    for _ in range(2):
+        doc.new_page(width=600, height=400)
+    doc.save(str(pdf))
+    doc.close()
+
+    # Element IDs are per page: "T0" is a different block on each page
+    elements = [
+        PDFElement("T0", "text", (50, 50, 200, 80), "LOT", page_idx=0),
+        PDFElement("T0", "text", (300, 250, 500, 300), "REF", page_idx=1),
+    ]
+    result = RedlineResult(label_name="drawing", pages=[0, 1], issues=[
+        RedlineIssue(1, "Missing LOT symbol", "Lid", "non-conformance", "add",
+                     element_ids=["T0"], page_idx=0),
+        RedlineIssue(2, "Outdated REF symbol", "Box", "non-conformance", "replace",
+                     element_ids=["T0"], page_idx=1),
+    ])
+
+    out = generate_ai_redline_pdf(pdf, result, elements, output_dir=tmp_path / "out")
+    doc = fitz.open(str(out))
+    assert doc.page_count == 3  # two drawing pages + legend
+    marked = []
+    for page in list(doc)[:2]:
+        boxes = [a for a in page.annots() if a.type[1] == "Square"]
+        assert len(boxes) == 1
+        marked.append((boxes[0].info["content"], boxes[0].rect))
+        assert ("NC-1:" in page.get_text(), "NC-2:" in page.get_text()) == (
+            (True, False) if page.number == 0 else (False, True)
+        )
+    doc.close()
+    assert marked[0][0] == "Missing LOT symbol"
+    assert marked[0][1].intersects(fitz.Rect(50, 50, 200, 80))
+    assert marked[1][0] == "Outdated REF symbol"
+    assert marked[1][1].intersects(fitz.Rect(300, 250, 500, 300))
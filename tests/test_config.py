@@ -39,3 +39,18 @@ def test_ensure_dirs(tmp_path, monkeypatch):
     s.ensure_dirs()
     assert Path(s.paths.output_dir).exists()
     assert Path(s.paths.redline_dir).exists()
+
+
+def test_ai_cache_mode_from_yaml(monkeypatch):
+    """A bare YAML ``off``/``on`` maps to a cache mode; unknown modes fail at load."""
+    from label_compliance import config
+
+    for raw, mode in ((False, "off"), (True, "readwrite"), ("Read", "read")):
+        monkeypatch.setattr(config, "_settings", None)
+        monkeypatch.setattr(config, "_load_yaml", lambda raw=raw: {"ai": {"cache": raw}})
+        assert config.get_settings().ai.cache == mode
+
+    monkeypatch.setattr(config, "_settings", None)
+    monkeypatch.setattr(config, "_load_yaml", lambda: {"ai": {"cache": "sometimes"}})
+    with pytest.raises(ValueError, match="ai.cache"):
+        config.get_settings()
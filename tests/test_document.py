@@ -60,3 +60,495 @@ def test_symbol_match_structure():
     )
     assert s.found is True
     assert s.method == "ocr"
+
+
+def _make_label_pdf(path: Path) -> Path:
+    """Write a one-page vector label with an embedded raster image."""
+    import fitz
+
+    doc = fitz.open()
+    page = doc.new_page(width=600, height=400)
+    page.insert_text((40, 40), "COMBO LABEL", fontsize=14)
+    page.insert_text((40, 70), "Silicone gel implant. Sterile. Do not reuse. LOT 12345", fontsize=8)
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 400, 300), False)
+    pix.set_rect(pix.irect, (200, 200, 200))
+    page.insert_image(fitz.Rect(40, 150, 300, 350), pixmap=pix)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_document_context_memoizes_pages(tmp_path):
+    """DocumentContext parses each page once and feeds the document modules."""
+    from label_compliance.document.context import DocumentContext
+    from label_compliance.document.font_analyzer import extract_fonts
+    from label_compliance.document.image_extractor import classify_pdf_pages
+    from label_compliance.document.pdf_reader import read_pdf
+
+    pdf = _make_label_pdf(tmp_path / "label.pdf")
+    with DocumentContext(pdf) as ctx:
+        assert ctx.page_count == 1
+        assert ctx.text_dict(1) is ctx.text_dict(1)
+        assert "COMBO LABEL" in ctx.text(1)
+
+        pdf_data = read_pdf(ctx)
+        fonts = extract_fonts(ctx)
+        analysis = classify_pdf_pages(ctx)
+
+    assert pdf_data.num_pages == 1
+    assert any(f.text == "COMBO LABEL" for f in fonts)
+    assert analysis.mixed_pages == [1]
+    # Paths still work and give the same answer
+    assert len(extract_fonts(pdf)) == len(fonts)
+
+
+def test_span_index_matches_span_walk(tmp_path):
+    """One SpanIndex answers the page, region and text queries of the old walks."""
+    import fitz
+
+    from label_compliance.document.context import DocumentContext
+    from label_compliance.document.font_analyzer import extract_fonts
+
+    doc = fitz.open()
+    for n in range(2):
+        page = doc.new_page(width=600, height=400)
+        page.insert_text((40, 40), f"PAGE {n + 1} HEADER", fontsize=14, fontname="hebo")
+        page.insert_text((40, 300), "Sterile LOT 12345", fontsize=7)
+        page.insert_text((400, 300), "Do not reuse", fontsize=7)
+    pdf = tmp_path / "spans.pdf"
+    doc.save(str(pdf))
+    doc.close()
+
+    with DocumentContext(pdf) as ctx:
+        index = ctx.span_index
+        assert index is ctx.span_index
+        assert extract_fonts(ctx) is index.fonts
+        assert [f.text for f in index.fonts if f.page == 2] == [
+            "PAGE 2 HEADER", "Sterile LOT 12345", "Do not reuse",
+        ]
+
+        walked = [(s["font"], round(s["size"], 1), s["flags"]) for s in ctx.spans(2)]
+        page_dicts = index.font_dicts(index.page_ids(2))
+        assert [(d["name"], d["size"], d["flags"]) for d in page_dicts] == walked
+        assert [d["size"] for d in index.unique_fonts(index.page_ids(1))] == [14.0, 7.0]
+
+        left = index.in_region(2, 0, 200, 300, 400)
+        assert [index.texts[i] for i in left] == ["Sterile LOT 12345"]
+        # Both bottom spans share one text block, which straddles the box edge
+        block = index.in_region(2, 0, 200, 400, 400, by_block=True)
+        assert [index.texts[i] for i in block] == ["Sterile LOT 12345", "Do not reuse"]
+        assert [index.fonts[i].page for i in index.find("sterile")] == [1, 2]
+        assert index.fonts[index.find("page 1")[0]].is_bold
+
+def test_embedded_images_shared_through_context(tmp_path, monkeypatch):
+    """Segmenter and checker reuse one extraction + OCR per embedded image."""
+    from label_compliance.document import ocr
+    from label_compliance.document.context import DocumentContext
+    from label_compliance.document.image_extractor import (
+        extract_and_ocr_embedded_images,
+        extract_embedded_images,
+        ocr_embedded_image,
+    )
+
+    calls = []
+
+    def fake_run_ocr(image_path, preprocess=True, **kwargs):
+        calls.append(Path(image_path))
+        return ocr.OCRResult(image_path=str(image_path), image_size=(400, 300), full_text="STERILE")
+
+    monkeypatch.setattr(ocr, "run_ocr", fake_run_ocr)
+
+    pdf = _make_label_pdf(tmp_path / "label.pdf")
+    embed_dir = tmp_path / "embedded"
+    with DocumentContext(pdf) as ctx:
+        texts = extract_and_ocr_embedded_images(ctx, embed_dir, pages=[1])
+        images = extract_embedded_images(ctx, embed_dir, pages=[1])
+
+        assert texts == {1: "STERILE"}
+        assert len(images) == 1
+        assert images[0] is ctx.embedded[images[0].xref]
+        assert ocr_embedded_image(images[0]).full_text == "STERILE"
+
+    assert len(calls) == 1
+
+
+def test_page_image_provider_in_memory(tmp_path):
+    """Pages render once into cached arrays; PNGs only appear on request."""
+    import cv2
+
+    from label_compliance.document.context import DocumentContext
+    from label_compliance.document.image_renderer import render_pages
+    from label_compliance.document.page_images import PageImageProvider, as_page_image
+
+    pdf = _make_label_pdf(tmp_path / "label.pdf")
+    png = render_pages(pdf, output_dir=tmp_path / "png", dpi=72)[0]
+
+    with DocumentContext(pdf) as ctx:
+        provider = PageImageProvider(ctx, output_dir=tmp_path / "mem", dpi=72)
+        page = provider.page(1)
+
+        # Same pixels as decoding the rendered PNG, without writing one
+        assert (page.bgr == cv2.imread(str(png))).all()
+        assert (page.gray == as_page_image(png).gray).all()
+        assert page.size == (600, 400)
+        assert not page.bgr.flags.writeable
+        assert provider.renders == 1
+        assert provider.saved_path(1) is None
+        assert not (tmp_path / "mem").exists()
+
+        # A tiny budget evicts older variants; they re-render on demand
+        small = PageImageProvider(ctx, output_dir=tmp_path / "mem", dpi=72, budget_mb=0)
+        _ = small.page(1).gray
+        assert small.cached_bytes == small.page(1).gray.nbytes
+        _ = small.page(1).rgb
+        assert small.renders == 2
+
+        assert page.save() == provider.saved_path(1)
+        assert (cv2.imread(str(provider.path(1))) == page.bgr).all()
+
+
+def test_page_image_pyramid_levels(tmp_path, monkeypatch):
+    """Stages read coarser pyramid levels and report native coordinates."""
+    from label_compliance.document import layout
+    from label_compliance.document.context import DocumentContext
+    from label_compliance.document.layout import analyze_layout
+    from label_compliance.document.page_images import PageImageProvider, as_page_image
+
+    pdf = _make_label_pdf(tmp_path / "label.pdf")
+    with DocumentContext(pdf) as ctx:
+        page = PageImageProvider(ctx, output_dir=tmp_path, dpi=300).page(1)
+        assert page.size == (2500, 1667)
+
+        half = page.at("half")
+        assert half.gray.shape == (833, 1250)
+        assert half.scale == 0.5
+        assert half.to_native(100, 50, 10, 20) == (200, 100, 20, 40)
+        assert half.at("native") is page
+
+        match = page.at("match")
+        assert max(match.size) == 1000
+        assert page.at("quarter").size == (625, 416)
+
+        # Layout runs at half resolution, zones land in native pixels
+        zones = analyze_layout(page)
+        monkeypatch.setattr(layout, "LAYOUT_LEVEL", "native")
+        full_res = analyze_layout(page)
+        assert len(zones) == len(full_res) > 0
+        for z, ref in zip(zones, full_res):
+            assert z.zone_type == ref.zone_type
+            assert abs(z.x - ref.x) <= 6 and abs(z.y - ref.y) <= 6
+            assert abs(z.w - ref.w) <= 6 and abs(z.h - ref.h) <= 6
+
+    # File-backed images get the same levels
+    png = tmp_path / "page.png"
+    page.pil().save(png)
+    file_half = as_page_image(png).at("half")
+    assert file_half.size == (1250, 833)
+
+
+def test_ocr_from_vector_text_uses_pdf_words(tmp_path):
+    """Vector pages yield an OCRResult in render pixels without Tesseract."""
+    from label_compliance.document.context import DocumentContext
+    from label_compliance.document.image_extractor import classify_pdf_pages
+    from label_compliance.document.ocr import ocr_from_vector_text
+
+    pdf = _make_label_pdf(tmp_path / "label.pdf")
+    with DocumentContext(pdf) as ctx:
+        assert classify_pdf_pages(ctx).page_classifications[0].has_vector_text
+        result = ocr_from_vector_text(ctx, 1, dpi=144, image_size=(1200, 800))
+
+    assert result.image_size == (1200, 800)
+    assert "COMBO LABEL" in result.full_text
+    combo = result.find_text("COMBO")[0]
+    assert combo.confidence == 100
+    # Inserted at x=40pt with baseline y=40pt → 2 px per pt at 144 DPI
+    assert combo.x == 80
+    assert combo.y < 80 < combo.y + combo.h
+    assert result.find_text("LOT") and result.text_blocks
+
+
+def test_ocr_from_vector_text_follows_page_rotation(tmp_path):
+    """On a /Rotate 90 page, word boxes land on the text of the rotated render."""
+    import fitz
+    import numpy as np
+
+    from label_compliance.document.context import DocumentContext
+    from label_compliance.document.ocr import ocr_from_vector_text
+
+    pdf = tmp_path / "rotated.pdf"
+    doc = fitz.open()
+    page = doc.new_page(width=600, height=400)
+    page.insert_text((40, 60), "STERILE", fontsize=24)
+    page.set_rotation(90)
+    doc.save(str(pdf))
+    doc.close()
+
+    with DocumentContext(pdf) as ctx:
+        pix = ctx.page(1).get_pixmap(matrix=fitz.Matrix(2, 2), colorspace=fitz.csGRAY)
+        result = ocr_from_vector_text(ctx, 1, dpi=144)
+
+    assert result.image_size == (pix.width, pix.height) == (800, 1200)
+    word = result.find_text("STERILE")[0]
+    gray = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width)
+    ink = np.argwhere(gray < 128)
+    (iy0, ix0), (iy1, ix1) = ink.min(axis=0), ink.max(axis=0)
+    # The box encloses every inked pixel of the (only) word on the render
+    assert word.x <= ix0 and ix1 <= word.x + word.w + 1
+    assert word.y <= iy0 and iy1 <= word.y + word.h + 1
+    assert word.h > word.w  # rotated: the word runs vertically
+
+
+def test_text_from_ocr_data_matches_tesseract_layout():
+    """Full text is rebuilt from one image_to_data pass with line/para breaks."""
+    from label_compliance.document.ocr import text_from_ocr_data
+
+    rows = [
+        # level, block, par, line, text
+        (1, 0, 0, 0, ""),
+        (2, 1, 0, 0, ""),
+        (5, 1, 1, 1, "STERILE"),
+        (5, 1, 1, 1, "EO"),
+        (5, 1, 1, 2, "LOT"),
+        (5, 1, 1, 2, " "),
+        (5, 1, 2, 1, "Do"),
+        (5, 1, 2, 1, "not"),
+        (5, 2, 1, 1, "REF"),
+    ]
+    data = {
+        "level": [r[0] for r in rows],
+        "block_num": [r[1] for r in rows],
+        "par_num": [r[2] for r in rows],
+        "line_num": [r[3] for r in rows],
+        "text": [r[4] for r in rows],
+    }
+
+    assert text_from_ocr_data(data) == "STERILE EO\nLOT\n\nDo not\n\nREF\n\n\f"
+    assert text_from_ocr_data({"level": [1], "text": [""]}) == "\f"
+
+
+def test_ocr_cache_roundtrip_and_eviction(tmp_path, monkeypatch):
+    """Identical pixels + settings hit the cache; size budget evicts LRU."""
+    import numpy as np
+
+    from label_compliance.document import ocr
+    from label_compliance.document.ocr import OCRResult, OCRWord, run_ocr
+    from label_compliance.document.ocr_cache import OCRCache
+
+    cache = OCRCache(tmp_path / "ocr.sqlite", max_mb=1)
+    calls = []
+
+    def fake_ocr_on_image(processed, image_path, lang, min_conf, w, h):
+        calls.append(image_path)
+        words = [
+            OCRWord("STERILE", 91, 10, 20, 30, 12, 1, 1),
+            OCRWord("LOT", 88, 50, 20, 20, 12, 1, 1),
+        ]
+        blocks = ocr._group_text_blocks(words)
+        return OCRResult(str(image_path), (w, h), "STERILE LOT\n\n\f", words, blocks)
+
+    monkeypatch.setattr(ocr, "get_ocr_cache", lambda: cache)
+    monkeypatch.setattr(ocr, "_ocr_on_image", fake_ocr_on_image)
+
+    img = np.full((60, 80, 3), 255, dtype=np.uint8)
+    png_a, png_b = tmp_path / "a.png", tmp_path / "b.png"
+    import cv2
+    cv2.imwrite(str(png_a), img)
+    cv2.imwrite(str(png_b), img)
+
+    first = run_ocr(png_a)
+    second = run_ocr(png_b)  # same pixels under another name
+    assert len(calls) == 1
+    assert second.image_path == str(png_b)
+    assert second.full_text == first.full_text
+    assert [(w.text, w.x, w.confidence) for w in second.words] == [
+        ("STERILE", 10, 91), ("LOT", 50, 88),
+    ]
+    assert second.text_blocks == first.text_blocks
+
+    run_ocr(png_a, preprocess=False)  # different settings → miss
+    assert len(calls) == 2
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (2, 1, 2)
+
+    # Over budget: oldest entries go first
+    big = OCRResult("x", (1, 1), "x" * 400_000)
+    for i in range(4):
+        cache.put(f"big-{i}", big)
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    assert cache.get("big-3") is not None
+    assert cache.get("big-0") is None
+
+
+def test_ocr_cache_lookups_do_not_write(tmp_path):
+    """Hits are counted in memory; last_used is refreshed only once stale."""
+    from label_compliance.document import ocr_cache
+    from label_compliance.document.ocr import OCRResult
+    from label_compliance.document.ocr_cache import OCRCache
+
+    cache = OCRCache(tmp_path / "ocr.sqlite", max_mb=1)
+    cache.put("k", OCRResult("x", (1, 1), "STERILE"))
+    changes = cache.conn.total_changes
+    for _ in range(10):
+        assert cache.get("k") is not None
+    assert cache.get("missing") is None
+    assert cache.conn.total_changes == changes
+
+    stats = cache.stats()  # flushes the pending counters
+    assert (stats["hits"], stats["misses"]) == (10, 1)
+
+    stale = 1000.0
+    with cache.conn:
+        cache.conn.execute("UPDATE ocr SET last_used = ?", (stale,))
+    cache.get("k")
+    assert cache.conn.execute("SELECT last_used FROM ocr").fetchone()[0] == stale
+    cache.flush()
+    assert cache.conn.execute("SELECT last_used FROM ocr").fetchone()[0] > stale
+
+    for _ in range(ocr_cache._FLUSH_EVERY):
+        cache.get("k")
+    row = cache.conn.execute("SELECT value FROM stats WHERE name = 'hits'").fetchone()
+    assert row[0] == 11 + ocr_cache._FLUSH_EVERY
+
+
+def test_multi_strategy_probe_and_early_exit(monkeypatch):
+    """Probe shortlists a clear winner; a pass at the target stops the rest."""
+    from pathlib import Path
+
+    import numpy as np
+
+    from label_compliance.config import get_settings
+    from label_compliance.document import ocr
+    from label_compliance.document.ocr import OCRResult, OCRWord
+
+    # words per strategy: (probe, full size)
+    quality = {"raw": (2, 40), "grayscale": (2, 40), "otsu": (3, 60), "standard": (9, 200)}
+    calls = []
+
+    def fake_strategy(name, img, image_path, lang, min_conf, is_high_res):
+        full = img.shape[1] > 1000
+        calls.append((name, full))
+        n = quality[name][full]
+        words = [OCRWord(f"w{i}", 90, i, 0, 5, 5) for i in range(n)]
+        return OCRResult(str(image_path), img.shape[1::-1], name, words)
+
+    monkeypatch.setattr(ocr, "_ocr_strategy", fake_strategy)
+    doc = get_settings().document
+    monkeypatch.setattr(doc, "ocr_workers", 2)
+    img = np.zeros((1500, 2000, 3), dtype=np.uint8)
+
+    # Probe: "standard" leads by 3x → only it runs at full size
+    result = ocr._run_ocr_multi_strategy(img, Path("x.png"), "eng", 30, True)
+    assert result.full_text == "standard"
+    assert [c for c in calls if c[1]] == [("standard", True)]
+    assert sorted(n for n, full in calls if not full) == sorted(ocr.OCR_STRATEGIES)
+
+    # No probe, one worker: "otsu" reaches the target → "standard" never starts
+    calls.clear()
+    monkeypatch.setattr(doc, "ocr_probe", False)
+    monkeypatch.setattr(doc, "ocr_workers", 1)
+    monkeypatch.setattr(doc, "ocr_target_words", 50)
+    result = ocr._run_ocr_multi_strategy(img, Path("x.png"), "eng", 30, True)
+    assert result.full_text == "otsu"
+    assert [n for n, _ in calls] == ["raw", "grayscale", "otsu"]
+
+    # Nothing reaches the target: all passes, ties keep strategy order
+    calls.clear()
+    monkeypatch.setattr(doc, "ocr_target_words", 10_000)
+    quality["standard"] = (9, 40)
+    quality["otsu"] = (3, 40)
+    monkeypatch.setattr(doc, "ocr_workers", 4)
+    result = ocr._run_ocr_multi_strategy(img, Path("x.png"), "eng", 30, True)
+    assert result.full_text == "raw"
+    assert sorted(n for n, _ in calls) == sorted(ocr.OCR_STRATEGIES)
+
+
+def test_tiled_ocr_merges_overlap_duplicates(monkeypatch):
+    """Words cut or repeated at tile edges come back exactly once."""
+    from dataclasses import replace
+    from pathlib import Path
+
+    import numpy as np
+
+    from label_compliance.config import get_settings
+    from label_compliance.document import ocr
+    from label_compliance.document.ocr import OCRWord, tile_grid
+
+    tiles = tile_grid(5000, 3000, 2048, 256)
+    assert len(tiles) == 3 * 2
+    for (x, y, w, h), (nx, _, _, _) in zip(tiles, tiles[1:]):
+        assert w <= 2048 and h <= 2048
+        if nx > x:
+            assert x + w - nx >= 256  # horizontal neighbours overlap
+    assert max(x + w for x, _, w, _ in tiles) == 5000
+    assert max(y + h for _, y, _, h in tiles) == 3000
+
+    # Ground truth, incl. words straddling the vertical and horizontal seams
+    truth = [
+        OCRWord("STERILE", 90, 100, 100, 200, 40, 1, 1),
+        OCRWord("LOT", 85, 1900, 500, 150, 40, 1, 2),
+        OCRWord("REF", 80, 2000, 1900, 120, 40, 2, 1),
+        OCRWord("EO", 95, 4800, 2900, 100, 40, 1, 1),
+    ]
+
+    def fake_tile(strategy, img, tile, image_path, lang, min_conf, is_high_res):
+        x, y, w, h = tile
+        words = []
+        for wd in truth:
+            x0, y0 = max(wd.x, x), max(wd.y, y)
+            x1, y1 = min(wd.x + wd.w, x + w), min(wd.y + wd.h, y + h)
+            if x1 > x0 and y1 > y0:  # visible, maybe clipped by the tile edge
+                whole = (x0, y0, x1, y1) == (wd.x, wd.y, wd.x + wd.w, wd.y + wd.h)
+                words.append(replace(
+                    wd, text=wd.text if whole else wd.text[:1],
+                    confidence=wd.confidence if whole else 40,
+                    x=x0 - x, y=y0 - y, w=x1 - x0, h=y1 - y0,
+                ))
+        return words
+
+    monkeypatch.setattr(ocr, "_ocr_tile", fake_tile)
+    monkeypatch.setattr(ocr, "_probe_strategies", lambda *a: (["grayscale"], {}))
+    monkeypatch.setattr(get_settings().document, "ocr_workers", 3)
+
+    img = np.zeros((3000, 5000, 3), dtype=np.uint8)
+    result = ocr._run_ocr_tiled(img, Path("scan.png"), "eng", 30, True)
+    got = sorted((w.text, w.x, w.y, w.w, w.h) for w in result.words)
+    assert got == sorted((w.text, w.x, w.y, w.w, w.h) for w in truth)
+    assert result.image_size == (5000, 3000)
+    assert "STERILE" in result.full_text and result.full_text.endswith("\f")
+
+
+def test_ocr_result_indexes_match_linear_scan():
+    """Indexed find_text / words_in_region agree with a plain scan."""
+    import random
+
+    from label_compliance.document.ocr import OCRResult, OCRWord
+
+    rng = random.Random(7)
+    vocab = ["STERILE", "Lot", "lot:", "REF", "Do", "not", "reuse", "EO", "2024-01"]
+    words = [
+        OCRWord(rng.choice(vocab), 90, rng.randrange(0, 3000), rng.randrange(0, 2000),
+                rng.randrange(5, 300), rng.randrange(5, 60))
+        for _ in range(2000)
+    ]
+    result = OCRResult("dense.png", (3300, 2100), "STERILE Lot", words)
+
+    for search in ["lot", "STER", "o", "", "missing", "lot:\nref"]:
+        expected = [w for w in words if search.lower() in w.text.lower()]
+        assert result.find_text(search) == expected
+
+    regions = [
+        (0, 0, 3300, 2100), (100, 200, 700, 300), (1024, 512, 256, 256), (-50, -50, 400, 400),
+    ]
+    for x, y, w, h in regions:
+        expected = [
+            wd for wd in words
+            if wd.x >= x and wd.y >= y and wd.x + wd.w <= x + w and wd.y + wd.h <= y + h
+        ]
+        assert result.words_in_region(x, y, w, h) == expected
+
+    # Derived views follow reassignment
+    assert result.text_lower == "sterile lot"
+    result.full_text = "REF 123"
+    assert result.text_lower == "ref 123"
+    result.words = words[:1]
+    assert result.find_text(words[0].text) == words[:1]
@@ -55,3 +55,158 @@ def test_safe_filename():
     from label_compliance.utils.helpers import safe_filename
 
     assert safe_filename("Hello/World: Test!") == "Hello_World__Test"
+
+
+def test_semantic_engine_one_query_per_section(monkeypatch):
+    """All rules resolve from one batched query over the whole section text."""
+    from label_compliance.compliance.matcher import match_rule_semantic, match_rules_semantic
+    from label_compliance.document.ocr import OCRResult
+    from label_compliance.knowledge_base import embeddings
+    from label_compliance.knowledge_base.semantic import SemanticEngine
+
+    embedded = []
+    monkeypatch.setattr(
+        embeddings, "embed_texts",
+        lambda texts: embedded.append(list(texts)) or [[0.0]] * len(texts),
+    )
+
+    class FakeStore:
+        calls = 0
+
+        def query_embeddings(self, vectors, n_results=10, iso_filter=None):
+            FakeStore.calls += 1
+            # Chunk 0 hits section 5.1, the last chunk hits 5.2 and 5.1 again
+            hits = [[] for _ in vectors]
+            hits[0] = [{"metadata": {"section": "5.1"}, "similarity": 0.7}]
+            hits[-1] = [{"metadata": {"section": "5.2"}, "similarity": 0.45},
+                        {"metadata": {"section": "5.1"}, "similarity": 0.9}]
+            return hits
+
+    engine = SemanticEngine(store=FakeStore())
+    rules = [
+        {"id": "R1", "iso_ref": "ISO 15223-1 5.1"},
+        {"id": "R2", "iso_ref": "5.2"},
+        {"id": "R3", "iso_ref": "7.4"},
+    ]
+    text = "sterile " * 200  # several chunks
+    results = match_rules_semantic(rules, text, engine=engine)
+
+    assert FakeStore.calls == 1 and len(embedded) == 1 and len(embedded[0]) > 1
+    assert [r.status for r in results] == ["PASS", "PARTIAL", "FAIL"]
+    assert results[0].confidence == 0.9
+
+    # Same text again (e.g. the single-rule API) is served from the memo
+    ocr = OCRResult(image_path="", image_size=(0, 0), full_text=text, words=[])
+    assert match_rule_semantic(rules[1], ocr, engine=engine).confidence == 0.45
+    assert FakeStore.calls == 1
+
+
+@pytest.mark.parametrize("backend", ["chromadb", "numpy"])
+def test_incremental_index_embeds_only_changed(tmp_path, monkeypatch, backend):
+    """Re-indexing skips unchanged documents, drops stale ones, reuses cached vectors."""
+    from label_compliance.config import get_settings
+    from label_compliance.knowledge_base import embedding_cache, embeddings
+    from label_compliance.knowledge_base.store import KnowledgeStore
+
+    monkeypatch.setattr(get_settings().paths, "knowledge_base_dir", tmp_path)
+    monkeypatch.setattr(get_settings().kb, "vector_backend", backend)
+    cache = embedding_cache.EmbeddingCache(tmp_path / "embeddings.sqlite", max_mb=1)
+    monkeypatch.setattr(embedding_cache, "get_embedding_cache", lambda: cache)
+    encoded = []
+    monkeypatch.setattr(embeddings, "_encode", lambda texts: encoded.extend(texts) or [
+        [float(len(t)), 1.0, 0.5] for t in texts
+    ])
+
+    def write_kb(requirements):
+        kb_path = tmp_path / "ISO_TEST.json"
+        kb_path.write_text(json.dumps({
+            "iso_id": "ISO_TEST",
+            "requirements": [
+                {"section": s, "section_title": "Labels", "type": "shall", "text": t}
+                for s, t in requirements
+            ],
+            "sections": [],
+        }))
+        return kb_path
+
+    store = KnowledgeStore()
+    kb_path = write_kb([("5.1", "The label shall show LOT."), ("5.2", "The label shall show REF.")])
+    assert store.index_knowledge_base(kb_path) == 2
+    assert len(encoded) == 2
+
+    assert store.index_knowledge_base(kb_path) == 0  # nothing changed
+    assert len(encoded) == 2
+
+    kb_path = write_kb([("5.1", "The label shall show the LOT number.")])
+    assert store.index_knowledge_base(kb_path) == 1
+    assert store.count == 1 and len(encoded) == 3
+
+    # A full rebuild re-upserts everything but takes vectors from the cache
+    store.reset()
+    assert store.index_knowledge_base(kb_path) == 1
+    assert len(encoded) == 3 and cache.hits >= 1
+
+    # Another embedding model re-embeds every document
+    monkeypatch.setattr(get_settings().kb, "embedding_model", "other-model")
+    assert store.index_knowledge_base(kb_path) == 1
+    assert len(encoded) == 4
+    assert store.index_knowledge_base(kb_path) == 0
+
+
+def test_ingest_manifest_skips_unchanged_standard(tmp_path, monkeypatch):
+    """An unchanged standard PDF is loaded from its saved JSON, not re-parsed."""
+    import fitz
+
+    from label_compliance.config import get_settings
+    from label_compliance.knowledge_base import ingester
+
+    monkeypatch.setattr(get_settings().paths, "knowledge_base_dir", tmp_path)
+    pdf = tmp_path / "ISO 9999.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "5.1 Labelling requirements\nThe label shall be legible.")
+    doc.save(str(pdf))
+    doc.close()
+
+    parsed = []
+    real_extract = ingester._extract_text_from_pdf
+    monkeypatch.setattr(
+        ingester, "_extract_text_from_pdf", lambda p: parsed.append(p) or real_extract(p),
+    )
+
+    first = ingester.ingest_standard(pdf)
+    second = ingester.ingest_standard(pdf)
+    assert len(parsed) == 1 and second == first
+    assert ingester.load_manifest()[pdf.name]["iso_id"] == first["iso_id"]
+
+    ingester.ingest_standard(pdf, force=True)
+    assert len(parsed) == 2
+
+
+def test_numpy_backend_exact_topk_with_filter(tmp_path):
+    """The mmap float16 index returns the exact cosine top-k, filtered by iso_id."""
+    import numpy as np
+
+    from label_compliance.knowledge_base.backends import NumpyBackend
+
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(300, 16)).astype(np.float32)
+    ids = [f"doc{i}" for i in range(300)]
+    metas = [{"iso_id": "A" if i % 3 else "B", "section": str(i)} for i in range(300)]
+
+    backend = NumpyBackend(tmp_path / "vectors")
+    backend.upsert(ids, ids, metas, vectors.tolist())
+    backend.delete(["doc0", "doc1"])
+    assert backend.count() == 298
+
+    reopened = NumpyBackend(tmp_path / "vectors")  # read-only map of the saved files
+    assert isinstance(reopened._matrix, np.memmap)
+    queries = rng.normal(size=(4, 16)).astype(np.float32)
+    hits = reopened.query(queries.tolist(), n_results=5, iso_filter="B")
+
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    for q, found in zip(queries, hits):
+        sims = unit @ (q / np.linalg.norm(q))
+        expected = [f"doc{i}" for i in np.argsort(-sims) if i % 3 == 0 and i > 1][:5]
+        assert [h["id"] for h in found] == expected
+        assert all(h["metadata"]["iso_id"] == "B" for h in found)
+        assert abs(found[0]["distance"] - (1 - sims[int(found[0]["id"][3:])])) < 1e-2
@@ -500,3 +500,45 @@ def test_specs_result_status():
         rule_id="X", spec_field="test2", requirement="c", actual="d", severity="critical"
     ))
     assert r.status == "FAIL"  # has critical → FAIL
+
+
+# ── SpecContext ──────────────────────────────────────
+
+
+def test_spec_context_matches_plain_validation():
+    """A shared per-section context gives the same results as fresh calls."""
+    from label_compliance.compliance.specs_validator import SpecContext
+    from label_compliance.document.span_index import SpanIndex
+
+    words = [
+        OCRWord(text="Rx", confidence=90, x=100, y=100, w=40, h=30),
+        OCRWord(text="only", confidence=90, x=150, y=100, w=60, h=30),
+        OCRWord(text="STERILE", confidence=90, x=2000, y=2800, w=200, h=40),
+        OCRWord(text="EO", confidence=90, x=2220, y=2800, w=40, h=40),
+        OCRWord(text="CE", confidence=90, x=1200, y=1500, w=40, h=40),
+        OCRWord(text="0086", confidence=90, x=1250, y=1500, w=80, h=40),
+    ]
+    ocr = _make_ocr("Rx only STERILE EO CE 0086 en: de: fr: Class IIb", words)
+    fonts = [_make_font("Rx only", 9.0, bold=True), _make_font("STERILE EO", 5.0)]
+    rules = [
+        {"id": "A", "markers": ["rx"], "specs": {
+            "min_font_size_pt": 6, "font_style": "bold", "position": "top-left",
+            "must_be_adjacent_to": "only", "min_height_mm": 2.0}},
+        {"id": "B", "markers": ["sterile"], "specs": {
+            "min_font_size_pt": 6, "position": "top", "must_be_adjacent_to": "CE",
+            "valid_methods": ["Ethylene oxide"]}},
+        {"id": "C", "markers": ["ce"], "specs": {
+            "must_include_nb_number": True, "min_languages": 3,
+            "valid_classifications": ["IIb", "III"], "table_ref": "Table 1"}},
+    ]
+    kwargs = dict(ocr_result=ocr, fonts=fonts, page_number=1, dpi=300, image_size=(2400, 3000))
+    ctx = SpecContext(**kwargs, font_index=SpanIndex.from_fonts(fonts))
+
+    for rule in rules * 2:  # second round runs on warm memos
+        plain = validate_rule_specs(rule, **kwargs)
+        shared = validate_rule_specs(rule, context=ctx)
+        assert shared.details == plain.details
+        assert [(v.spec_field, v.actual, v.location) for v in shared.violations] == [
+            (v.spec_field, v.actual, v.location) for v in plain.violations
+        ]
+    assert [f.text for f in ctx.font_spans(["rx", "sterile", "rx"])] == ["Rx only", "STERILE EO"]